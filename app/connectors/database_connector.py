@@ -5,13 +5,18 @@ import traceback
 
 from fastapi import Request
 import sqlalchemy as sa
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import (
-    sessionmaker, 
-    Session
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    create_async_engine
 )
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import Session
 
+from app.connectors.tenant_registry import tenant_registry
+from app.connectors.tenant_router import TenantConnectionRouter
 from app.utils.constants import ( 
+    DEFAULT_DB_POOL_SIZE,
+    DEFAULT_SYNC_DB_POOL_SIZE,
     MASTER_SCHEMA
 )
 
@@ -22,6 +27,9 @@ SQL_PASSWORD = os.getenv("POSTGRES_PASSWORD")
 SQL_HOST = os.getenv("POSTGRES_HOST")
 SQL_DB = os.getenv("POSTGRES_DB")
 SQLALCHEMY_DATABASE_URL = f"postgresql://{SQL_USER}:{SQL_PASSWORD}@{SQL_HOST}/{SQL_DB}"
+ASYNC_SQLALCHEMY_DATABASE_URL = f"postgresql+asyncpg://{SQL_USER}:{SQL_PASSWORD}@{SQL_HOST}/{SQL_DB}"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", DEFAULT_DB_POOL_SIZE))
+SYNC_DB_POOL_SIZE = int(os.getenv("SYNC_DB_POOL_SIZE", DEFAULT_SYNC_DB_POOL_SIZE))
 
 db_connections: dict[str, dict[str, Session | datetime]] = {}
 
@@ -31,9 +39,20 @@ engine = sa.create_engine(
     echo=False,
     pool_pre_ping=True,
     pool_recycle=280,
-    pool_size=200,
+    pool_size=SYNC_DB_POOL_SIZE,
     max_overflow=0,
 )
+# Create an asyncio engine for request handlers, so queries don't block the event loop
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    echo=False,
+    pool_pre_ping=True,
+    pool_recycle=280,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=0,
+)
+# Route every session to its tenant schema through cached, pre-configured connectables
+tenant_router = TenantConnectionRouter(engine, async_engine)
 # Create a base class for declarative models
 Base = declarative_base(metadata=sa.MetaData())
 
@@ -49,38 +68,98 @@ def get_master_database():
 
 
 def build_db_session(schema: str) -> Session:
-    if schema:
-        schema_translate_map = dict(tenant=schema)
-    else:
+    if not schema:
         raise TenantNotFoundError("Tenant %s not found!" % schema)
-    
-    connectable = engine.execution_options(schema_translate_map=schema_translate_map)
-    connectable.dialect.default_schema_name = schema
-    db = sessionmaker(bind=connectable, expire_on_commit=False)()
-    db.execute(sa.text('set search_path to "%s"' % schema))
 
-    return db
+    return tenant_router.session(schema)
 
 
-def get_connected_schema(db: Session) -> str:
-    return db.connection().dialect.default_schema_name or ""
+async def build_async_db_session(schema: str) -> AsyncSession:
+    if not schema:
+        raise TenantNotFoundError("Tenant %s not found!" % schema)
 
+    return tenant_router.async_session(schema)
 
-def get_tenant_db(request: Request):
-    branch_id = request.state.user.branch_id
+
+def get_connected_schema(db: Session | AsyncSession) -> str:
+    return db.info.get("schema") or ""
+
+
+def get_tenant_schemas() -> list[str]:
+    """
+        List the schema of every tenant, for background jobs that visit them all.
+    """
+    master_db = get_master_database()
+
+    try:
+        return [schema for schema in master_db.execute(sa.text("SELECT schema FROM branches")).scalars() if schema]
+    finally:
+        master_db.close()
+
+
+def warm_tenant_registry():
     master_db = get_master_database()
 
-    result = master_db.execute(
-        sa.text("SELECT schema FROM branches WHERE id='" + str(branch_id) + "';")
-    ).fetchall()
+    try:
+        branches = master_db.execute(sa.text("SELECT id, schema FROM branches")).fetchall()
+        tenant_registry.warm((branch_id, schema) for branch_id, schema in branches if schema)
+    except:
+        traceback.print_exc()
+    finally:
+        master_db.close()
+
+
+def resolve_tenant_schema(branch_id: int) -> str:
+    schema = tenant_registry.get(branch_id)
+
+    if schema:
+        return schema
+
+    master_db = get_master_database()
+
+    try:
+        schema = master_db.execute(
+            sa.text("SELECT schema FROM branches WHERE id = :branch_id"),
+            {"branch_id": branch_id}
+        ).scalar()
+    finally:
+        master_db.close()
+
+    if not schema:
+        raise TenantNotFoundError(branch_id)
+
+    tenant_registry.put(branch_id, schema)
+    return schema
+
 
-    master_db.close()
+async def resolve_tenant_schema_async(branch_id: int) -> str:
+    schema = tenant_registry.get(branch_id)
 
-    if not result or not result[0] or not result[0][0]:
+    if schema:
+        return schema
+
+    master_db = await build_async_db_session(MASTER_SCHEMA)
+
+    try:
+        schema = await master_db.scalar(
+            sa.text("SELECT schema FROM branches WHERE id = :branch_id"),
+            {"branch_id": branch_id}
+        )
+    finally:
+        await master_db.close()
+
+    if not schema:
         raise TenantNotFoundError(branch_id)
-    
+
+    tenant_registry.put(branch_id, schema)
+    return schema
+
+
+def get_tenant_db(request: Request):
+    schema = resolve_tenant_schema(request.state.user.branch_id)
+
     print("transaction starting, opening db. ", datetime.now())
-    db = build_db_session(result[0][0])
+    db = build_db_session(schema)
 
     try:
         yield db
@@ -112,3 +191,43 @@ def get_master_db():
             db.close()
 
         print("transaction completed, closing master db. ", datetime.now())
+
+
+async def get_tenant_schema(request: Request) -> str:
+    """
+        Resolve the schema of the caller's tenant without opening a session, for work that
+        manages its own sessions, such as responses streamed after the request handler returns.
+    """
+    return await resolve_tenant_schema_async(request.state.user.branch_id)
+
+
+async def get_async_tenant_db(request: Request):
+    schema = await resolve_tenant_schema_async(request.state.user.branch_id)
+
+    db = await build_async_db_session(schema)
+
+    try:
+        yield db
+    finally:
+        try:
+            await db.commit()
+        except:
+            traceback.print_exc()
+            await db.rollback()
+        finally:
+            await db.close()
+
+
+async def get_async_master_db():
+    db = await build_async_db_session(MASTER_SCHEMA)
+
+    try:
+        yield db
+    finally:
+        try:
+            await db.commit()
+        except:
+            traceback.print_exc()
+            await db.rollback()
+        finally:
+            await db.close()
@@ -0,0 +1,76 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable
+
+
+class TenantRegistry:
+    """
+        In-process TTL/LRU map of branch_id -> tenant schema.
+
+        Keeps the master database off the hot path of every tenant request.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict[int, tuple[str, float]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, branch_id: int) -> str | None:
+        """
+            Return the cached schema for a branch, or None when it is missing or expired.
+        """
+        with self.__lock:
+            entry = self.__entries.get(branch_id)
+
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self.__entries[branch_id]
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(branch_id)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, branch_id: int, schema: str):
+        """
+            Cache the schema of a branch, evicting the least recently used entry when full.
+        """
+        with self.__lock:
+            self.__entries[branch_id] = (schema, time.monotonic() + self.ttl_seconds)
+            self.__entries.move_to_end(branch_id)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def warm(self, branches: Iterable[tuple[int, str]]):
+        """
+            Preload (branch_id, schema) pairs, typically at application startup.
+        """
+        for branch_id, schema in branches:
+            self.put(branch_id, schema)
+
+    def invalidate(self, branch_id: int | None = None):
+        """
+            Drop a single branch from the cache, or every branch when no ID is given.
+        """
+        with self.__lock:
+            if branch_id is None:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(branch_id, None)
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+tenant_registry = TenantRegistry()
@@ -0,0 +1,73 @@
+import threading
+
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker
+)
+from sqlalchemy.orm import (
+    Session,
+    sessionmaker
+)
+
+
+class TenantConnectionRouter:
+    """
+        Caches one configured sessionmaker per schema for the sync and async engines.
+
+        Tenant tables are unqualified, so the schema is applied by a schema_translate_map
+        on the cached connectable (None -> schema) instead of a `set search_path` round trip,
+        and the shared dialect is never mutated.
+    """
+
+    def __init__(self, engine: Engine, async_engine: AsyncEngine):
+        self.engine = engine
+        self.async_engine = async_engine
+        self.__session_factories: dict[str, sessionmaker] = {}
+        self.__async_session_factories: dict[str, async_sessionmaker] = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def schema_translate_map(schema: str) -> dict:
+        return {None: schema, "tenant": schema}
+
+    def __get_factory(self, factories: dict, schema: str, build):
+        factory = factories.get(schema)
+
+        if factory is None:
+            with self.__lock:
+                factory = factories.get(schema)
+
+                if factory is None:
+                    factory = factories[schema] = build()
+
+        return factory
+
+    def session(self, schema: str) -> Session:
+        factory = self.__get_factory(
+            self.__session_factories,
+            schema,
+            lambda: sessionmaker(
+                bind=self.engine.execution_options(
+                    schema_translate_map=self.schema_translate_map(schema)
+                ),
+                expire_on_commit=False,
+                info={"schema": schema},
+            )
+        )
+        return factory()
+
+    def async_session(self, schema: str) -> AsyncSession:
+        factory = self.__get_factory(
+            self.__async_session_factories,
+            schema,
+            lambda: async_sessionmaker(
+                bind=self.async_engine.execution_options(
+                    schema_translate_map=self.schema_translate_map(schema)
+                ),
+                expire_on_commit=False,
+                info={"schema": schema},
+            )
+        )
+        return factory()
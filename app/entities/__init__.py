@@ -2,9 +2,15 @@ from app.connectors.database_connector import Base
 from .user import User
 from .branch import Branch
 from .route import Route
+from .route_stop import RouteStop
 from .company import Company
 from .bus import Bus
 from .schedule import Schedule
+from .schedule_template import ScheduleTemplate
 from .ticket import Ticket
+from .seat_inventory import SeatInventory
+from .idempotency_key import IdempotencyKey
+from .seat_hold import SeatHold
+from .refresh_token import RefreshToken
 
 # import your application specific entities here for creating migration scripts automatically (alembic)
\ No newline at end of file
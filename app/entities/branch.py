@@ -16,4 +16,8 @@ class Branch(Base):
     logo_path: str = sa.Column(sa.String(500), nullable=True) 
     created_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
     updated_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now(), onupdate=sa.func.now()) 
-    is_active: bool = sa.Column(sa.Boolean, nullable=False, default=True) 
\ No newline at end of file
+    is_active: bool = sa.Column(sa.Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        sa.Index("ix_branches_created_at_id", "created_at", "id"),
+    )
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 import sqlalchemy as sa
+from sqlalchemy.orm import relationship
 
 from app.connectors.database_connector import Base
 
@@ -15,4 +16,11 @@ class Bus(Base):
     company_id: int = sa.Column(sa.Integer, sa.ForeignKey("companies.id"), nullable=False) 
     created_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now()) 
     updated_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
-    is_active: bool = sa.Column(sa.Boolean, nullable=False, default=True) 
\ No newline at end of file
+    is_active: bool = sa.Column(sa.Boolean, nullable=False, default=True)
+
+    # lazy="raise": async sessions can't lazy load, so every read states how it loads related rows
+    company = relationship("Company", lazy="raise")
+
+    __table_args__ = (
+        sa.Index("ix_buses_created_at_id", "created_at", "id"),
+    )
@@ -17,4 +17,8 @@ class Company(Base):
     phone_number: str = sa.Column(sa.String(50), nullable=False)
     created_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
     updated_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now()) 
-    is_active: bool = sa.Column(sa.Boolean, nullable=False, default=True) 
\ No newline at end of file
+    is_active: bool = sa.Column(sa.Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        sa.Index("ix_companies_created_at_id", "created_at", "id"),
+    )
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSON
+
+from app.connectors.database_connector import Base
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+
+    id: int = sa.Column(sa.Integer, primary_key=True, nullable=False)
+    key: str = sa.Column(sa.String(255), nullable=False)
+    # Keys are scoped to the caller, so two users can't replay each other's responses
+    owner: str = sa.Column(sa.String(255), nullable=False)
+    request_hash: str = sa.Column(sa.String(64), nullable=False)
+    # Unset while the first request is still in flight
+    status_code: int = sa.Column(sa.Integer, nullable=True)
+    response: dict = sa.Column(JSON, nullable=True)
+    created_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
+    expires_at: datetime = sa.Column(sa.DateTime, nullable=False)
+
+    __table_args__ = (
+        sa.UniqueConstraint("owner", "key", name="uq_idempotency_keys_owner_key"),
+        sa.Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
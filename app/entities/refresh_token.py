@@ -0,0 +1,25 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+
+from app.connectors.database_connector import Base
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    id: int = sa.Column(sa.Integer, primary_key=True, nullable=False)
+    # SHA-256 of the token, so a leaked table can't be replayed
+    token_hash: str = sa.Column(sa.String(64), nullable=False, unique=True)
+    # Every token rotated out of one login shares its family and expiry
+    family_id: str = sa.Column(sa.String(36), nullable=False, index=True)
+    user_id: int = sa.Column(sa.Integer, sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    created_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
+    expires_at: datetime = sa.Column(sa.DateTime, nullable=False)
+    # Set once the token has been exchanged for a new pair; presenting it again revokes the family
+    used_at: datetime = sa.Column(sa.DateTime, nullable=True)
+    revoked_at: datetime = sa.Column(sa.DateTime, nullable=True)
+
+    __table_args__ = (
+        sa.Index("ix_refresh_tokens_expires_at", "expires_at"),
+    )
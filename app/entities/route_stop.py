@@ -0,0 +1,17 @@
+import sqlalchemy as sa
+
+from app.connectors.database_connector import Base
+
+
+class RouteStop(Base):
+    __tablename__ = "route_stops"
+
+    route_id: int = sa.Column(sa.Integer, sa.ForeignKey("routes.id", ondelete="CASCADE"), primary_key=True, nullable=False)
+    seq: int = sa.Column(sa.Integer, primary_key=True, nullable=False)
+    city: str = sa.Column(sa.String(50), nullable=False)
+    offset_minutes: int = sa.Column(sa.Integer, nullable=True)
+
+    __table_args__ = (
+        # Stop membership and order lookups: which routes visit a city, and at which position
+        sa.Index("ix_route_stops_city_route_seq", sa.func.lower(city), "route_id", "seq"),
+    )
@@ -1,6 +1,11 @@
-from datetime import datetime
+from datetime import (
+    date,
+    datetime
+)
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.orm import relationship
 
 from app.connectors.database_connector import Base
 
@@ -13,5 +18,25 @@ class Schedule(Base):
     route_id: int = sa.Column(sa.Integer, sa.ForeignKey("routes.id"), nullable=False)
     departure_time: datetime = sa.Column(sa.DateTime, nullable=False)
     arrival_time: datetime = sa.Column(sa.DateTime, nullable=False)
+    # Set on departures materialized from a recurring template
+    template_id: int = sa.Column(sa.Integer, sa.ForeignKey("schedule_templates.id", ondelete="SET NULL"), nullable=True)
+    service_date: date = sa.Column(sa.Date, nullable=True)
     created_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now()) 
-    updated_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now()) 
\ No newline at end of file
+    updated_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
+
+    bus = relationship("Bus", lazy="raise")
+    route = relationship("Route", lazy="raise")
+
+    __table_args__ = (
+        sa.Index("ix_schedules_created_at_id", "created_at", "id"),
+        sa.UniqueConstraint("template_id", "service_date", name="uq_schedules_template_service_date"),
+        sa.CheckConstraint("arrival_time > departure_time", name="ck_schedules_arrival_after_departure"),
+        # A bus can't run two trips at once; the gist index behind it makes overlap lookups O(log n).
+        # A singleton range stands in for bus_id equality, so core gist covers it without btree_gist.
+        ExcludeConstraint(
+            (sa.text("int4range(bus_id, bus_id, '[]')"), "&&"),
+            (sa.text("tsrange(departure_time, arrival_time)"), "&&"),
+            name="ex_schedules_bus_trip_overlap",
+            using="gist"
+        ),
+    )
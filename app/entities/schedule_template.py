@@ -0,0 +1,34 @@
+from datetime import (
+    date,
+    datetime,
+    time
+)
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSON
+
+from app.connectors.database_connector import Base
+
+
+class ScheduleTemplate(Base):
+    __tablename__ = "schedule_templates"
+
+    id: int = sa.Column(sa.Integer, primary_key=True, nullable=False)
+    bus_id: int = sa.Column(sa.Integer, sa.ForeignKey("buses.id"), nullable=False)
+    route_id: int = sa.Column(sa.Integer, sa.ForeignKey("routes.id"), nullable=False)
+    departure_time: time = sa.Column(sa.Time, nullable=False)
+    duration_minutes: int = sa.Column(sa.Integer, nullable=False)
+    recurrence: str = sa.Column(sa.String(20), nullable=False)
+    # Bit N set when the template runs on weekday N (Monday = 0), used by weekly templates
+    weekdays: int = sa.Column(sa.SmallInteger, nullable=False, default=0)
+    valid_from: date = sa.Column(sa.Date, nullable=False)
+    valid_until: date = sa.Column(sa.Date, nullable=True)
+    # ISO dates on which the template doesn't run
+    excluded_dates: list = sa.Column(JSON, nullable=False, default=list)
+    is_active: bool = sa.Column(sa.Boolean, nullable=False, default=True)
+    created_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
+    updated_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
+
+    __table_args__ = (
+        sa.Index("ix_schedule_templates_created_at_id", "created_at", "id"),
+    )
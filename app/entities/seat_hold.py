@@ -0,0 +1,25 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+
+from app.connectors.database_connector import Base
+
+
+class SeatHold(Base):
+    __tablename__ = "seat_holds"
+
+    id: int = sa.Column(sa.Integer, primary_key=True, nullable=False)
+    # Token handed to the client, shared by the seats held together
+    hold_id: str = sa.Column(sa.String(36), nullable=False)
+    schedule_id: int = sa.Column(sa.Integer, sa.ForeignKey("schedules.id", ondelete="CASCADE"), nullable=False)
+    seat_number: int = sa.Column(sa.Integer, nullable=False)
+    # Legs of the route claimed for the hold in seat_inventories, see app.utils.seat_bitmap
+    journey_mask: int = sa.Column(sa.BigInteger, nullable=False)
+    owner: str = sa.Column(sa.String(255), nullable=False)
+    created_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
+    expires_at: datetime = sa.Column(sa.DateTime, nullable=False)
+
+    __table_args__ = (
+        sa.UniqueConstraint("hold_id", "seat_number", name="uq_seat_holds_hold_seat"),
+        sa.Index("ix_seat_holds_expires_at", "expires_at"),
+    )
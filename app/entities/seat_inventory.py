@@ -0,0 +1,17 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from app.connectors.database_connector import Base
+
+
+class SeatInventory(Base):
+    __tablename__ = "seat_inventories"
+
+    schedule_id: int = sa.Column(sa.Integer, sa.ForeignKey("schedules.id", ondelete="CASCADE"), primary_key=True, nullable=False)
+    total_seats: int = sa.Column(sa.Integer, nullable=False)
+    # One bigint per seat (index = seat number), bit N-1 set when leg N of the route is sold
+    segment_masks: list[int] = sa.Column(ARRAY(sa.BigInteger), nullable=False)
+    booked_count: int = sa.Column(sa.Integer, nullable=False, default=0)
+    updated_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
@@ -1,20 +1,46 @@
 from datetime import datetime
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.orm import relationship
 
 from app.connectors.database_connector import Base
 
 
+# Per-tenant sequence behind ticket numbers; unqualified, so it resolves to the session's schema
+TICKET_NUMBER_SEQUENCE = sa.Sequence("ticket_number_seq", metadata=Base.metadata)
+
+
 class Ticket(Base):
     __tablename__ = "tickets"
 
     id: int = sa.Column(sa.Integer, primary_key=True, nullable=False) 
     ticket_number: str = sa.Column(sa.String(50), nullable=False, unique=True)
     bus_id: int = sa.Column(sa.Integer, sa.ForeignKey("buses.id"), nullable=False)
+    schedule_id: int = sa.Column(sa.Integer, sa.ForeignKey("schedules.id"), nullable=True)
     seat_number: int = sa.Column(sa.Integer, nullable=False) 
+    boarding_seq: int = sa.Column(sa.Integer, nullable=True)
+    alighting_seq: int = sa.Column(sa.Integer, nullable=True)
     passenger_name: str = sa.Column(sa.String(50), nullable=False)
     passenger_contact: str = sa.Column(sa.String(20), nullable=False)
     passenger_email: str = sa.Column(sa.String(50), nullable=False)
     status: str = sa.Column(sa.String(50), nullable=False) 
     created_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now()) 
-    updated_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now()) 
\ No newline at end of file
+    updated_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
+
+    bus = relationship("Bus", lazy="raise")
+    schedule = relationship("Schedule", lazy="raise")
+
+    __table_args__ = (
+        sa.Index("ix_tickets_created_at_id", "created_at", "id"),
+        # A seat can only be booked once per leg of a departure, cancelled tickets release it.
+        # Singleton ranges stand in for equality, so core gist covers it without btree_gist.
+        ExcludeConstraint(
+            (sa.text("int4range(schedule_id, schedule_id, '[]')"), "&&"),
+            (sa.text("int4range(seat_number, seat_number, '[]')"), "&&"),
+            (sa.text("int4range(boarding_seq, alighting_seq)"), "&&"),
+            name="ex_tickets_schedule_seat_segment",
+            using="gist",
+            where=sa.text("status = 'Booked' AND schedule_id IS NOT NULL")
+        ),
+    )
@@ -4,7 +4,10 @@ import sqlalchemy as sa
 
 from app.connectors.database_connector import Base
 from app.utils.enums import Roles
-from app.utils.hasher import Hasher
+from app.utils.hasher import (
+    Hasher,
+    password_verifier
+)
 
 
 class User(Base):
@@ -20,6 +23,10 @@ class User(Base):
     created_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
     updated_at: datetime = sa.Column(sa.DateTime, nullable=False, default=sa.func.now())
     is_active: bool = sa.Column(sa.Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        sa.Index("ix_users_created_at_id", "created_at", "id"),
+    )
     
     @property
     def password(self):
@@ -30,4 +37,10 @@ class User(Base):
         self.__password = Hasher.get_password_hash(password)
     
     def verify_password(self, password:str):
-        return Hasher.verify_password(password,self.__password)
\ No newline at end of file
+        return Hasher.verify_password(password,self.__password)
+
+    async def verify_password_async(self, password: str) -> bool:
+        """
+            Verify the password on the bounded password verifier pool, off the event loop.
+        """
+        return await password_verifier.verify(password, self.__password)
\ No newline at end of file
@@ -16,4 +16,15 @@ class LoginResponse(BaseModel):
     email: EmailStr
     role: str
     contact: str
-    jwt_token: str
\ No newline at end of file
+    jwt_token: str
+    refresh_token: str
+    # Seconds until the jwt_token expires and has to be refreshed
+    expires_in: int
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
+
+
+class LogoutResponse(BaseModel):
+    message: str
@@ -1,6 +1,7 @@
 from typing import Any
 from pydantic import BaseModel
 from typing import (
+    Optional,
     TypeVar, 
     Generic
 )
@@ -11,3 +12,9 @@ T = TypeVar("T")
 class ApiResponse(BaseModel, Generic[T]):
     status_message: str = "SUCCESS"
     data: T
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T]
+    page_size: int
+    next_cursor: Optional[str] = None
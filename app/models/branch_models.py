@@ -21,4 +21,8 @@ class GetBranchResponse(BaseModel):
     logo_path: Optional[str] = None
     created_at: datetime
     updated_at: datetime
-    is_active: bool
\ No newline at end of file
+    is_active: bool
+
+
+class BranchFilter(BaseModel):
+    is_active: Optional[bool] = None
@@ -1,11 +1,24 @@
-from datetime import datetime
+from datetime import (
+    date,
+    datetime,
+    time
+)
+from typing import (
+    Annotated,
+    Optional
+)
 from pydantic import (
     BaseModel, 
+    Field,
     PositiveInt
 )
 
 from app.models.company_models import GetCompanyResponse
-from app.utils.enums import BusTypeEnum
+from app.utils.constants import MAX_BULK_SCHEDULES
+from app.utils.enums import (
+    BusTypeEnum,
+    RecurrenceEnum
+)
 
 
 class BusRequest(BaseModel):
@@ -45,6 +58,10 @@ class BusScheduleRequest(BaseModel):
     arrival_time: datetime    
 
 
+class BulkBusScheduleRequest(BaseModel):
+    schedules: list[BusScheduleRequest] = Field(min_length=1, max_length=MAX_BULK_SCHEDULES)
+
+
 class GetBusScheduleResponse(BaseModel):
     id: int
     bus_id: int 
@@ -54,4 +71,94 @@ class GetBusScheduleResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     bus_data: GetBusResponse
-    route_data: GetRouteResponse
\ No newline at end of file
+    route_data: GetRouteResponse
+
+
+class BusFilter(BaseModel):
+    company_id: Optional[PositiveInt] = None
+    bus_type: Optional[BusTypeEnum] = None
+    is_active: Optional[bool] = None
+
+
+class BusScheduleFilter(BaseModel):
+    bus_id: Optional[PositiveInt] = None
+    route_id: Optional[PositiveInt] = None
+    departure_from: Optional[datetime] = None
+    departure_to: Optional[datetime] = None
+
+
+class TripSearchResponse(BaseModel):
+    schedule_id: int
+    route_id: int
+    bus_id: int
+    bus_number: str
+    bus_type: str
+    company_name: str
+    from_stop: str
+    to_stop: str
+    departure_time: datetime
+    arrival_time: datetime
+    total_seats: int
+    available_seats: int
+
+
+class JourneyLegResponse(BaseModel):
+    schedule_id: int
+    route_id: int
+    from_stop: str
+    to_stop: str
+    departure_time: datetime
+    arrival_time: datetime
+
+
+class JourneyResponse(BaseModel):
+    transfers: int
+    departure_time: datetime
+    arrival_time: datetime
+    legs: list[JourneyLegResponse]
+
+
+class ScheduleTemplateRequest(BaseModel):
+    bus_id: PositiveInt
+    route_id: PositiveInt
+    departure_time: time
+    duration_minutes: PositiveInt
+    recurrence: RecurrenceEnum
+    # 0 = Monday, only used by weekly templates
+    weekdays: list[Annotated[int, Field(ge=0, le=6)]] = []
+    valid_from: date
+    valid_until: Optional[date] = None
+    excluded_dates: list[date] = []
+
+
+class GetScheduleTemplateResponse(BaseModel):
+    id: int
+    bus_id: int
+    route_id: int
+    departure_time: time
+    duration_minutes: int
+    recurrence: str
+    weekdays: list[int]
+    valid_from: date
+    valid_until: Optional[date]
+    excluded_dates: list[date]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class TimetableFilter(BaseModel):
+    start_date: date
+    end_date: date
+    bus_id: Optional[PositiveInt] = None
+    route_id: Optional[PositiveInt] = None
+
+
+class TimetableEntryResponse(BaseModel):
+    schedule_id: Optional[int] = None
+    template_id: Optional[int] = None
+    service_date: date
+    bus_id: int
+    route_id: int
+    departure_time: datetime
+    arrival_time: datetime
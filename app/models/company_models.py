@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from pydantic import (
     BaseModel, 
     EmailStr
@@ -26,4 +27,9 @@ class GetCompanyResponse(BaseModel):
     phone_number: str 
     created_at: datetime
     updated_at: datetime
-    is_active: bool
\ No newline at end of file
+    is_active: bool
+
+
+class CompanyFilter(BaseModel):
+    name: Optional[str] = None
+    is_active: Optional[bool] = None
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+
+class PasswordVerifierMetrics(BaseModel):
+    max_workers: int
+    max_queue: int
+    running: int
+    queued: int
+    peak_in_flight: int
+    completed: int
+    rejected: int
+    mean_wait_ms: float
+    mean_verify_ms: float
+
+
+class TokenCacheMetrics(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    hit_rate: float
+    revoked_tokens: int
+
+
+class RuntimeMetricsResponse(BaseModel):
+    password_verifier: PasswordVerifierMetrics
+    token_cache: TokenCacheMetrics
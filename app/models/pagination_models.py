@@ -0,0 +1,23 @@
+from typing import Optional
+
+from pydantic import (
+    BaseModel,
+    field_validator
+)
+
+from app.utils.constants import (
+    DEFAULT_PAGE_SIZE,
+    INVALID_PAGE_SIZE,
+    MAX_PAGE_SIZE
+)
+
+
+class PageParams(BaseModel):
+    cursor: Optional[str] = None
+    page_size: int = DEFAULT_PAGE_SIZE
+
+    @field_validator("page_size")
+    def validate_page_size(cls, page_size: int):
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(INVALID_PAGE_SIZE)
+        return page_size
@@ -1,20 +1,112 @@
-from datetime import datetime
+from datetime import (
+    date,
+    datetime
+)
+from typing import Optional
 from pydantic import (
     BaseModel, 
-    EmailStr
+    EmailStr,
+    Field,
+    PositiveInt,
+    field_validator,
+    model_validator
 )
 
 from app.models.bus_models import GetBusResponse
 from app.models.company_models import GetCompanyResponse
+from app.utils.constants import (
+    DUPLICATE_SEAT_NUMBERS,
+    MAX_SEAT_HOLD_MINUTES,
+    MAX_SEATS_PER_HOLD,
+    MAX_TICKETS_PER_BATCH,
+    SCHEDULE_OR_TEMPLATE_REQUIRED,
+    SEAT_NUMBERS_REQUIRED_WITH_HOLD,
+    SEAT_HOLD_TTL_MINUTES
+)
+from app.utils.enums import TicketStatusEnum
 
 
-class TicketRequest(BaseModel):
-    bus_id: int 
-    seat_number: int 
+class DepartureRequest(BaseModel):
+    schedule_id: Optional[PositiveInt] = None
+    # A departure of a recurring template that may not be stored as a schedule yet
+    template_id: Optional[PositiveInt] = None
+    service_date: Optional[date] = None
+
+    @model_validator(mode="after")
+    def validate_departure(self):
+        if not self.schedule_id and not (self.template_id and self.service_date):
+            raise ValueError(SCHEDULE_OR_TEMPLATE_REQUIRED)
+        return self
+
+
+class TicketRequest(DepartureRequest):
+    seat_number: PositiveInt 
+    boarding_stop: Optional[str] = None
+    alighting_stop: Optional[str] = None
     passenger_name: str
     passenger_contact: str 
     passenger_email: EmailStr 
-    status: str 
+    status: TicketStatusEnum = TicketStatusEnum.BOOKED
+    # Books a seat held with POST /tickets/holds instead of claiming it again
+    hold_id: Optional[str] = None
+
+
+class PassengerRequest(BaseModel):
+    # Left out to have the best free seat allocated
+    seat_number: Optional[PositiveInt] = None
+    passenger_name: str
+    passenger_contact: str
+    passenger_email: EmailStr
+
+
+class BatchTicketRequest(DepartureRequest):
+    boarding_stop: Optional[str] = None
+    alighting_stop: Optional[str] = None
+    status: TicketStatusEnum = TicketStatusEnum.BOOKED
+    hold_id: Optional[str] = None
+    # Everyone in a group travels the same journey
+    passengers: list[PassengerRequest] = Field(min_length=1, max_length=MAX_TICKETS_PER_BATCH)
+
+    @field_validator("passengers")
+    def validate_passengers(cls, passengers: list[PassengerRequest]) -> list[PassengerRequest]:
+        seat_numbers = [passenger.seat_number for passenger in passengers if passenger.seat_number]
+
+        if len(set(seat_numbers)) != len(seat_numbers):
+            raise ValueError(DUPLICATE_SEAT_NUMBERS)
+        return passengers
+
+    @model_validator(mode="after")
+    def validate_hold_seats(self):
+        if self.hold_id and not all(passenger.seat_number for passenger in self.passengers):
+            raise ValueError(SEAT_NUMBERS_REQUIRED_WITH_HOLD)
+        return self
+
+
+class BatchTicketResponse(BaseModel):
+    message: str
+    ticket_numbers: list[str]
+    seat_numbers: list[int]
+
+
+class SeatHoldRequest(DepartureRequest):
+    seat_numbers: list[PositiveInt] = Field(min_length=1, max_length=MAX_SEATS_PER_HOLD)
+    boarding_stop: Optional[str] = None
+    alighting_stop: Optional[str] = None
+    hold_minutes: PositiveInt = Field(SEAT_HOLD_TTL_MINUTES, le=MAX_SEAT_HOLD_MINUTES)
+
+    @field_validator("seat_numbers")
+    def validate_seat_numbers(cls, seat_numbers: list[int]) -> list[int]:
+        if len(set(seat_numbers)) != len(seat_numbers):
+            raise ValueError(DUPLICATE_SEAT_NUMBERS)
+        return seat_numbers
+
+
+class SeatHoldResponse(BaseModel):
+    message: str
+    hold_id: str
+    schedule_id: int
+    seat_numbers: list[int]
+    expires_at: datetime
 
 
 class TicketResponse(BaseModel):
@@ -23,11 +115,37 @@ class TicketResponse(BaseModel):
 
 class GetTicketResponse(BaseModel):
     id: int 
+    schedule_id: Optional[int] = None
     seat_number: int 
+    boarding_seq: Optional[int] = None
+    alighting_seq: Optional[int] = None
     passenger_name: str
     passenger_contact: str 
     passenger_email: str 
     status: str 
     created_at: datetime 
     updated_at: datetime  
-    bus_data: GetBusResponse
\ No newline at end of file
+    bus_data: GetBusResponse
+
+
+class SeatAvailabilityResponse(BaseModel):
+    schedule_id: int
+    boarding_seq: int
+    alighting_seq: int
+    total_seats: int
+    booked_seats: list[int]
+    available_seats: list[int]
+
+
+class SeatSuggestionResponse(BaseModel):
+    schedule_id: int
+    boarding_seq: int
+    alighting_seq: int
+    seat_numbers: list[int]
+
+
+class TicketFilter(BaseModel):
+    schedule_id: Optional[PositiveInt] = None
+    bus_id: Optional[PositiveInt] = None
+    status: Optional[TicketStatusEnum] = None
+    passenger_email: Optional[str] = None
@@ -1,4 +1,6 @@
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 from pydantic import (
     BaseModel, 
     EmailStr,
@@ -36,10 +38,16 @@ class GetUserResponse(BaseModel):
     created_at: datetime 
     updated_at: datetime 
     is_active: bool 
+
+
+class UserFilter(BaseModel):
+    role: Optional[str] = None
+    is_active: Optional[bool] = None
     
 
-class CurrentContextUser():
+@dataclass(frozen=True, slots=True)
+class CurrentContextUser:
     name: str
     email: str
     role: str
-    branch_id: int
\ No newline at end of file
+    branch_id: Optional[int] = None
@@ -7,7 +7,7 @@ from app.routes.route_entries import (
     PROTECTED_ROUTES, 
     PUBLIC_ROUTES
 )
-from app.utils.auth_dependencies import verify_auth_token
+from app.utils.auth_dependencies import require_roles
 
 security = HTTPBearer()
 
@@ -16,6 +16,6 @@ def setup_routes(app: FastAPI):
     for route in PUBLIC_ROUTES:
         app.include_router(route)
 
-    for route in PROTECTED_ROUTES:
-        dependcies = [Depends(security), Depends(verify_auth_token)]
-        app.include_router(route, dependencies=dependcies)
\ No newline at end of file
+    for route, roles in PROTECTED_ROUTES:
+        dependcies = [Depends(security), Depends(require_roles(roles))]
+        app.include_router(route, dependencies=dependcies)
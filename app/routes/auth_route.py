@@ -1,11 +1,14 @@
 from fastapi import (
     APIRouter, 
     Depends, 
+    Header,
     status
 )
 from app.models.auth_models import (
     LoginRequest, 
-    LoginResponse
+    LoginResponse,
+    LogoutResponse,
+    RefreshTokenRequest
 )
 from app.models.base_response_model import ApiResponse
 from app.services.auth_service import AuthService
@@ -28,4 +31,34 @@ async def login(
     """
         Authenticate a user and generate an jwt token.
     """
-    return ApiResponse(data=service.login(request))
\ No newline at end of file
+    return ApiResponse(data=await service.login(request))
+
+@router.post(
+    "/refresh",
+    response_model=ApiResponse[LoginResponse],
+    status_code=status.HTTP_200_OK
+)
+async def refresh(
+    request: RefreshTokenRequest,
+    service: AuthService = Depends(AuthService)
+) -> ApiResponse[LoginResponse]:
+    """
+        Exchange a refresh token for a new access and refresh token.
+    """
+    return ApiResponse(data=await service.refresh(request))
+
+
+@router.post(
+    "/logout",
+    response_model=ApiResponse[LogoutResponse],
+    status_code=status.HTTP_200_OK
+)
+async def logout(
+    request: RefreshTokenRequest,
+    authorization: str | None = Header(default=None),
+    service: AuthService = Depends(AuthService)
+) -> ApiResponse[LogoutResponse]:
+    """
+        Revoke a refresh token's session and the access token sent with it.
+    """
+    return ApiResponse(data=await service.logout(request, authorization))
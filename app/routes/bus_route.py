@@ -1,24 +1,56 @@
+from datetime import date
 from typing import List
 from fastapi import (
     APIRouter, 
     Depends,
+    Query,
     status
 )
+from fastapi.responses import StreamingResponse
 from pydantic import PositiveInt
 
-from app.models.base_response_model import ApiResponse
+from app.models.base_response_model import (
+    ApiResponse,
+    CursorPage
+)
 from app.models.bus_models import (
+    BulkBusScheduleRequest,
+    BusFilter,
     BusRequest,
     BusResponse,
+    BusScheduleFilter,
     BusScheduleRequest,
     GetBusResponse,
-    GetBusScheduleResponse
+    GetBusScheduleResponse,
+    GetScheduleTemplateResponse,
+    JourneyResponse,
+    ScheduleTemplateRequest,
+    TimetableEntryResponse,
+    TimetableFilter,
+    TripSearchResponse
+)
+from app.models.pagination_models import PageParams
+from app.utils.constants import (
+    DEFAULT_MAX_TRANSFERS,
+    DEFAULT_MIN_TRANSFER_MINUTES,
+    MAX_TRANSFERS
 )
 from app.services.bus_service import BusService
+from app.services.export_service import ExportService
+from app.services.idempotency_service import IdempotencyService
+from app.services.journey_planner_service import JourneyPlannerService
+from app.services.schedule_template_service import ScheduleTemplateService
+from app.services.trip_search_service import TripSearchService
+from app.utils.enums import ExportFormatEnum
+from app.utils.responses import (
+    ModelJSONResponse,
+    ModelResponseRoute
+)
 
 router = APIRouter(
     prefix="/buses", 
-    tags=["BUS MANAGEMENT SERVICE"]
+    tags=["BUS MANAGEMENT SERVICE"],
+    route_class=ModelResponseRoute
 )
 
 
@@ -29,32 +61,71 @@ router = APIRouter(
 )
 async def create_bus(
     request: BusRequest, 
-    service: BusService = Depends(BusService)
+    service: BusService = Depends(BusService),
+    idempotency: IdempotencyService = Depends(IdempotencyService)
 ) -> ApiResponse[BusResponse]:
-    return ApiResponse(data=service.create_bus(request))
+    return await idempotency.execute(request, lambda: service.create_bus(request))
 
 
 @router.get(
     "",
-    response_model=ApiResponse[List[GetBusResponse]],
+    response_model=ApiResponse[CursorPage[GetBusResponse]],
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_200_OK,
 )
 async def get_all_buses( 
+    page: PageParams = Depends(),
+    filters: BusFilter = Depends(),
     service: BusService = Depends(BusService)
-) -> ApiResponse[List[GetBusResponse]]:
-    return ApiResponse(data=service.get_all_buses())
+) -> ApiResponse[CursorPage[GetBusResponse]]:
+    return ApiResponse(data=await service.get_all_buses(page, filters))
+
+
+@router.get(
+    "/search",
+    response_model=ApiResponse[List[TripSearchResponse]],
+    response_class=ModelJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def search_trips(
+    from_stop: str = Query(alias="from", min_length=1),
+    to_stop: str = Query(alias="to", min_length=1),
+    travel_date: date = Query(alias="date"),
+    service: TripSearchService = Depends(TripSearchService)
+) -> ApiResponse[List[TripSearchResponse]]:
+    return ApiResponse(data=await service.search_trips(from_stop, to_stop, travel_date))
+
+
+@router.get(
+    "/journeys",
+    response_model=ApiResponse[List[JourneyResponse]],
+    response_class=ModelJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def plan_journeys(
+    from_stop: str = Query(alias="from", min_length=1),
+    to_stop: str = Query(alias="to", min_length=1),
+    travel_date: date = Query(alias="date"),
+    min_transfer_minutes: int = Query(DEFAULT_MIN_TRANSFER_MINUTES, ge=0, le=24 * 60),
+    max_transfers: int = Query(DEFAULT_MAX_TRANSFERS, ge=0, le=MAX_TRANSFERS),
+    service: JourneyPlannerService = Depends(JourneyPlannerService)
+) -> ApiResponse[List[JourneyResponse]]:
+    return ApiResponse(data=await service.plan_journeys(
+        from_stop, to_stop, travel_date, min_transfer_minutes, max_transfers
+    ))
 
 
 @router.get(
     "/data/{id}",
     response_model=ApiResponse[GetBusResponse],
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_200_OK
 )
 async def get_bus_by_id(
     id: PositiveInt, 
     service: BusService = Depends(BusService)
 ) -> ApiResponse[GetBusResponse]:
-    return ApiResponse(data=service.get_bus_by_id(id))
+    return ApiResponse(data=await service.get_bus_by_id(id))
 
 
 @router.put(
@@ -67,7 +138,7 @@ async def update_bus_by_id(
     request: BusRequest, 
     service: BusService = Depends(BusService)
 ) -> ApiResponse[BusResponse]:
-    return ApiResponse(data=service.update_bus_by_id(id, request))
+    return ApiResponse(data=await service.update_bus_by_id(id, request))
 
 
 @router.delete(
@@ -79,7 +150,7 @@ async def delete_bus_by_id(
     id: PositiveInt, 
     service: BusService = Depends(BusService)
 ) -> ApiResponse[BusResponse]:
-    return ApiResponse(data=service.delete_bus_by_id(id))
+    return ApiResponse(data=await service.delete_bus_by_id(id))
 
 
 @router.post(
@@ -89,20 +160,50 @@ async def delete_bus_by_id(
 )
 async def create_bus_schedule(
     request: BusScheduleRequest, 
-    service: BusService = Depends(BusService)
+    service: BusService = Depends(BusService),
+    idempotency: IdempotencyService = Depends(IdempotencyService)
 ) -> ApiResponse[BusResponse]:
-    return ApiResponse(data=service.create_bus_schedule(request))
+    return await idempotency.execute(request, lambda: service.create_bus_schedule(request))
+
+
+@router.post(
+    "/schedules/bulk",
+    response_model=ApiResponse[BusResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_bus_schedules(
+    request: BulkBusScheduleRequest,
+    service: BusService = Depends(BusService),
+    idempotency: IdempotencyService = Depends(IdempotencyService)
+) -> ApiResponse[BusResponse]:
+    return await idempotency.execute(request, lambda: service.import_bus_schedules(request))
 
 
 @router.get(
     "/schedules",
-    response_model=ApiResponse[List[GetBusScheduleResponse]],
+    response_model=ApiResponse[CursorPage[GetBusScheduleResponse]],
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_201_CREATED,
 )
 async def get_all_bus_schedules(
+    page: PageParams = Depends(),
+    filters: BusScheduleFilter = Depends(),
     service: BusService = Depends(BusService)
-) -> ApiResponse[List[GetBusScheduleResponse]]:
-    return ApiResponse(data=service.get_all_bus_schedules())
+) -> ApiResponse[CursorPage[GetBusScheduleResponse]]:
+    return ApiResponse(data=await service.get_all_bus_schedules(page, filters))
+
+
+@router.get(
+    "/schedules/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def export_bus_schedules(
+    filters: BusScheduleFilter = Depends(),
+    export_format: ExportFormatEnum = Query(ExportFormatEnum.NDJSON, alias="format"),
+    service: ExportService = Depends(ExportService)
+) -> StreamingResponse:
+    return service.export_schedules(filters, export_format)
 
 
 @router.put(
@@ -115,7 +216,7 @@ async def update_bus_schedule_by_id(
     request: BusScheduleRequest, 
     service: BusService = Depends(BusService)
 ) -> ApiResponse[BusResponse]:
-    return ApiResponse(data=service.update_bus_schedule_by_id(id, request))
+    return ApiResponse(data=await service.update_bus_schedule_by_id(id, request))
 
 
 @router.delete(
@@ -127,4 +228,54 @@ async def delete_bus_schedule_by_id(
     id: PositiveInt,
     service: BusService = Depends(BusService)
 ) -> ApiResponse[BusResponse]:
-    return ApiResponse(data=service.delete_bus_schedule_by_id(id))
\ No newline at end of file
+    return ApiResponse(data=await service.delete_bus_schedule_by_id(id))
+
+@router.post(
+    "/templates",
+    response_model=ApiResponse[BusResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_schedule_template(
+    request: ScheduleTemplateRequest,
+    service: ScheduleTemplateService = Depends(ScheduleTemplateService),
+    idempotency: IdempotencyService = Depends(IdempotencyService)
+) -> ApiResponse[BusResponse]:
+    return await idempotency.execute(request, lambda: service.create_template(request))
+
+
+@router.get(
+    "/templates",
+    response_model=ApiResponse[CursorPage[GetScheduleTemplateResponse]],
+    response_class=ModelJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_all_schedule_templates(
+    page: PageParams = Depends(),
+    service: ScheduleTemplateService = Depends(ScheduleTemplateService)
+) -> ApiResponse[CursorPage[GetScheduleTemplateResponse]]:
+    return ApiResponse(data=await service.get_all_templates(page))
+
+
+@router.delete(
+    "/templates/{id}",
+    response_model=ApiResponse[BusResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def delete_schedule_template_by_id(
+    id: PositiveInt,
+    service: ScheduleTemplateService = Depends(ScheduleTemplateService)
+) -> ApiResponse[BusResponse]:
+    return ApiResponse(data=await service.delete_template_by_id(id))
+
+
+@router.get(
+    "/timetable",
+    response_model=ApiResponse[List[TimetableEntryResponse]],
+    response_class=ModelJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_timetable(
+    filters: TimetableFilter = Depends(),
+    service: ScheduleTemplateService = Depends(ScheduleTemplateService)
+) -> ApiResponse[List[TimetableEntryResponse]]:
+    return ApiResponse(data=await service.get_timetable(filters))
@@ -1,4 +1,3 @@
-from typing import List
 from fastapi import (
     APIRouter, 
     Depends,
@@ -6,17 +5,28 @@ from fastapi import (
 )
 from pydantic import PositiveInt
 
-from app.models.base_response_model import ApiResponse
+from app.models.base_response_model import (
+    ApiResponse,
+    CursorPage
+)
 from app.models.company_models import (
+    CompanyFilter,
     CompanyRequest,
     CompanyResponse,
     GetCompanyResponse
 )
+from app.models.pagination_models import PageParams
 from app.services.company_service import CompanyService
+from app.services.idempotency_service import IdempotencyService
+from app.utils.responses import (
+    ModelJSONResponse,
+    ModelResponseRoute
+)
 
 router = APIRouter(
     prefix="/companies", 
-    tags=["COMPANY MANAGEMENT SERVICE"]
+    tags=["COMPANY MANAGEMENT SERVICE"],
+    route_class=ModelResponseRoute
 )
 
 
@@ -27,32 +37,37 @@ router = APIRouter(
 )
 async def create_company(
     request: CompanyRequest, 
-    service: CompanyService = Depends(CompanyService)
+    service: CompanyService = Depends(CompanyService),
+    idempotency: IdempotencyService = Depends(IdempotencyService)
 ) -> ApiResponse[CompanyResponse]:
-    return ApiResponse(data=service.create_company(request))
+    return await idempotency.execute(request, lambda: service.create_company(request))
 
 
 @router.get(
     "",
-    response_model=ApiResponse[List[GetCompanyResponse]],
+    response_model=ApiResponse[CursorPage[GetCompanyResponse]],
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_200_OK,
 )
 async def get_all_companies(
+    page: PageParams = Depends(),
+    filters: CompanyFilter = Depends(),
     service: CompanyService = Depends(CompanyService)
-) -> ApiResponse[List[GetCompanyResponse]]:
-    return ApiResponse(data=service.get_all_companies())
+) -> ApiResponse[CursorPage[GetCompanyResponse]]:
+    return ApiResponse(data=await service.get_all_companies(page, filters))
 
 
 @router.get(
     "{id}",
     response_model=ApiResponse[GetCompanyResponse],
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_200_OK
 )
 async def get_company_by_id(
     id: PositiveInt, 
     service: CompanyService = Depends(CompanyService)
 ) -> ApiResponse[GetCompanyResponse]:
-    return ApiResponse(data=service.get_company_by_id(id))
+    return ApiResponse(data=await service.get_company_by_id(id))
 
 
 @router.put(
@@ -65,7 +80,7 @@ async def update_company_by_id(
     request: CompanyRequest, 
     service: CompanyService = Depends(CompanyService)
 ) -> ApiResponse[CompanyResponse]:
-    return ApiResponse(data=service.update_company_by_id(id, request))
+    return ApiResponse(data=await service.update_company_by_id(id, request))
 
 
 @router.delete(
@@ -77,4 +92,4 @@ async def delete_company_by_id(
     id: PositiveInt, 
     service: CompanyService = Depends(CompanyService)
 ) -> ApiResponse[CompanyResponse]:
-    return ApiResponse(data=service.delete_company_by_id(id))
\ No newline at end of file
+    return ApiResponse(data=await service.delete_company_by_id(id))
\ No newline at end of file
@@ -1,3 +1,4 @@
+from app.utils.enums import Roles
 from . import (
     auth_route,
     super_admin_route,
@@ -7,13 +8,13 @@ from . import (
     )
 
 """
-add your protected route here
+add your protected route here, with the roles allowed to use it
 """
 PROTECTED_ROUTES = [
-    super_admin_route.router,
-    company_route.router,
-    bus_route.router,
-    ticket_route.router
+    (super_admin_route.router, {Roles.SuperAdmin}),
+    (company_route.router, {Roles.SuperAdmin, Roles.Admin}),
+    (bus_route.router, {Roles.SuperAdmin, Roles.Admin}),
+    (ticket_route.router, {Roles.SuperAdmin, Roles.Admin})
 ]
 
 
@@ -1,5 +1,3 @@
-from typing import List
-
 from fastapi import (
     APIRouter, 
     Depends,
@@ -7,21 +5,33 @@ from fastapi import (
     status
 )
 
-from app.models.base_response_model import ApiResponse
+from app.models.base_response_model import (
+    ApiResponse,
+    CursorPage
+)
 from app.models.branch_models import (
+    BranchFilter,
     BranchRequest, 
     BranchResponse,
     GetBranchResponse
 )
+from app.models.metrics_models import RuntimeMetricsResponse
+from app.models.pagination_models import PageParams
 from app.models.user_models import (
     GetUserResponse,
+    UserFilter,
     UserCreationRequest, 
     UserCreationResponse
 )
 from app.services.branch_service import BranchService
+from app.services.metrics_service import MetricsService
 from app.services.user_service import UserService
+from app.utils.responses import (
+    ModelJSONResponse,
+    ModelResponseRoute
+)
 
-router = APIRouter(prefix="/admin", tags=["BRANCH MANAGEMENT SERVICE"])
+router = APIRouter(prefix="/admin", tags=["BRANCH MANAGEMENT SERVICE"], route_class=ModelResponseRoute)
 
 
 @router.post(
@@ -29,7 +39,7 @@ router = APIRouter(prefix="/admin", tags=["BRANCH MANAGEMENT SERVICE"])
     response_model=ApiResponse[BranchResponse],
     status_code=status.HTTP_201_CREATED,
 )
-async def create_branch(
+def create_branch(
     request: BranchRequest, 
     service: BranchService = Depends(BranchService)
 ) -> ApiResponse[BranchResponse]:
@@ -38,21 +48,25 @@ async def create_branch(
 
 @router.get(
     "/branches", 
-    response_model=ApiResponse[List[GetBranchResponse]], 
+    response_model=ApiResponse[CursorPage[GetBranchResponse]], 
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_200_OK
 )
-async def get_all_branches(
+def get_all_branches(
+    page: PageParams = Depends(),
+    filters: BranchFilter = Depends(),
     service: BranchService = Depends(BranchService)
-) -> ApiResponse[List[GetBranchResponse]]:
-    return ApiResponse(data=service.get_all_branches())
+) -> ApiResponse[CursorPage[GetBranchResponse]]:
+    return ApiResponse(data=service.get_all_branches(page, filters))
 
 
 @router.get(
     "/branches/{id}", 
     response_model=ApiResponse[GetBranchResponse], 
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_200_OK
 )
-async def get_branch_by_id(
+def get_branch_by_id(
     id: int, 
     service: BranchService = Depends(BranchService)
 ) -> ApiResponse[GetBranchResponse]:
@@ -64,7 +78,7 @@ async def get_branch_by_id(
     response_model=ApiResponse[BranchResponse], 
     status_code=status.HTTP_200_OK
 )
-async def update_branch_by_id(
+def update_branch_by_id(
     id: int, 
     request: BranchRequest, 
     service: BranchService = Depends(BranchService)
@@ -81,17 +95,32 @@ async def create_user(
     request: UserCreationRequest, 
     service: UserService = Depends(UserService)
 ) -> ApiResponse[UserCreationResponse]:
-    return ApiResponse(data=service.create_user(request))
+    return ApiResponse(data=await service.create_user(request))
 
 
 @router.get(
     "/users", 
-    response_model=ApiResponse[List[GetUserResponse]], 
+    response_model=ApiResponse[CursorPage[GetUserResponse]], 
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_201_CREATED
 )
 async def get_all_users(
     request_state: Request, 
+    page: PageParams = Depends(),
+    filters: UserFilter = Depends(),
     service: UserService = Depends(UserService)
-) -> ApiResponse[List[GetUserResponse]]:
+) -> ApiResponse[CursorPage[GetUserResponse]]:
     branch_id = request_state.state.user.branch_id
-    return ApiResponse(data=service.get_all_users(branch_id))
+    return ApiResponse(data=await service.get_all_users(branch_id, page, filters))
+
+
+@router.get(
+    "/metrics",
+    response_model=ApiResponse[RuntimeMetricsResponse],
+    response_class=ModelJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+def get_metrics(
+    service: MetricsService = Depends(MetricsService)
+) -> ApiResponse[RuntimeMetricsResponse]:
+    return ApiResponse(data=service.get_metrics())
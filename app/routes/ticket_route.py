@@ -1,22 +1,44 @@
-from typing import List
+from typing import Optional
 from fastapi import (
     APIRouter, 
     Depends,
+    Query,
     status
 )
+from fastapi.responses import StreamingResponse
 from pydantic import PositiveInt
 
-from app.models.base_response_model import ApiResponse
+from app.models.base_response_model import (
+    ApiResponse,
+    CursorPage
+)
+from app.models.pagination_models import PageParams
 from app.models.ticket_models import (
+    BatchTicketRequest,
+    BatchTicketResponse,
+    SeatAvailabilityResponse,
+    SeatHoldRequest,
+    SeatHoldResponse,
+    SeatSuggestionResponse,
+    TicketFilter,
     TicketRequest,
     TicketResponse,
     GetTicketResponse
 )
+from app.services.export_service import ExportService
+from app.services.idempotency_service import IdempotencyService
 from app.services.ticket_service import TicketService
+from app.utils.constants import MAX_TICKETS_PER_BATCH
+from app.utils.enums import ExportFormatEnum
+from app.utils.responses import (
+    ModelJSONResponse,
+    ModelResponseRoute
+)
 
 router = APIRouter(
     prefix="/tickets", 
-    tags=["TICKET MANAGEMENT SERVICE"]
+    tags=["TICKET MANAGEMENT SERVICE"],
+    route_class=ModelResponseRoute
 )
 
 
@@ -27,32 +49,119 @@ router = APIRouter(
 )
 async def create_ticket(
     request: TicketRequest, 
+    service: TicketService = Depends(TicketService),
+    idempotency: IdempotencyService = Depends(IdempotencyService)
+) -> ApiResponse[TicketResponse]:
+    return await idempotency.execute(request, lambda: service.create_ticket(request))
+
+
+@router.post(
+    "/batch",
+    response_model=ApiResponse[BatchTicketResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tickets(
+    request: BatchTicketRequest,
+    service: TicketService = Depends(TicketService),
+    idempotency: IdempotencyService = Depends(IdempotencyService)
+) -> ApiResponse[BatchTicketResponse]:
+    return await idempotency.execute(request, lambda: service.create_tickets(request))
+
+
+@router.post(
+    "/holds",
+    response_model=ApiResponse[SeatHoldResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def hold_seats(
+    request: SeatHoldRequest,
+    service: TicketService = Depends(TicketService),
+    idempotency: IdempotencyService = Depends(IdempotencyService)
+) -> ApiResponse[SeatHoldResponse]:
+    return await idempotency.execute(request, lambda: service.hold_seats(request))
+
+
+@router.delete(
+    "/holds/{hold_id}",
+    response_model=ApiResponse[TicketResponse],
+    status_code=status.HTTP_200_OK
+)
+async def release_hold(
+    hold_id: str,
     service: TicketService = Depends(TicketService)
 ) -> ApiResponse[TicketResponse]:
-    return ApiResponse(data=service.create_ticket(request))
+    return ApiResponse(data=await service.release_hold(hold_id))
 
 
 @router.get(
     "",
-    response_model=ApiResponse[List[GetTicketResponse]],
+    response_model=ApiResponse[CursorPage[GetTicketResponse]],
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_200_OK,
 )
 async def get_all_tickets( 
+    page: PageParams = Depends(),
+    filters: TicketFilter = Depends(),
+    service: TicketService = Depends(TicketService)
+) -> ApiResponse[CursorPage[GetTicketResponse]]:
+    return ApiResponse(data=await service.get_all_tickets(page, filters))
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def export_tickets(
+    filters: TicketFilter = Depends(),
+    export_format: ExportFormatEnum = Query(ExportFormatEnum.NDJSON, alias="format"),
+    service: ExportService = Depends(ExportService)
+) -> StreamingResponse:
+    return service.export_tickets(filters, export_format)
+
+
+@router.get(
+    "/seats/{schedule_id}",
+    response_model=ApiResponse[SeatAvailabilityResponse],
+    response_class=ModelJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_seat_availability(
+    schedule_id: PositiveInt,
+    boarding_stop: Optional[str] = Query(None, alias="from"),
+    alighting_stop: Optional[str] = Query(None, alias="to"),
+    service: TicketService = Depends(TicketService)
+) -> ApiResponse[SeatAvailabilityResponse]:
+    return ApiResponse(data=await service.get_seat_availability(schedule_id, boarding_stop, alighting_stop))
+
+
+@router.get(
+    "/seats/{schedule_id}/suggestions",
+    response_model=ApiResponse[SeatSuggestionResponse],
+    response_class=ModelJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def suggest_seats(
+    schedule_id: PositiveInt,
+    party_size: int = Query(1, ge=1, le=MAX_TICKETS_PER_BATCH),
+    boarding_stop: Optional[str] = Query(None, alias="from"),
+    alighting_stop: Optional[str] = Query(None, alias="to"),
     service: TicketService = Depends(TicketService)
-) -> ApiResponse[List[GetTicketResponse]]:
-    return ApiResponse(data=service.get_all_tickets())
+) -> ApiResponse[SeatSuggestionResponse]:
+    return ApiResponse(data=await service.suggest_seats(schedule_id, party_size, boarding_stop, alighting_stop))
 
 
 @router.get(
     "{id}",
     response_model=ApiResponse[GetTicketResponse],
+    response_class=ModelJSONResponse,
     status_code=status.HTTP_200_OK
 )
 async def get_ticket_by_id(
     id: PositiveInt, 
     service: TicketService = Depends(TicketService)
 ) -> ApiResponse[GetTicketResponse]:
-    return ApiResponse(data=service.get_ticket_by_id(id))
+    return ApiResponse(data=await service.get_ticket_by_id(id))
 
 
 @router.put(
@@ -65,7 +174,7 @@ async def update_ticket_by_id(
     request: TicketRequest, 
     service: TicketService = Depends(TicketService)
 ) -> ApiResponse[TicketResponse]:
-    return ApiResponse(data=service.update_ticket_by_id(id, request))
+    return ApiResponse(data=await service.update_ticket_by_id(id, request))
 
 
 @router.delete(
@@ -77,4 +186,4 @@ async def delete_ticket_by_id(
     id: PositiveInt, 
     service: TicketService = Depends(TicketService)
 ) -> ApiResponse[TicketResponse]:
-    return ApiResponse(data=service.delete_ticket_by_id(id))
\ No newline at end of file
+    return ApiResponse(data=await service.delete_ticket_by_id(id))
\ No newline at end of file
@@ -1,3 +1,4 @@
+import uuid
 from datetime import (
     datetime, 
     timedelta
@@ -14,18 +15,25 @@ from fastapi import (
 from app.entities.user import User
 from app.models.auth_models import (
     LoginRequest, 
-    LoginResponse
+    LoginResponse,
+    LogoutResponse,
+    RefreshTokenRequest
 )
+from .refresh_token_service import RefreshTokenService
 from .user_service import UserService
 from app.utils.auth_dependencies import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     ALGORITHM,
     SECRET_KEY,
+    revoke_auth_token
 )
 from app.utils.constants import (
     INCORRECT_PASSWORD,  
+    LOGGED_OUT_SUCCESSFULLY,
+    LOGIN_BUSY,
     USER_NOT_FOUND
 )
+from app.utils.hasher import PasswordVerifierSaturated
 
 
 @dataclass
@@ -34,6 +42,7 @@ class AuthService:
         Service For Managing Authentication.  
     """
     user_service: UserService = Depends(UserService)
+    refresh_token_service: RefreshTokenService = Depends(RefreshTokenService)
     
     def create_claims(self, user: User, user_role: str) -> dict:
         """
@@ -46,25 +55,44 @@ class AuthService:
             "role": user_role,
             "branch_id": user.branch_id,
             "sub": str(user.email),
+            # Tells apart tokens issued to a user within the same second, e.g. on two devices
+            "jti": uuid.uuid4().hex,
+            "iat": datetime.utcnow(),
             "exp": datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
         }
         return claims
 
-    def login(self, request: LoginRequest) -> LoginResponse:
+    async def verify_password(self, user: User, password: str) -> bool:
+        """
+            Verify a login's password, turning it away when the verifier pool is saturated.
+        """
+        try:
+            return await user.verify_password_async(password)
+        except PasswordVerifierSaturated:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=LOGIN_BUSY,
+                headers={"Retry-After": "1"}
+            )
+
+    async def login(self, request: LoginRequest) -> LoginResponse:
         """
             Authenticate a user and generate a JWT token upon successful login.
         """
-        user = self.user_service.get_active_user_by_email(email=request.email)
+        user = await self.user_service.get_active_user_by_email(email=request.email)
         
         if user:
-            if user.verify_password(password=request.password):
+            if await self.verify_password(user=user, password=request.password):
                 claims = self.create_claims(
                     user=user, 
                     user_role=user.role
                 )
+                refresh_token = await self.refresh_token_service.issue(user.id)
+
                 return self.generate_token_response(
                     user=user,
-                    claims=claims
+                    claims=claims,
+                    refresh_token=refresh_token
                 )
             else:
                 raise HTTPException(
@@ -77,7 +105,30 @@ class AuthService:
                 detail=USER_NOT_FOUND
             )
     
-    def generate_token_response(self, user: User, claims: dict) -> LoginResponse:
+    async def refresh(self, request: RefreshTokenRequest) -> LoginResponse:
+        """
+            Exchange a refresh token for a new token pair, without the user's password.
+        """
+        user, refresh_token = await self.refresh_token_service.rotate(request.refresh_token)
+
+        return self.generate_token_response(
+            user=user,
+            claims=self.create_claims(user=user, user_role=user.role),
+            refresh_token=refresh_token
+        )
+
+    async def logout(self, request: RefreshTokenRequest, authorization: str | None) -> LogoutResponse:
+        """
+            End the session of a refresh token, and revoke the access token sent along with it.
+        """
+        await self.refresh_token_service.revoke(request.refresh_token)
+
+        if authorization:
+            revoke_auth_token(authorization)
+
+        return LogoutResponse(message=LOGGED_OUT_SUCCESSFULLY)
+
+    def generate_token_response(self, user: User, claims: dict, refresh_token: str) -> LoginResponse:
         """
             Generate JWT token and return the login response.
         """
@@ -92,7 +143,9 @@ class AuthService:
                 email=user.email,
                 role=user.role,
                 contact=user.contact,
-                jwt_token=token
+                jwt_token=token,
+                refresh_token=refresh_token,
+                expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60
             )
         except Exception as e:
             raise HTTPException(
@@ -1,8 +1,6 @@
 from dataclasses import dataclass
 import traceback
 import argparse
-from typing import List
-from automapper import mapper
 
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session
@@ -18,12 +16,16 @@ from app.connectors.database_connector import (
     get_master_database, 
     get_master_db
 )
+from app.connectors.tenant_registry import tenant_registry
 from app.entities.branch import Branch
+from app.models.base_response_model import CursorPage
 from app.models.branch_models import (
+    BranchFilter,
     BranchRequest, 
     BranchResponse,
     GetBranchResponse
 )
+from app.models.pagination_models import PageParams
 from app.utils.constants import (
     BRANCH_CREATED_SUCCESSFULLY,
     BRANCH_NOT_FOUND,
@@ -32,6 +34,12 @@ from app.utils.constants import (
     DB_NOT_UPTODATE,
     DOMAIN_NAME_ALREADY_EXISTS
 )
+from app.utils.mappers import map_branch
+from app.utils.pagination import (
+    paginate,
+    split_page
+)
+from app.utils.stop_index import stop_index_cache
 from app.utils.utils import (
     get_project_root, 
     get_randome_str
@@ -74,6 +82,8 @@ class BranchService:
                 setattr(alembic_config.cmd_opts, "x", None)
 
         command.upgrade(alembic_config, "head")
+        # Routes are only written by migrations, so this is where a tenant's stop index goes stale
+        stop_index_cache.invalidate(schema)
 
     @staticmethod
     def upgrade_all():
@@ -134,15 +144,27 @@ class BranchService:
         self.db.execute(sa.schema.CreateSchema(schema, True))
         self.db.add(branch)
         self.db.commit()
+        tenant_registry.invalidate(branch.id)
 
         current_head = BranchService.__get_current_head(self.db)
         BranchService.__upgrade(schema, current_head)
 
         return BranchResponse(message=BRANCH_CREATED_SUCCESSFULLY)
     
-    def get_all_branches(self) -> List[GetBranchResponse]:
-        branches = self.db.query(Branch).all() 
-        return [mapper.to(GetBranchResponse).map(branch) for branch in branches]
+    def get_all_branches(self, page: PageParams, filters: BranchFilter) -> CursorPage[GetBranchResponse]:
+        statement = sa.select(Branch)
+
+        if filters.is_active is not None:
+            statement = statement.where(Branch.is_active == filters.is_active)
+
+        branches = self.db.scalars(paginate(statement, Branch, page)).all()
+        branches, next_cursor = split_page(branches, page)
+
+        return CursorPage[GetBranchResponse](
+            items=[map_branch(branch) for branch in branches],
+            page_size=page.page_size,
+            next_cursor=next_cursor
+        )
     
     def get_branch_data_by_id(self, id: int) -> Branch:
         branch = self.db.query(Branch).filter(Branch.id == id).first() 
@@ -158,7 +180,7 @@ class BranchService:
     def get_branch_by_id(self, id: int) -> Branch:
         branch = self.get_branch_data_by_id(id) 
         self.validate_branch_exists(branch)
-        return mapper.to(GetBranchResponse).map(branch)
+        return map_branch(branch)
     
     def validate_branch_name_update(self, existing_branch_city: str, new_city_name: str) -> bool:
         if existing_branch_city.lower() != new_city_name.lower():
@@ -181,5 +203,6 @@ class BranchService:
         branch.updated_at = sa.func.now()
     
         self.db.commit()
+        tenant_registry.invalidate(id)
 
         return BranchResponse(message=BRANCH_UPDATED_SUCCESSFULLY)
\ No newline at end of file
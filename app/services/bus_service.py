@@ -1,62 +1,99 @@
 from dataclasses import dataclass
+from datetime import datetime
+from itertools import groupby
 
-from automapper import mapper
 from fastapi import (
     Depends, 
     HTTPException
 )
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Select,
+    func,
+    tuple_,
+    insert,
+    select,
+    union_all,
+    update
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.connectors.database_connector import (
-    get_tenant_db
+    get_async_tenant_db,
+    get_connected_schema
 )
 from app.entities.bus import Bus
 from app.entities.company import Company
 from app.entities.route import Route
 from app.entities.schedule import Schedule
+from app.entities.schedule_template import ScheduleTemplate
+from app.entities.seat_hold import SeatHold
+from app.entities.ticket import Ticket
+from app.models.base_response_model import CursorPage
 from app.models.bus_models import (
+    BulkBusScheduleRequest,
+    BusFilter,
     BusRequest,
     BusResponse,
+    BusScheduleFilter,
     BusScheduleRequest,
     GetBusResponse,
-    GetBusScheduleResponse,
-    GetRouteResponse
+    GetBusScheduleResponse
 )
-from app.models.company_models import GetCompanyResponse
+from app.models.pagination_models import PageParams
+from app.services.seat_inventory_service import SeatInventoryService
 from app.utils.constants import (
     A_BUS_WITH_THIS_NUMBER_ALREADY_EXISTS,
+    ARRIVAL_MUST_BE_AFTER_DEPARTURE,
     BUS_CREATED_SUCCESSFULLY,
     BUS_DELETED_SUCCESSFULLY,
+    BUS_HAS_FEWER_SEATS_THAN_BOOKED,
     BUS_NOT_FOUND,
     BUS_SCHEDULE_CREATED_SUCCESSFULLY,
     BUS_SCHEDULE_DELETED_SUCCESSFULLY,
+    BUS_SCHEDULE_OVERLAPS,
     BUS_SCHEDULE_UPDATED_SUCCESSFULLY,
+    BUS_SCHEDULES_IMPORTED_SUCCESSFULLY,
     BUS_UPDATED_SUCCESSFULLY,
     COMPANY_NOT_FOUND,
-    SCHEDULE_NOT_FOUND
+    ROUTE_NOT_FOUND,
+    SCHEDULE_HAS_TICKETS,
+    SCHEDULE_NOT_FOUND,
+    SCHEDULE_ROUTE_HAS_BOOKINGS
+)
+from app.utils.enums import TicketStatusEnum
+from app.utils.journey_planner import timetable_cache
+from app.utils.pagination import (
+    paginate,
+    split_page
 )
+from app.utils.projections import (
+    BUS_PROJECTION,
+    SCHEDULE_PROJECTION
+)
+from app.utils.schedule_templates import overlapping_departures
 
 
 
 @dataclass
 class BusService:
-    db: Session = Depends(get_tenant_db)
+    db: AsyncSession = Depends(get_async_tenant_db)
+    seat_inventory_service: SeatInventoryService = Depends(SeatInventoryService)
 
-    def get_company_data_by_id(self, id: int) -> Company:
+    async def get_company_data_by_id(self, id: int) -> Company:
         """
             Get company data by ID.
         """
-        return self.db.query(Company).filter(Company.id == id).first()
+        return await self.db.scalar(select(Company).where(Company.id == id))
     
-    def validate_bus_number(self, bus_number: str):
+    async def validate_bus_number(self, bus_number: str):
         """
             Validate bus name for uniqueness.
         """
-        existing_bus_number = (
-            self.db.query(Bus)
-            .filter(func.lower(Bus.bus_number) == bus_number.lower())
-            .first()
+        existing_bus_number = await self.db.scalar(
+            select(Bus)
+            .where(func.lower(Bus.bus_number) == bus_number.lower())
+            .limit(1)
         )
 
         if existing_bus_number:
@@ -75,12 +112,12 @@ class BusService:
                 detail=COMPANY_NOT_FOUND
             )    
 
-    def create_bus(self, request: BusRequest) -> BusResponse:
+    async def create_bus(self, request: BusRequest) -> BusResponse:
         """
             Create a new bus in the database.
         """
-        self.validate_bus_number(request.bus_number)
-        company = self.get_company_data_by_id(request.company_id)
+        await self.validate_bus_number(request.bus_number)
+        company = await self.get_company_data_by_id(request.company_id)
         self.validate_company_exists(company)
 
         bus = Bus(
@@ -91,36 +128,33 @@ class BusService:
         )
 
         self.db.add(bus)
-        self.db.commit()
+        await self.db.commit()
         
         return BusResponse(
             message=BUS_CREATED_SUCCESSFULLY
         )
     
-    def get_all_buses(self) -> list[GetBusResponse]:
-        """
-            Get all buses from the database along with company data.
-        """
-        buses = self.db.query(Bus).all()
-        company_ids = {bus.company_id for bus in buses}
-        companies = self.db.query(Company).filter(Company.id.in_(company_ids)).all()
-        company_map = {company.id: company for company in companies}
-
-        bus_responses = []
-        for bus in buses:
-            bus_response = GetBusResponse(
-                id=bus.id,
-                company_id=bus.company_id,
-                bus_number=bus.bus_number,
-                bus_type=bus.bus_type,
-                total_seats=bus.total_seats,
-                created_at=bus.created_at,
-                is_active=bus.is_active,
-                company_data=mapper.to(GetCompanyResponse).map(company_map.get(bus.company_id))
-            )
-            bus_responses.append(bus_response)
-            
-        return bus_responses
+    async def get_all_buses(self, page: PageParams, filters: BusFilter) -> CursorPage[GetBusResponse]:
+        """
+            Get one page of buses from the database along with company data.
+        """
+        statement = select(BUS_PROJECTION).join(Bus.company)
+
+        if filters.company_id:
+            statement = statement.where(Bus.company_id == filters.company_id)
+        if filters.bus_type:
+            statement = statement.where(Bus.bus_type == filters.bus_type)
+        if filters.is_active is not None:
+            statement = statement.where(Bus.is_active == filters.is_active)
+
+        buses = (await self.db.scalars(paginate(statement, Bus, page))).all()
+        buses, next_cursor = split_page(buses, page)
+
+        return CursorPage[GetBusResponse](
+            items=buses,
+            page_size=page.page_size,
+            next_cursor=next_cursor
+        )
     
     def validate_bus_exists(self, bus: Bus):
         """
@@ -132,48 +166,43 @@ class BusService:
                 detail=BUS_NOT_FOUND
             )
 
-    def get_bus_data_by_id(self, id: int) -> Bus:
+    async def get_bus_data_by_id(self, id: int) -> Bus:
         """
             Get company data by ID.
         """
-        return self.db.query(Bus).filter(Bus.id == id).first()
+        return await self.db.scalar(select(Bus).where(Bus.id == id))
     
-    def get_bus_by_id(self, id: int) -> GetBusResponse:
+    async def get_bus_by_id(self, id: int) -> GetBusResponse:
         """
             Get a bus by ID along with company data.
         """
-        bus = self.get_bus_data_by_id(id)
+        bus = await self.db.scalar(select(BUS_PROJECTION).join(Bus.company).where(Bus.id == id))
         self.validate_bus_exists(bus)
 
-        company = self.db.query(Company).filter(Company.id == bus.company_id).first()
-        
-        return GetBusResponse(
-            id=bus.id,
-            company_id=bus.company_id,
-            bus_number=bus.bus_number,
-            bus_type=bus.bus_type,
-            total_seats=bus.total_seats,
-            created_at=bus.created_at,
-            is_active=bus.is_active,
-            company_data= mapper.to(GetCompanyResponse).map(company)
-        )
+        return bus
     
-    def validate_update_bus_number(self, existing_bus_number: str, new_bus_number: str):
+    async def validate_update_bus_number(self, existing_bus_number: str, new_bus_number: str):
         """
             Validate bus number for uniqueness during update.
         """
         if existing_bus_number.lower() != new_bus_number.lower():
-            self.validate_bus_number(new_bus_number)
+            await self.validate_bus_number(new_bus_number)
     
-    def update_bus_by_id(self, id: int, request: BusRequest) -> BusResponse:
+    async def update_bus_by_id(self, id: int, request: BusRequest) -> BusResponse:
         """
             Update bus data by ID.
         """
-        bus = self.get_bus_data_by_id(id)
+        bus = await self.get_bus_data_by_id(id)
         self.validate_bus_exists(bus)
-        company = self.get_company_data_by_id(request.company_id)
+        company = await self.get_company_data_by_id(request.company_id)
         self.validate_company_exists(company)
-        self.validate_update_bus_number(bus.bus_number, request.bus_number)
+        await self.validate_update_bus_number(bus.bus_number, request.bus_number)
+
+        if bus.total_seats != request.total_seats:
+            await self.validate_seats_fit(
+                select(Schedule.id).where(Schedule.bus_id == bus.id), request.total_seats
+            )
+            await self.seat_inventory_service.resize_inventories(request.total_seats, bus_id=bus.id)
 
         bus.bus_number = request.bus_number
         bus.bus_type = request.bus_type
@@ -181,28 +210,168 @@ class BusService:
         bus.company_id = request.company_id
         bus.updated_at = func.now()
 
-        self.db.commit()
+        await self.db.commit()
 
         return BusResponse(message=BUS_UPDATED_SUCCESSFULLY)
     
-    def delete_bus_by_id(self, id: int) -> BusResponse:
+    async def delete_bus_by_id(self, id: int) -> BusResponse:
         """
             Delete bus by ID.
         """
-        bus = self.get_bus_data_by_id(id)
+        bus = await self.get_bus_data_by_id(id)
         self.validate_bus_exists(bus)
 
-        self.db.delete(bus)
-        self.db.commit()
+        await self.db.delete(bus)
+        await self.db.commit()
 
         return BusResponse(message=BUS_DELETED_SUCCESSFULLY)
     
-    def create_bus_schedule(self, request: BusScheduleRequest) -> BusResponse:
+    def validate_schedule_times(self, departure_time: datetime, arrival_time: datetime):
         """
-            Create a new bus schedule.
+            Validate that a trip arrives after it departs.
+        """
+        if arrival_time <= departure_time:
+            raise HTTPException(
+                status_code=400,
+                detail=ARRIVAL_MUST_BE_AFTER_DEPARTURE
+            )
+
+    async def validate_routes_exist(self, route_ids: set[int]):
+        """
+            Validate that every route exists, in one query.
+        """
+        existing_route_ids = set((await self.db.scalars(select(Route.id).where(Route.id.in_(route_ids)))).all())
+
+        if existing_route_ids != route_ids:
+            raise HTTPException(
+                status_code=404,
+                detail=ROUTE_NOT_FOUND
+            )
+
+    async def validate_no_overlapping_trip(
+        self, 
+        bus_id: int, 
+        departure_time: datetime, 
+        arrival_time: datetime, 
+        schedule_id: int | None = None
+    ):
+        """
+            Validate that the bus isn't running another trip in the same time window.
+            Written against the expressions of ex_schedules_bus_trip_overlap, so it is a gist index probe.
+        """
+        statement = (
+            select(Schedule.id)
+            .where(
+                func.int4range(Schedule.bus_id, Schedule.bus_id, "[]").op("&&")(func.int4range(bus_id, bus_id, "[]")),
+                func.tsrange(Schedule.departure_time, Schedule.arrival_time).op("&&")(func.tsrange(departure_time, arrival_time))
+            )
+            .limit(1)
+        )
+
+        if schedule_id is not None:
+            statement = statement.where(Schedule.id != schedule_id)
+
+        if await self.db.scalar(statement):
+            raise HTTPException(
+                status_code=409,
+                detail=BUS_SCHEDULE_OVERLAPS
+            )
+
+    async def validate_no_template_departures(self, trips: list):
+        """
+            Validate that no trip takes the slot of a departure of its bus's active templates.
+            Departures already stored as schedules are skipped, as the schedule check covers them.
+        """
+        templates = (await self.db.scalars(
+            select(ScheduleTemplate).where(
+                ScheduleTemplate.bus_id.in_({trip.bus_id for trip in trips}),
+                ScheduleTemplate.is_active.is_(True)
+            )
+        )).all()
+
+        if not templates:
+            return
+
+        clashes = {
+            (template.id, service_date)
+            for trip in trips
+            for template in templates
+            if template.bus_id == trip.bus_id
+            for service_date in overlapping_departures(template, trip.departure_time, trip.arrival_time)
+        }
+
+        if clashes:
+            materialized = set((await self.db.execute(
+                select(Schedule.template_id, Schedule.service_date)
+                .where(tuple_(Schedule.template_id, Schedule.service_date).in_(clashes))
+            )).all())
+
+            if clashes - materialized:
+                raise HTTPException(
+                    status_code=409,
+                    detail=BUS_SCHEDULE_OVERLAPS
+                )
+
+    def validate_no_overlapping_trips_in_batch(self, requests: list):
+        """
+            Validate that no two trips of a batch put the same bus on the road at once.
+            Sorting by bus and departure means only neighbours can overlap.
+        """
+        ordered = sorted(requests, key=lambda request: (request.bus_id, request.departure_time))
+
+        for _, trips in groupby(ordered, key=lambda request: request.bus_id):
+            trips = list(trips)
+
+            for previous, current in zip(trips, trips[1:]):
+                if current.departure_time < previous.arrival_time:
+                    raise HTTPException(
+                        status_code=409,
+                        detail=BUS_SCHEDULE_OVERLAPS
+                    )
+
+    async def raise_schedule_conflict(self, error: IntegrityError):
+        """
+            Roll back and report a trip rejected by the overlap constraint (a lost race) as a conflict.
+        """
+        await self.db.rollback()
+
+        if "ex_schedules_bus_trip_overlap" in str(error.orig):
+            raise HTTPException(
+                status_code=409,
+                detail=BUS_SCHEDULE_OVERLAPS
+            )
+        raise error
+
+    async def commit_schedules(self):
+        """
+            Commit schedule changes and drop the tenant's cached timetables.
+        """
+        try:
+            await self.db.commit()
+        except IntegrityError as e:
+            await self.raise_schedule_conflict(e)
+
+        timetable_cache.invalidate(get_connected_schema(self.db))
+
+    async def validate_bus_schedule(self, request: BusScheduleRequest, schedule_id: int | None = None) -> Bus:
+        """
+            Validate a trip: its bus and route exist, it arrives after departing and the bus is free.
         """
-        bus = self.get_bus_data_by_id(request.bus_id)
+        self.validate_schedule_times(request.departure_time, request.arrival_time)
+        bus = await self.get_bus_data_by_id(request.bus_id)
         self.validate_bus_exists(bus)
+        await self.validate_routes_exist({request.route_id})
+        await self.validate_no_overlapping_trip(
+            request.bus_id, request.departure_time, request.arrival_time, schedule_id
+        )
+        await self.validate_no_template_departures([request])
+        return bus
+
+    async def create_bus_schedule(self, request: BusScheduleRequest) -> BusResponse:
+        """
+            Create a new bus schedule.
+        """
+        bus = await self.validate_bus_schedule(request)
 
         schedule = Schedule(
             bus_id=request.bus_id,
@@ -212,59 +381,98 @@ class BusService:
         )
         
         self.db.add(schedule)
-        self.db.commit()
+
+        try:
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.raise_schedule_conflict(e)
+
+        self.seat_inventory_service.create_inventory(schedule.id, bus.total_seats)
+        await self.commit_schedules()
 
         return BusResponse(message=BUS_SCHEDULE_CREATED_SUCCESSFULLY)
-    
-    def get_all_bus_schedules(self) -> list[GetBusScheduleResponse]:
-        """
-            Get all bus schedules from the database in ascending order of departure time.
-        """
-        schedules = self.db.query(Schedule).order_by(Schedule.departure_time.asc()).all()
-        bus_ids = {schedule.bus_id for schedule in schedules}
-        buses = self.db.query(Bus).filter(Bus.id.in_(bus_ids)).all()
-        bus_map = {bus.id: bus for bus in buses}
-
-        company_ids = {bus.company_id for bus in buses}
-        companies = self.db.query(Company).filter(Company.id.in_(company_ids)).all()
-        company_map = {company.id: company for company in companies}
-
-        route_ids = {schedule.route_id for schedule in schedules}
-        routes = self.db.query(Route).filter(Route.id.in_(route_ids)).all()
-        route_map = {route.id: route for route in routes}
-
-        schedule_responses = []
-        for schedule in schedules:
-            bus = bus_map.get(schedule.bus_id)
-            company = mapper.to(GetCompanyResponse).map(company_map.get(bus.company_id)) 
-            route = mapper.to(GetRouteResponse).map(route_map.get(schedule.route_id))
-
-            schedule_response = GetBusScheduleResponse(
-                id=schedule.id,
-                bus_id=schedule.bus_id, 
-                route_id=schedule.route_id, 
-                departure_time=schedule.departure_time,
-                arrival_time=schedule.arrival_time, 
-                created_at=schedule.created_at,
-                updated_at=schedule.updated_at,
-                bus_data=GetBusResponse(
-                    id=bus.id,
-                    company_id=bus.company_id,
-                    bus_number=bus.bus_number,
-                    bus_type=bus.bus_type,
-                    total_seats=bus.total_seats,
-                    created_at=bus.created_at,
-                    is_active=bus.is_active,
-                    company_data=company
-                ),
-                route_data=route
+
+    async def import_bus_schedules(self, request: BulkBusScheduleRequest) -> BusResponse:
+        """
+            Create many bus schedules at once, all or nothing.
+
+            The batch is validated in memory and with one query per referenced table, then
+            inserted with one multi-row statement; overlaps with stored trips are caught by
+            ex_schedules_bus_trip_overlap during that insert.
+        """
+        for trip in request.schedules:
+            self.validate_schedule_times(trip.departure_time, trip.arrival_time)
+        self.validate_no_overlapping_trips_in_batch(request.schedules)
+
+        bus_ids = {trip.bus_id for trip in request.schedules}
+        bus_seats = dict((await self.db.execute(
+            select(Bus.id, Bus.total_seats).where(Bus.id.in_(bus_ids))
+        )).all())
+
+        if len(bus_seats) != len(bus_ids):
+            raise HTTPException(
+                status_code=404,
+                detail=BUS_NOT_FOUND
             )
-            schedule_responses.append(schedule_response)
-        
-        return schedule_responses
+
+        await self.validate_routes_exist({trip.route_id for trip in request.schedules})
+        await self.validate_no_template_departures(request.schedules)
+
+        try:
+            schedules = (await self.db.execute(
+                insert(Schedule).returning(Schedule.id, Schedule.bus_id, sort_by_parameter_order=True),
+                [
+                    {
+                        "bus_id": trip.bus_id,
+                        "route_id": trip.route_id,
+                        "departure_time": trip.departure_time,
+                        "arrival_time": trip.arrival_time
+                    }
+                    for trip in request.schedules
+                ]
+            )).all()
+        except IntegrityError as e:
+            await self.raise_schedule_conflict(e)
+
+        await self.seat_inventory_service.create_inventories(
+            [(schedule.id, bus_seats[schedule.bus_id]) for schedule in schedules]
+        )
+        await self.commit_schedules()
+
+        return BusResponse(message=BUS_SCHEDULES_IMPORTED_SUCCESSFULLY)
+    
+    @staticmethod
+    def filter_schedules(statement: Select, filters: BusScheduleFilter) -> Select:
+        if filters.bus_id:
+            statement = statement.where(Schedule.bus_id == filters.bus_id)
+        if filters.route_id:
+            statement = statement.where(Schedule.route_id == filters.route_id)
+        if filters.departure_from:
+            statement = statement.where(Schedule.departure_time >= filters.departure_from)
+        if filters.departure_to:
+            statement = statement.where(Schedule.departure_time < filters.departure_to)
+        return statement
+
+    async def get_all_bus_schedules(self, page: PageParams, filters: BusScheduleFilter) -> CursorPage[GetBusScheduleResponse]:
+        """
+            Get one page of bus schedules from the database.
+        """
+        statement = self.filter_schedules(
+            select(SCHEDULE_PROJECTION).join(Schedule.bus).join(Bus.company).join(Schedule.route),
+            filters
+        )
+
+        schedules = (await self.db.scalars(paginate(statement, Schedule, page))).all()
+        schedules, next_cursor = split_page(schedules, page)
+
+        return CursorPage[GetBusScheduleResponse](
+            items=schedules,
+            page_size=page.page_size,
+            next_cursor=next_cursor
+        )
     
-    def get_schedule_data_by_id(self, id: int):
-        return self.db.query(Schedule).filter(Schedule.id == id).first()
+    async def get_schedule_data_by_id(self, id: int):
+        return await self.db.scalar(select(Schedule).where(Schedule.id == id))
     
     def validate_schedule_exists(self, schedule: Schedule):
         if not schedule:
@@ -273,15 +481,63 @@ class BusService:
                 detail=SCHEDULE_NOT_FOUND
             )
     
-    def update_bus_schedule_by_id(self, id: int, request: BusScheduleRequest) -> BusResponse:
+    async def get_highest_booked_seat(self, schedule_ids: Select) -> int | None:
+        """
+            The highest seat sold on the given departures, to a ticket or a seat hold, or None when none is.
+        """
+        sold_seats = union_all(
+            select(Ticket.seat_number).where(
+                Ticket.schedule_id.in_(schedule_ids),
+                Ticket.status == TicketStatusEnum.BOOKED
+            ),
+            select(SeatHold.seat_number).where(SeatHold.schedule_id.in_(schedule_ids))
+        ).subquery()
+
+        return await self.db.scalar(select(func.max(sold_seats.c.seat_number)))
+
+    async def validate_seats_fit(self, schedule_ids: Select, total_seats: int):
+        """
+            Validate that the seats sold on departures exist on a bus with `total_seats` seats.
+            Seat inventories only grow, so a bus too small for its bookings has to be rejected.
+        """
+        highest_booked_seat = await self.get_highest_booked_seat(schedule_ids)
+
+        if highest_booked_seat is not None and highest_booked_seat > total_seats:
+            raise HTTPException(
+                status_code=409,
+                detail=BUS_HAS_FEWER_SEATS_THAN_BOOKED
+            )
+
+    async def validate_schedule_change(self, schedule: Schedule, request: BusScheduleRequest, bus: Bus):
+        """
+            Validate a change of a departure against the seats already sold on it. Their journeys
+            are legs of its route, so the route is fixed once a seat is sold, and a new bus must
+            have every sold seat.
+        """
+        schedule_ids = select(Schedule.id).where(Schedule.id == schedule.id)
+
+        if schedule.route_id != request.route_id and await self.get_highest_booked_seat(schedule_ids) is not None:
+            raise HTTPException(
+                status_code=409,
+                detail=SCHEDULE_ROUTE_HAS_BOOKINGS
+            )
+        if schedule.bus_id != request.bus_id:
+            await self.validate_seats_fit(schedule_ids, bus.total_seats)
+
+    async def update_bus_schedule_by_id(self, id: int, request: BusScheduleRequest) -> BusResponse:
         """
             Update an existing bus schedule by ID.
         """
-        schedule = self.get_schedule_data_by_id(id)
+        schedule = await self.get_schedule_data_by_id(id)
         self.validate_schedule_exists(schedule)
-        
-        bus = self.get_bus_data_by_id(request.bus_id)
-        self.validate_bus_exists(bus)
+        bus = await self.validate_bus_schedule(request, schedule.id)
+        await self.validate_schedule_change(schedule, request, bus)
+
+        if schedule.bus_id != request.bus_id:
+            await self.seat_inventory_service.resize_inventories(bus.total_seats, schedule_id=schedule.id)
+            await self.db.execute(
+                update(Ticket).where(Ticket.schedule_id == schedule.id).values(bus_id=bus.id, updated_at=func.now())
+            )
 
         schedule.bus_id = request.bus_id
         schedule.route_id = request.route_id
@@ -289,18 +545,30 @@ class BusService:
         schedule.arrival_time = request.arrival_time
         schedule.updated_at = func.now()
 
-        self.db.commit()
+        await self.commit_schedules()
 
         return BusResponse(message=BUS_SCHEDULE_UPDATED_SUCCESSFULLY)
 
-    def delete_bus_schedule_by_id(self, id: int) -> BusResponse:
+    async def validate_schedule_has_no_tickets(self, schedule_id: int):
+        """
+            Validate that no ticket, booked or cancelled, refers to a departure about to be deleted.
+        """
+        if await self.db.scalar(select(Ticket.id).where(Ticket.schedule_id == schedule_id).limit(1)):
+            raise HTTPException(
+                status_code=409,
+                detail=SCHEDULE_HAS_TICKETS
+            )
+
+    async def delete_bus_schedule_by_id(self, id: int) -> BusResponse:
         """
             Delete a bus schedule by ID.
         """
-        schedule = self.get_schedule_data_by_id(id)
+        schedule = await self.get_schedule_data_by_id(id)
         self.validate_schedule_exists(schedule)
+        await self.validate_schedule_has_no_tickets(schedule.id)
         
-        self.db.delete(schedule)
-        self.db.commit()
+        await self.db.delete(schedule)
+        await self.db.commit()
+        timetable_cache.invalidate(get_connected_schema(self.db))
 
         return BusResponse(message=BUS_SCHEDULE_DELETED_SUCCESSFULLY)
\ No newline at end of file
@@ -1,22 +1,34 @@
 from dataclasses import dataclass
 
-from automapper import mapper
 from fastapi import (
     Depends, 
     HTTPException
 )
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    func,
+    select
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.connectors.database_connector import (
-    get_tenant_db
+    get_async_tenant_db,
+    get_connected_schema
 )
 from app.entities.company import Company
+from app.models.base_response_model import CursorPage
 from app.models.company_models import (
+    CompanyFilter,
     CompanyRequest, 
     CompanyResponse,
     GetCompanyResponse
 )
+from app.models.pagination_models import PageParams
+from app.services.ticket_number_service import invalidate_company_prefix
+from app.utils.mappers import map_company
+from app.utils.pagination import (
+    paginate,
+    split_page
+)
 from app.utils.constants import (
     A_COMPANY_WITH_THIS_NAME_ALREADY_EXISTS, 
     A_COMPANY_WITH_THIS_EMAIL_ALREADY_EXISTS,
@@ -30,16 +42,16 @@ from app.utils.constants import (
 
 @dataclass
 class CompanyService:
-    db: Session = Depends(get_tenant_db)
+    db: AsyncSession = Depends(get_async_tenant_db)
     
-    def validate_company_name(self, name: str):
+    async def validate_company_name(self, name: str):
         """
             Validate company name for uniqueness.
         """
-        existing_company = (
-            self.db.query(Company)
-            .filter(func.lower(Company.name) == name.lower())
-            .first()
+        existing_company = await self.db.scalar(
+            select(Company)
+            .where(func.lower(Company.name) == name.lower())
+            .limit(1)
         )
 
         if existing_company:
@@ -48,14 +60,14 @@ class CompanyService:
                 detail=A_COMPANY_WITH_THIS_NAME_ALREADY_EXISTS
             )
 
-    def validate_company_email(self, email: str):
+    async def validate_company_email(self, email: str):
         """
             Validate company email for uniqueness.
         """
-        existing_company = (
-            self.db.query(Company)
-            .filter(func.lower(Company.email) == email.lower())
-            .first()
+        existing_company = await self.db.scalar(
+            select(Company)
+            .where(func.lower(Company.email) == email.lower())
+            .limit(1)
         )
 
         if existing_company:
@@ -64,12 +76,12 @@ class CompanyService:
                 detail=A_COMPANY_WITH_THIS_EMAIL_ALREADY_EXISTS
             )
 
-    def create_company(self, request: CompanyRequest) -> CompanyResponse:
+    async def create_company(self, request: CompanyRequest) -> CompanyResponse:
         """
             Create a new company in the database.
         """
-        self.validate_company_name(request.name)
-        self.validate_company_email(request.email)
+        await self.validate_company_name(request.name)
+        await self.validate_company_email(request.email)
 
         company = Company(
             name=request.name,
@@ -80,18 +92,31 @@ class CompanyService:
         )
 
         self.db.add(company)
-        self.db.commit()
+        await self.db.commit()
         
         return CompanyResponse(
             message=COMPANY_CREATED_SUCCESSFULLY
         )
     
-    def get_all_companies(self) -> list[GetCompanyResponse]:
+    async def get_all_companies(self, page: PageParams, filters: CompanyFilter) -> CursorPage[GetCompanyResponse]:
         """
-            Get all companies from the database.
+            Get one page of companies from the database.
         """
-        companies = self.db.query(Company).all()
-        return [mapper.to(GetCompanyResponse).map(company) for company in companies]
+        statement = select(Company)
+
+        if filters.name:
+            statement = statement.where(func.lower(Company.name).startswith(filters.name.lower()))
+        if filters.is_active is not None:
+            statement = statement.where(Company.is_active == filters.is_active)
+
+        companies = (await self.db.scalars(paginate(statement, Company, page))).all()
+        companies, next_cursor = split_page(companies, page)
+
+        return CursorPage[GetCompanyResponse](
+            items=[map_company(company) for company in companies],
+            page_size=page.page_size,
+            next_cursor=next_cursor
+        )
     
     def validate_company_exists(self, company: Company):
         """
@@ -103,43 +128,43 @@ class CompanyService:
                 detail=COMPANY_NOT_FOUND
             )
 
-    def get_company_data_by_id(self, id: int) -> Company:
+    async def get_company_data_by_id(self, id: int) -> Company:
         """
             Get company data by ID.
         """
-        return self.db.query(Company).filter(Company.id == id).first()
+        return await self.db.scalar(select(Company).where(Company.id == id))
     
-    def get_company_by_id(self, id: int) -> GetCompanyResponse:
+    async def get_company_by_id(self, id: int) -> GetCompanyResponse:
         """
             Get a company by ID.
         """
-        company = self.get_company_data_by_id(id)
+        company = await self.get_company_data_by_id(id)
         self.validate_company_exists(company)
 
-        return mapper.to(GetCompanyResponse).map(company)
+        return map_company(company)
     
-    def validate_update_name(self, existing_name: str, new_name: str):
+    async def validate_update_name(self, existing_name: str, new_name: str):
         """
             Validate company name for uniqueness during update.
         """
         if existing_name.lower() != new_name.lower():
-            self.validate_company_name(new_name)
+            await self.validate_company_name(new_name)
     
-    def validate_update_email(self, existing_email: str, new_email: str):
+    async def validate_update_email(self, existing_email: str, new_email: str):
         """
             Validate company email for uniqueness during update.
         """
         if existing_email.lower() != new_email.lower():
-            self.validate_company_email(new_email)
+            await self.validate_company_email(new_email)
     
-    def update_company_by_id(self, id: int, request: CompanyRequest) -> CompanyResponse:
+    async def update_company_by_id(self, id: int, request: CompanyRequest) -> CompanyResponse:
         """
             Update company data by ID.
         """
-        company = self.get_company_data_by_id(id)
+        company = await self.get_company_data_by_id(id)
         self.validate_company_exists(company)
-        self.validate_update_name(company.name, request.name)
-        self.validate_update_email(company.email, request.email)
+        await self.validate_update_name(company.name, request.name)
+        await self.validate_update_email(company.email, request.email)
 
         company.name = request.name
         company.contact_person_name = request.contact_person_name
@@ -148,18 +173,20 @@ class CompanyService:
         company.phone_number = request.phone_number
         company.updated_at = func.now()
 
-        self.db.commit()
+        await self.db.commit()
+        invalidate_company_prefix(get_connected_schema(self.db), company.id)
 
         return CompanyResponse(message=COMPANY_UPDATED_SUCCESSFULLY)
     
-    def delete_company_by_id(self, id: int) -> CompanyResponse:
+    async def delete_company_by_id(self, id: int) -> CompanyResponse:
         """
             Delete company by ID.
         """
-        company = self.get_company_data_by_id(id)
+        company = await self.get_company_data_by_id(id)
         self.validate_company_exists(company)
 
-        self.db.delete(company)
-        self.db.commit()
+        await self.db.delete(company)
+        await self.db.commit()
+        invalidate_company_prefix(get_connected_schema(self.db), id)
 
         return CompanyResponse(message=COMPANY_DELETED_SUCCESSFULLY)
\ No newline at end of file
@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from typing import (
+    AsyncIterator,
+    Sequence
+)
+
+import anyio
+from fastapi import Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import (
+    Row,
+    Select,
+    select
+)
+
+from app.connectors.database_connector import (
+    build_async_db_session,
+    get_tenant_schema
+)
+from app.entities.bus import Bus
+from app.entities.route import Route
+from app.entities.schedule import Schedule
+from app.entities.ticket import Ticket
+from app.models.bus_models import BusScheduleFilter
+from app.models.ticket_models import TicketFilter
+from app.services.bus_service import BusService
+from app.services.ticket_service import TicketService
+from app.utils.constants import EXPORT_BATCH_SIZE
+from app.utils.enums import ExportFormatEnum
+from app.utils.exports import (
+    EXPORT_MEDIA_TYPES,
+    encode_export
+)
+
+
+@dataclass
+class ExportService:
+    """
+        Streams whole tables to reporting clients as NDJSON or CSV.
+
+        Rows are read through a server-side cursor EXPORT_BATCH_SIZE at a time and each batch is
+        encoded and sent before the next is fetched, so memory stays flat whatever the row count.
+        Exports are ordered by the (created_at, id) index, so rows flow without a sort step first.
+        The response body is produced after the request handler has returned, when request-scoped
+        sessions are already closed, so every export opens and closes a session of its own.
+    """
+    schema: str = Depends(get_tenant_schema)
+
+    async def stream_rows(self, statement: Select) -> AsyncIterator[Sequence[Row]]:
+        db = await build_async_db_session(self.schema)
+
+        try:
+            result = await db.stream(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+            async for rows in result.partitions():
+                yield rows
+        finally:
+            # Also runs when the client disconnects and the stream is cancelled
+            with anyio.CancelScope(shield=True):
+                await db.close()
+
+    def export(self, name: str, statement: Select, export_format: ExportFormatEnum) -> StreamingResponse:
+        columns = list(statement.selected_columns.keys())
+
+        return StreamingResponse(
+            encode_export(columns, self.stream_rows(statement), export_format),
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'}
+        )
+
+    def export_tickets(self, filters: TicketFilter, export_format: ExportFormatEnum) -> StreamingResponse:
+        """
+            Stream every ticket matching the filters, in booking order.
+        """
+        statement = select(
+            Ticket.id,
+            Ticket.ticket_number,
+            Ticket.schedule_id,
+            Ticket.bus_id,
+            Bus.bus_number,
+            Ticket.seat_number,
+            Ticket.boarding_seq,
+            Ticket.alighting_seq,
+            Ticket.passenger_name,
+            Ticket.passenger_contact,
+            Ticket.passenger_email,
+            Ticket.status,
+            Ticket.created_at,
+            Ticket.updated_at
+        ).join(Ticket.bus)
+
+        statement = TicketService.filter_tickets(statement, filters).order_by(Ticket.created_at, Ticket.id)
+        return self.export("tickets", statement, export_format)
+
+    def export_schedules(self, filters: BusScheduleFilter, export_format: ExportFormatEnum) -> StreamingResponse:
+        """
+            Stream every bus schedule matching the filters, in creation order.
+        """
+        statement = select(
+            Schedule.id,
+            Schedule.bus_id,
+            Bus.bus_number,
+            Schedule.route_id,
+            Route.source,
+            Route.destination,
+            Schedule.departure_time,
+            Schedule.arrival_time,
+            Schedule.template_id,
+            Schedule.service_date,
+            Schedule.created_at,
+            Schedule.updated_at
+        ).join(Schedule.bus).join(Schedule.route)
+
+        statement = BusService.filter_schedules(statement, filters).order_by(Schedule.created_at, Schedule.id)
+        return self.export("schedules", statement, export_format)
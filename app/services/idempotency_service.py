@@ -0,0 +1,196 @@
+import hashlib
+import traceback
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import (
+    Any,
+    Awaitable,
+    Callable
+)
+
+from fastapi import (
+    Depends,
+    HTTPException,
+    Request
+)
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import (
+    delete,
+    func,
+    select,
+    update
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.connectors.database_connector import (
+    build_db_session,
+    get_async_tenant_db,
+    get_tenant_schemas
+)
+from app.entities.idempotency_key import IdempotencyKey
+from app.models.base_response_model import ApiResponse
+from app.utils.constants import (
+    IDEMPOTENCY_KEY,
+    IDEMPOTENCY_KEY_REUSED,
+    IDEMPOTENCY_KEY_TTL_HOURS,
+    IDEMPOTENT_REQUEST_IN_PROGRESS,
+    INVALID_IDEMPOTENCY_KEY,
+    MAX_IDEMPOTENCY_KEY_LENGTH
+)
+
+
+@dataclass
+class IdempotencyService:
+    """
+        Honors the Idempotency-Key header of create endpoints.
+
+        The first request with a key claims it in the tenant's idempotency_keys table inside the same
+        transaction as the work it guards, so the claim commits together with the created rows and a
+        failed request releases it. The response is stored against the key, and a retry with the same
+        key and body gets that response back without running the endpoint again. Keys expire after
+        IDEMPOTENCY_KEY_TTL_HOURS and can then be claimed afresh.
+    """
+    request: Request
+    db: AsyncSession = Depends(get_async_tenant_db)
+
+    def get_key(self) -> str | None:
+        key = self.request.headers.get(IDEMPOTENCY_KEY)
+
+        if key is not None and not 0 < len(key) <= MAX_IDEMPOTENCY_KEY_LENGTH:
+            raise HTTPException(
+                status_code=400,
+                detail=INVALID_IDEMPOTENCY_KEY
+            )
+        return key
+
+    def get_owner(self) -> str:
+        return self.request.state.user.email
+
+    def fingerprint(self, body: BaseModel) -> str:
+        """
+            Hash what identifies a request, so a key reused for a different request is detected.
+        """
+        digest = hashlib.sha256(f"{self.request.method} {self.request.url.path}\n".encode())
+        digest.update(body.model_dump_json().encode())
+        return digest.hexdigest()
+
+    async def claim(self, key: str, request_hash: str) -> bool:
+        """
+            Claim a key for this request. A live key of an earlier request can't be claimed,
+            an expired one is taken over.
+        """
+        statement = insert(IdempotencyKey).values(
+            key=key,
+            owner=self.get_owner(),
+            request_hash=request_hash,
+            created_at=func.now(),
+            expires_at=func.now() + timedelta(hours=IDEMPOTENCY_KEY_TTL_HOURS)
+        )
+        statement = statement.on_conflict_do_update(
+            constraint="uq_idempotency_keys_owner_key",
+            set_={
+                "request_hash": statement.excluded.request_hash,
+                "status_code": None,
+                "response": None,
+                "created_at": statement.excluded.created_at,
+                "expires_at": statement.excluded.expires_at
+            },
+            where=IdempotencyKey.expires_at < func.now()
+        ).returning(IdempotencyKey.id)
+
+        return await self.db.scalar(statement) is not None
+
+    async def replay(self, key: str, request_hash: str) -> JSONResponse:
+        stored = await self.db.scalar(
+            select(IdempotencyKey).where(IdempotencyKey.owner == self.get_owner(), IdempotencyKey.key == key)
+        )
+
+        if stored.request_hash != request_hash:
+            raise HTTPException(
+                status_code=422,
+                detail=IDEMPOTENCY_KEY_REUSED
+            )
+        if stored.status_code is None:
+            raise HTTPException(
+                status_code=409,
+                detail=IDEMPOTENT_REQUEST_IN_PROGRESS
+            )
+
+        return JSONResponse(stored.response, status_code=stored.status_code, headers={"Idempotent-Replayed": "true"})
+
+    async def release(self, key: str):
+        """
+            Drop the claim of a failed request, including one its work had already committed.
+        """
+        await self.db.rollback()
+        await self.db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.owner == self.get_owner(),
+                IdempotencyKey.key == key,
+                IdempotencyKey.status_code.is_(None)
+            )
+        )
+        await self.db.commit()
+
+    async def execute(self, body: BaseModel, call: Callable[[], Awaitable[Any]]) -> ApiResponse | JSONResponse:
+        """
+            Run a create endpoint's work once per Idempotency-Key, replaying the stored response
+            on retries. Requests without the header run as usual.
+        """
+        key = self.get_key()
+
+        if key is None:
+            return ApiResponse(data=await call())
+
+        request_hash = self.fingerprint(body)
+
+        if not await self.claim(key, request_hash):
+            return await self.replay(key, request_hash)
+
+        try:
+            response = ApiResponse(data=await call())
+        except Exception:
+            await self.release(key)
+            raise
+
+        await self.db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.owner == self.get_owner(), IdempotencyKey.key == key)
+            .values(status_code=self.request.scope["route"].status_code or 200, response=response.model_dump(mode="json"))
+        )
+        await self.db.commit()
+
+        return response
+
+    @staticmethod
+    def purge_expired(schema: str):
+        """
+            Delete the expired idempotency keys of a tenant.
+        """
+        db = build_db_session(schema)
+
+        try:
+            db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= func.now()))
+            db.commit()
+        except:
+            db.rollback()
+            traceback.print_exc()
+        finally:
+            db.close()
+
+    @staticmethod
+    def purge_all_expired():
+        """
+            Purge the expired idempotency keys of every tenant. Runs on the background scheduler
+            of each worker.
+        """
+        try:
+            schemas = get_tenant_schemas()
+        except:
+            traceback.print_exc()
+            return
+
+        for schema in schemas:
+            IdempotencyService.purge_expired(schema)
@@ -0,0 +1,145 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta
+)
+
+from fastapi import (
+    Depends,
+    HTTPException
+)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.connectors.database_connector import (
+    get_async_tenant_db,
+    get_connected_schema
+)
+from app.entities.bus import Bus
+from app.entities.route_stop import RouteStop
+from app.entities.schedule import Schedule
+from app.models.bus_models import (
+    JourneyLegResponse,
+    JourneyResponse
+)
+from app.utils.constants import SOURCE_AND_DESTINATION_MUST_BE_DIFFERENT
+from app.utils.journey_planner import (
+    Timetable,
+    Trip,
+    interpolate_stop_times,
+    timetable_cache
+)
+from app.utils.stop_index import normalize_stop
+
+# Departures of the following day are kept in a day's timetable for overnight connections
+TIMETABLE_HORIZON = timedelta(days=2)
+
+
+@dataclass
+class JourneyPlannerService:
+    """
+        Plans journeys with connections between departures of different routes.
+
+        The timetable of a service day is built once per tenant and cached, so a query only
+        scans the precomputed connections in memory.
+    """
+    db: AsyncSession = Depends(get_async_tenant_db)
+
+    async def build_timetable(self, service_day: date) -> Timetable:
+        """
+            Load the departures of a service day with their route stops and time every stop.
+        """
+        day_start = datetime.combine(service_day, time.min)
+        schedules = (await self.db.execute(
+            select(Schedule.id, Schedule.route_id, Schedule.departure_time, Schedule.arrival_time)
+            .join(Bus, Bus.id == Schedule.bus_id)
+            .where(
+                Schedule.departure_time >= day_start,
+                Schedule.departure_time < day_start + TIMETABLE_HORIZON,
+                Bus.is_active.is_(True)
+            )
+        )).all()
+
+        route_stops = defaultdict(list)
+        if schedules:
+            rows = (await self.db.execute(
+                select(RouteStop.route_id, RouteStop.seq, RouteStop.city, RouteStop.offset_minutes)
+                .where(RouteStop.route_id.in_({schedule.route_id for schedule in schedules}))
+                .order_by(RouteStop.route_id, RouteStop.seq)
+            )).all()
+
+            for route_id, seq, city, offset_minutes in rows:
+                route_stops[route_id].append((seq, city, offset_minutes))
+
+        return Timetable(
+            Trip(
+                schedule_id=schedule.id,
+                route_id=schedule.route_id,
+                stops=interpolate_stop_times(
+                    schedule.departure_time, schedule.arrival_time, route_stops[schedule.route_id]
+                )
+            )
+            for schedule in schedules
+        )
+
+    async def get_timetable(self, service_day: date) -> Timetable:
+        schema = get_connected_schema(self.db)
+        timetable = timetable_cache.get(schema, service_day)
+
+        if timetable is None:
+            timetable = await self.build_timetable(service_day)
+            timetable_cache.put(schema, service_day, timetable)
+
+        return timetable
+
+    async def plan_journeys(
+        self,
+        from_stop: str,
+        to_stop: str,
+        travel_date: date,
+        min_transfer_minutes: int,
+        max_transfers: int
+    ) -> list[JourneyResponse]:
+        """
+            Get the journeys leaving on `travel_date`, from the one with the fewest transfers
+            to the one arriving earliest.
+        """
+        if normalize_stop(from_stop) == normalize_stop(to_stop):
+            raise HTTPException(
+                status_code=400,
+                detail=SOURCE_AND_DESTINATION_MUST_BE_DIFFERENT
+            )
+
+        day_start = datetime.combine(travel_date, time.min)
+        timetable = await self.get_timetable(travel_date)
+        journeys = timetable.plan(
+            from_stop,
+            to_stop,
+            earliest_departure=day_start,
+            latest_departure=day_start + timedelta(days=1),
+            min_transfer=timedelta(minutes=min_transfer_minutes),
+            max_transfers=max_transfers
+        )
+
+        return [
+            JourneyResponse(
+                transfers=journey.transfers,
+                departure_time=journey.departure_time,
+                arrival_time=journey.arrival_time,
+                legs=[
+                    JourneyLegResponse(
+                        schedule_id=leg.schedule_id,
+                        route_id=leg.route_id,
+                        from_stop=leg.from_stop,
+                        to_stop=leg.to_stop,
+                        departure_time=leg.departure_time,
+                        arrival_time=leg.arrival_time
+                    )
+                    for leg in journey.legs
+                ]
+            )
+            for journey in journeys
+        ]
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from app.models.metrics_models import RuntimeMetricsResponse
+from app.utils.auth_dependencies import token_cache
+from app.utils.hasher import password_verifier
+
+
+@dataclass
+class MetricsService:
+    """
+        Service for reading the runtime metrics of this worker process.
+    """
+
+    def get_metrics(self) -> RuntimeMetricsResponse:
+        return RuntimeMetricsResponse(
+            password_verifier=password_verifier.metrics(),
+            token_cache=token_cache.metrics()
+        )
@@ -0,0 +1,142 @@
+import hashlib
+import secrets
+import traceback
+import uuid
+from dataclasses import dataclass
+from datetime import (
+    datetime,
+    timedelta
+)
+
+from fastapi import (
+    Depends,
+    HTTPException,
+    status
+)
+from sqlalchemy import (
+    Select,
+    delete,
+    func,
+    insert,
+    select,
+    update
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.connectors.database_connector import (
+    get_async_master_db,
+    get_master_database
+)
+from app.entities.refresh_token import RefreshToken
+from app.entities.user import User
+from app.utils.constants import (
+    INVALID_REFRESH_TOKEN,
+    REFRESH_TOKEN_EXPIRE_DAYS
+)
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+@dataclass
+class RefreshTokenService:
+    """
+        Rotating refresh tokens, stored hashed in the master refresh_tokens table.
+
+        A login starts a family of tokens that share one expiry, REFRESH_TOKEN_EXPIRE_DAYS out.
+        Each refresh exchanges the presented token for a new one of the same family, so a token
+        works once. Presenting a used token means it was stolen or replayed, and revokes its whole
+        family, as does logging out.
+    """
+    db: AsyncSession = Depends(get_async_master_db)
+
+    async def issue(self, user_id: int, family_id: str | None = None, expires_at: datetime | None = None) -> str:
+        """
+            Store and return a new refresh token, starting a new family unless one is given.
+            Commits, together with the rotation of the token it replaces.
+        """
+        token = secrets.token_urlsafe(32)
+
+        await self.db.execute(
+            insert(RefreshToken).values(
+                token_hash=hash_token(token),
+                family_id=family_id or str(uuid.uuid4()),
+                user_id=user_id,
+                created_at=func.now(),
+                expires_at=expires_at or func.now() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+            )
+        )
+        await self.db.commit()
+
+        return token
+
+    async def rotate(self, token: str) -> tuple[User, str]:
+        """
+            Exchange a live refresh token of an active user for a new one, returning the user.
+        """
+        rotated = (await self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == hash_token(token),
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > func.now(),
+                RefreshToken.user_id.in_(select(User.id).where(User.is_active == True))
+            )
+            .values(used_at=func.now())
+            .returning(RefreshToken.user_id, RefreshToken.family_id, RefreshToken.expires_at)
+        )).first()
+
+        if rotated is None:
+            await self.revoke_reused(token)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=INVALID_REFRESH_TOKEN
+            )
+
+        user = await self.db.get(User, rotated.user_id)
+        new_token = await self.issue(user.id, rotated.family_id, rotated.expires_at)
+
+        return user, new_token
+
+    async def revoke_reused(self, token: str):
+        """
+            Revoke the family of a token that was already exchanged.
+        """
+        reused_family = (
+            select(RefreshToken.family_id)
+            .where(RefreshToken.token_hash == hash_token(token), RefreshToken.used_at.is_not(None))
+        )
+        await self.revoke_families(reused_family)
+
+    async def revoke(self, token: str):
+        """
+            End the session a refresh token belongs to.
+        """
+        family = select(RefreshToken.family_id).where(RefreshToken.token_hash == hash_token(token))
+        await self.revoke_families(family)
+
+    async def revoke_families(self, families: Select):
+        await self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id.in_(families), RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+        )
+        await self.db.commit()
+
+    @staticmethod
+    def purge_expired():
+        """
+            Delete expired refresh tokens. Runs on the background scheduler of each worker.
+        """
+        db = get_master_database()
+
+        try:
+            db.execute(delete(RefreshToken).where(RefreshToken.expires_at <= func.now()))
+            db.commit()
+        except:
+            db.rollback()
+            traceback.print_exc()
+        finally:
+            db.close()
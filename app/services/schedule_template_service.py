@@ -0,0 +1,321 @@
+from dataclasses import dataclass
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta
+)
+
+from fastapi import (
+    Depends,
+    HTTPException
+)
+from sqlalchemy import (
+    literal_column,
+    or_,
+    select
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.connectors.database_connector import (
+    get_async_tenant_db,
+    get_connected_schema
+)
+from app.entities.bus import Bus
+from app.entities.schedule import Schedule
+from app.entities.schedule_template import ScheduleTemplate
+from app.models.base_response_model import CursorPage
+from app.models.bus_models import (
+    BusResponse,
+    GetScheduleTemplateResponse,
+    ScheduleTemplateRequest,
+    TimetableEntryResponse,
+    TimetableFilter
+)
+from app.models.pagination_models import PageParams
+from app.services.bus_service import BusService
+from app.services.seat_inventory_service import SeatInventoryService
+from app.utils.constants import (
+    BUS_SCHEDULE_OVERLAPS,
+    INVALID_DATE_RANGE,
+    MAX_TIMETABLE_DAYS,
+    SCHEDULE_TEMPLATE_CREATED_SUCCESSFULLY,
+    SCHEDULE_TEMPLATE_DELETED_SUCCESSFULLY,
+    SCHEDULE_TEMPLATE_NOT_FOUND,
+    TEMPLATE_DOES_NOT_RUN_ON_THIS_DATE,
+    WEEKDAYS_REQUIRED_FOR_WEEKLY_TEMPLATES
+)
+from app.utils.enums import RecurrenceEnum
+from app.utils.journey_planner import timetable_cache
+from app.utils.pagination import (
+    paginate,
+    split_page
+)
+from app.utils.schedule_templates import (
+    departure_window,
+    expand_template,
+    find_overlapping_departure,
+    mask_to_weekdays,
+    runs_on,
+    templates_overlap,
+    weekdays_to_mask
+)
+
+
+@dataclass
+class ScheduleTemplateService:
+    """
+        Recurring departures that are expanded on read and only stored as schedules once booked.
+
+        A materialized departure is keyed by (template_id, service_date), so concurrent first
+        bookings of the same departure converge on one schedule row through INSERT ... ON CONFLICT.
+    """
+    db: AsyncSession = Depends(get_async_tenant_db)
+    bus_service: BusService = Depends(BusService)
+    seat_inventory_service: SeatInventoryService = Depends(SeatInventoryService)
+
+    def validate_date_range(self, start_date: date, end_date: date | None, max_days: int | None = None):
+        if end_date is None:
+            return
+
+        if end_date < start_date or (max_days and (end_date - start_date).days >= max_days):
+            raise HTTPException(
+                status_code=400,
+                detail=INVALID_DATE_RANGE
+            )
+
+    async def create_template(self, request: ScheduleTemplateRequest) -> BusResponse:
+        """
+            Create a recurring schedule template.
+        """
+        if request.recurrence == RecurrenceEnum.WEEKLY and not request.weekdays:
+            raise HTTPException(
+                status_code=400,
+                detail=WEEKDAYS_REQUIRED_FOR_WEEKLY_TEMPLATES
+            )
+
+        self.validate_date_range(request.valid_from, request.valid_until)
+        self.bus_service.validate_bus_exists(await self.bus_service.get_bus_data_by_id(request.bus_id))
+        await self.bus_service.validate_routes_exist({request.route_id})
+
+        template = ScheduleTemplate(
+            bus_id=request.bus_id,
+            route_id=request.route_id,
+            departure_time=request.departure_time,
+            duration_minutes=request.duration_minutes,
+            recurrence=request.recurrence,
+            weekdays=weekdays_to_mask(request.weekdays),
+            valid_from=request.valid_from,
+            valid_until=request.valid_until,
+            excluded_dates=sorted({excluded_date.isoformat() for excluded_date in request.excluded_dates})
+        )
+
+        await self.validate_no_overlapping_departures(template)
+
+        self.db.add(template)
+        await self.db.commit()
+
+        return BusResponse(message=SCHEDULE_TEMPLATE_CREATED_SUCCESSFULLY)
+
+    async def validate_no_overlapping_departures(self, template: ScheduleTemplate):
+        """
+            Validate that none of a new template's departures puts its bus on the road during
+            another of them, a stored trip of the bus, or a departure of its other templates.
+            Checked up front so a clash isn't first found by a booking that materializes it.
+        """
+        first_departure = datetime.combine(template.valid_from, time.min)
+        schedule_statement = select(Schedule.departure_time, Schedule.arrival_time).where(
+            Schedule.bus_id == template.bus_id,
+            Schedule.arrival_time > first_departure
+        )
+        template_statement = select(ScheduleTemplate).where(
+            ScheduleTemplate.bus_id == template.bus_id,
+            ScheduleTemplate.is_active.is_(True),
+            or_(ScheduleTemplate.valid_until.is_(None), ScheduleTemplate.valid_until >= template.valid_from)
+        )
+
+        if template.valid_until:
+            schedule_statement = schedule_statement.where(
+                Schedule.departure_time < departure_window(template, template.valid_until)[1]
+            )
+            template_statement = template_statement.where(ScheduleTemplate.valid_from <= template.valid_until)
+
+        schedules = (await self.db.execute(schedule_statement)).all()
+        others = (await self.db.scalars(template_statement)).all()
+
+        if (
+            templates_overlap(template, template)
+            or any(find_overlapping_departure(template, *schedule) for schedule in schedules)
+            or any(templates_overlap(template, other) for other in others)
+        ):
+            raise HTTPException(
+                status_code=409,
+                detail=BUS_SCHEDULE_OVERLAPS
+            )
+
+    def to_template_response(self, template: ScheduleTemplate) -> GetScheduleTemplateResponse:
+        return GetScheduleTemplateResponse(
+            id=template.id,
+            bus_id=template.bus_id,
+            route_id=template.route_id,
+            departure_time=template.departure_time,
+            duration_minutes=template.duration_minutes,
+            recurrence=template.recurrence,
+            weekdays=mask_to_weekdays(template.weekdays),
+            valid_from=template.valid_from,
+            valid_until=template.valid_until,
+            excluded_dates=template.excluded_dates,
+            is_active=template.is_active,
+            created_at=template.created_at,
+            updated_at=template.updated_at
+        )
+
+    async def get_all_templates(self, page: PageParams) -> CursorPage[GetScheduleTemplateResponse]:
+        """
+            Get one page of schedule templates.
+        """
+        templates = (await self.db.scalars(paginate(select(ScheduleTemplate), ScheduleTemplate, page))).all()
+        templates, next_cursor = split_page(templates, page)
+
+        return CursorPage[GetScheduleTemplateResponse](
+            items=[self.to_template_response(template) for template in templates],
+            page_size=page.page_size,
+            next_cursor=next_cursor
+        )
+
+    async def get_active_template(self, id: int) -> ScheduleTemplate:
+        template = await self.db.scalar(
+            select(ScheduleTemplate).where(ScheduleTemplate.id == id, ScheduleTemplate.is_active.is_(True))
+        )
+
+        if not template:
+            raise HTTPException(
+                status_code=404,
+                detail=SCHEDULE_TEMPLATE_NOT_FOUND
+            )
+        return template
+
+    async def delete_template_by_id(self, id: int) -> BusResponse:
+        """
+            Delete a schedule template. Departures already materialized from it are kept.
+        """
+        template = await self.get_active_template(id)
+
+        await self.db.delete(template)
+        await self.db.commit()
+
+        return BusResponse(message=SCHEDULE_TEMPLATE_DELETED_SUCCESSFULLY)
+
+    async def materialize_departure(self, template_id: int, service_date: date) -> int:
+        """
+            Get the schedule ID of a template's departure, storing the departure on first use.
+
+            One statement either inserts the departure or returns the existing one; `xmax = 0`
+            only holds for a freshly inserted row, which is when its seat inventory is created.
+        """
+        template = await self.get_active_template(template_id)
+
+        if not runs_on(template, service_date):
+            raise HTTPException(
+                status_code=400,
+                detail=TEMPLATE_DOES_NOT_RUN_ON_THIS_DATE
+            )
+
+        departure_time, arrival_time = departure_window(template, service_date)
+        statement = insert(Schedule).values(
+            bus_id=template.bus_id,
+            route_id=template.route_id,
+            departure_time=departure_time,
+            arrival_time=arrival_time,
+            template_id=template.id,
+            service_date=service_date
+        )
+        statement = statement.on_conflict_do_update(
+            constraint="uq_schedules_template_service_date",
+            set_={"template_id": statement.excluded.template_id}
+        ).returning(Schedule.id, literal_column("xmax = 0").label("inserted"))
+
+        try:
+            schedule = (await self.db.execute(statement)).one()
+        except IntegrityError as e:
+            await self.bus_service.raise_schedule_conflict(e)
+
+        if schedule.inserted:
+            total_seats = await self.db.scalar(select(Bus.total_seats).where(Bus.id == template.bus_id))
+            self.seat_inventory_service.create_inventory(schedule.id, total_seats)
+            timetable_cache.invalidate(get_connected_schema(self.db))
+
+        return schedule.id
+
+    async def get_timetable(self, filters: TimetableFilter) -> list[TimetableEntryResponse]:
+        """
+            Get every departure between two days: stored schedules plus template departures
+            expanded on the fly, without storing anything.
+        """
+        self.validate_date_range(filters.start_date, filters.end_date, MAX_TIMETABLE_DAYS)
+        window_start = datetime.combine(filters.start_date, time.min)
+        window_end = datetime.combine(filters.end_date, time.min) + timedelta(days=1)
+
+        schedule_statement = select(Schedule).where(
+            Schedule.departure_time >= window_start,
+            Schedule.departure_time < window_end
+        )
+        template_statement = select(ScheduleTemplate).where(
+            ScheduleTemplate.is_active.is_(True),
+            ScheduleTemplate.valid_from <= filters.end_date,
+            or_(ScheduleTemplate.valid_until.is_(None), ScheduleTemplate.valid_until >= filters.start_date)
+        )
+
+        if filters.bus_id:
+            schedule_statement = schedule_statement.where(Schedule.bus_id == filters.bus_id)
+            template_statement = template_statement.where(ScheduleTemplate.bus_id == filters.bus_id)
+        if filters.route_id:
+            schedule_statement = schedule_statement.where(Schedule.route_id == filters.route_id)
+            template_statement = template_statement.where(ScheduleTemplate.route_id == filters.route_id)
+
+        schedules = (await self.db.scalars(schedule_statement)).all()
+        templates = (await self.db.scalars(template_statement)).all()
+        materialized = set()
+
+        if templates:
+            # Looked up by key rather than taken from `schedules`, as a stored departure may have been moved
+            materialized = set((await self.db.execute(
+                select(Schedule.template_id, Schedule.service_date)
+                .where(
+                    Schedule.template_id.in_([template.id for template in templates]),
+                    Schedule.service_date >= filters.start_date,
+                    Schedule.service_date <= filters.end_date
+                )
+            )).all())
+
+        entries = [
+            TimetableEntryResponse(
+                schedule_id=schedule.id,
+                template_id=schedule.template_id,
+                service_date=schedule.service_date or schedule.departure_time.date(),
+                bus_id=schedule.bus_id,
+                route_id=schedule.route_id,
+                departure_time=schedule.departure_time,
+                arrival_time=schedule.arrival_time
+            )
+            for schedule in schedules
+        ]
+
+        for template in templates:
+            for service_date in expand_template(template, filters.start_date, filters.end_date):
+                if (template.id, service_date) in materialized:
+                    continue
+
+                departure_time, arrival_time = departure_window(template, service_date)
+                entries.append(TimetableEntryResponse(
+                    template_id=template.id,
+                    service_date=service_date,
+                    bus_id=template.bus_id,
+                    route_id=template.route_id,
+                    departure_time=departure_time,
+                    arrival_time=arrival_time
+                ))
+
+        return sorted(entries, key=lambda entry: (entry.departure_time, entry.bus_id))
@@ -0,0 +1,212 @@
+import traceback
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+
+import sqlalchemy as sa
+from fastapi import (
+    Depends,
+    HTTPException,
+    Request
+)
+from sqlalchemy import (
+    Update,
+    delete,
+    func,
+    insert,
+    select,
+    update
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.connectors.database_connector import (
+    build_db_session,
+    get_async_tenant_db,
+    get_tenant_schemas
+)
+from app.entities.seat_hold import SeatHold
+from app.entities.seat_inventory import SeatInventory
+from app.models.ticket_models import SeatHoldResponse
+from app.utils.constants import (
+    SEAT_HOLD_CREATED_SUCCESSFULLY,
+    SEAT_HOLD_NOT_FOUND
+)
+
+
+def release_holds(*criteria) -> Update:
+    """
+        One statement that deletes the seat holds matching `criteria` and gives their legs back
+        to the seat inventories, however many holds and departures that covers.
+
+        The holds are deleted in a CTE, their masks OR-ed together per seat, and each affected
+        inventory's mask array is rebuilt with those bits cleared. Returns the affected schedule IDs.
+    """
+    released = (
+        delete(SeatHold)
+        .where(*criteria)
+        .returning(SeatHold.schedule_id, SeatHold.seat_number, SeatHold.journey_mask)
+        .cte("released_holds")
+    )
+    freed = (
+        select(
+            released.c.schedule_id,
+            released.c.seat_number,
+            func.bit_or(released.c.journey_mask).label("journey_mask")
+        )
+        .group_by(released.c.schedule_id, released.c.seat_number)
+        .cte("freed_seats")
+    )
+    seats = (
+        func.unnest(SeatInventory.segment_masks)
+        .table_valued("segment_mask", with_ordinality="seat_number")
+        .render_derived()
+    )
+    freed_mask = func.coalesce(freed.c.journey_mask, 0)
+
+    segment_masks = (
+        select(func.array_agg(aggregate_order_by(
+            seats.c.segment_mask.bitwise_and(freed_mask.bitwise_not()),
+            seats.c.seat_number
+        )))
+        .select_from(seats.outerjoin(freed, sa.and_(
+            freed.c.schedule_id == SeatInventory.schedule_id,
+            freed.c.seat_number == seats.c.seat_number
+        )))
+        .scalar_subquery()
+    )
+    released_count = (
+        select(func.count())
+        .where(released.c.schedule_id == SeatInventory.schedule_id)
+        .scalar_subquery()
+    )
+
+    return (
+        update(SeatInventory)
+        .where(SeatInventory.schedule_id.in_(select(freed.c.schedule_id)))
+        .values(
+            segment_masks=segment_masks,
+            booked_count=SeatInventory.booked_count - released_count,
+            updated_at=func.now()
+        )
+        .returning(SeatInventory.schedule_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+@dataclass
+class SeatHoldService:
+    """
+        Short-lived seat holds, taken while passengers fill in their details.
+
+        A hold sells the journey's legs on its seats in seat_inventories like a booking does, so
+        a held seat is unavailable to everyone else, and records them in seat_holds. Booking a
+        held seat then only has to delete its hold, without touching the hot inventory row. Holds
+        that are neither booked nor released are given back by the sweeper once they expire.
+    """
+    request: Request
+    db: AsyncSession = Depends(get_async_tenant_db)
+
+    def get_owner(self) -> str:
+        return self.request.state.user.email
+
+    async def create_hold(self, schedule_id: int, seat_numbers: list[int], journey_mask: int, hold_minutes: int) -> SeatHoldResponse:
+        """
+            Record a hold on seats whose legs the caller has already claimed in the seat inventory.
+        """
+        hold_id = str(uuid.uuid4())
+        expires_at = await self.db.scalar(
+            insert(SeatHold)
+            .values([
+                {
+                    "hold_id": hold_id,
+                    "schedule_id": schedule_id,
+                    "seat_number": seat_number,
+                    "journey_mask": journey_mask,
+                    "owner": self.get_owner(),
+                    "created_at": func.now(),
+                    "expires_at": func.now() + timedelta(minutes=hold_minutes)
+                }
+                for seat_number in seat_numbers
+            ])
+            .returning(SeatHold.expires_at)
+        )
+
+        return SeatHoldResponse(
+            message=SEAT_HOLD_CREATED_SUCCESSFULLY,
+            hold_id=hold_id,
+            schedule_id=schedule_id,
+            seat_numbers=seat_numbers,
+            expires_at=expires_at
+        )
+
+    async def consume_hold_or_raise(self, hold_id: str, schedule_id: int, seat_numbers: list[int], journey_mask: int):
+        """
+            Turn the caller's live hold on seats into bookings by deleting it, all seats or none.
+            The legs stay claimed in the seat inventory, now for the tickets.
+        """
+        consumed = (await self.db.scalars(
+            delete(SeatHold)
+            .where(
+                SeatHold.hold_id == hold_id,
+                SeatHold.owner == self.get_owner(),
+                SeatHold.schedule_id == schedule_id,
+                SeatHold.seat_number.in_(seat_numbers),
+                SeatHold.journey_mask == journey_mask,
+                SeatHold.expires_at > func.now()
+            )
+            .returning(SeatHold.id)
+        )).all()
+
+        if len(consumed) != len(seat_numbers):
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=404,
+                detail=SEAT_HOLD_NOT_FOUND
+            )
+
+    async def release_hold(self, hold_id: str):
+        """
+            Give back the seats of the caller's hold that were not booked.
+        """
+        released = await self.db.scalar(
+            release_holds(SeatHold.hold_id == hold_id, SeatHold.owner == self.get_owner())
+        )
+
+        if released is None:
+            raise HTTPException(
+                status_code=404,
+                detail=SEAT_HOLD_NOT_FOUND
+            )
+        await self.db.commit()
+
+    @staticmethod
+    def sweep(schema: str):
+        """
+            Release the expired seat holds of a tenant.
+        """
+        db = build_db_session(schema)
+
+        try:
+            db.execute(release_holds(SeatHold.expires_at <= func.now()))
+            db.commit()
+        except:
+            db.rollback()
+            traceback.print_exc()
+        finally:
+            db.close()
+
+    @staticmethod
+    def sweep_all():
+        """
+            Sweep every tenant. Runs on the background scheduler of each worker; concurrent
+            sweeps are safe, as a hold is only ever deleted, and released, once.
+        """
+        try:
+            schemas = get_tenant_schemas()
+        except:
+            traceback.print_exc()
+            return
+
+        for schema in schemas:
+            SeatHoldService.sweep(schema)
@@ -0,0 +1,238 @@
+from dataclasses import dataclass
+
+from fastapi import (
+    Depends, 
+    HTTPException
+)
+from sqlalchemy import (
+    case,
+    cast,
+    func,
+    insert,
+    select,
+    update
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    aggregate_order_by,
+    array
+)
+from sqlalchemy.types import BigInteger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.connectors.database_connector import (
+    get_async_tenant_db
+)
+from app.entities.schedule import Schedule
+from app.entities.seat_inventory import SeatInventory
+from app.models.ticket_models import SeatAvailabilityResponse
+from app.utils.constants import (
+    SCHEDULE_NOT_FOUND,
+    SEAT_ALREADY_BOOKED
+)
+from app.utils.seat_bitmap import (
+    SeatBitmap,
+    segment_mask
+)
+
+
+@dataclass
+class SeatInventoryService:
+    """
+        Per-departure seat inventory backed by one row of per-seat segment masks in seat_inventories.
+
+        A seat is sold per leg of the route, so passengers with non-overlapping journeys share it.
+        Seats are claimed with a single conditional UPDATE of one array element: the row lock it
+        takes is held until the booking commits, so concurrent claims on the same seat serialize
+        and the loser sees an overlapping leg already set. The exclusion constraint on tickets
+        backs it up.
+    """
+    db: AsyncSession = Depends(get_async_tenant_db)
+
+    def create_inventory(self, schedule_id: int, total_seats: int) -> SeatInventory:
+        """
+            Create an empty seat inventory for a new departure.
+        """
+        inventory = SeatInventory(
+            schedule_id=schedule_id,
+            total_seats=total_seats,
+            segment_masks=[0] * total_seats,
+            booked_count=0
+        )
+
+        self.db.add(inventory)
+        return inventory
+
+    async def create_inventories(self, schedules: list[tuple[int, int]]):
+        """
+            Create empty seat inventories for many new departures, given as (schedule_id, total_seats), in one statement.
+        """
+        await self.db.execute(
+            insert(SeatInventory),
+            [
+                {
+                    "schedule_id": schedule_id,
+                    "total_seats": total_seats,
+                    "segment_masks": [0] * total_seats,
+                    "booked_count": 0
+                }
+                for schedule_id, total_seats in schedules
+            ]
+        )
+
+    async def resize_inventories(self, total_seats: int, bus_id: int | None = None, schedule_id: int | None = None):
+        """
+            Resize the seat inventories of a bus's departures (or a single departure) after a seat count change.
+            Inventories only grow, so existing bookings are never lost.
+        """
+        missing = func.greatest(total_seats - func.cardinality(SeatInventory.segment_masks), 0)
+        padding = func.array_fill(cast(0, BigInteger), array([missing]), type_=ARRAY(BigInteger))
+        statement = update(SeatInventory).values(
+            total_seats=total_seats,
+            segment_masks=SeatInventory.segment_masks.op("||")(padding),
+            updated_at=func.now()
+        )
+
+        if schedule_id is not None:
+            statement = statement.where(SeatInventory.schedule_id == schedule_id)
+        else:
+            statement = statement.where(
+                SeatInventory.schedule_id.in_(select(Schedule.id).where(Schedule.bus_id == bus_id))
+            )
+
+        await self.db.execute(statement.execution_options(synchronize_session=False))
+
+    async def claim_seat(self, schedule_id: int, seat_number: int, journey_mask: int) -> bool:
+        """
+            Atomically sell the legs of a journey on a seat. Returns False when any of them is already sold.
+        """
+        seat_mask = SeatInventory.segment_masks[seat_number]
+        claimed = await self.db.scalar(
+            update(SeatInventory)
+            .where(
+                SeatInventory.schedule_id == schedule_id,
+                SeatInventory.total_seats >= seat_number,
+                seat_mask.op("&")(journey_mask) == 0
+            )
+            .values({
+                seat_mask: seat_mask.op("|")(journey_mask),
+                SeatInventory.booked_count: SeatInventory.booked_count + 1,
+                SeatInventory.updated_at: func.now()
+            })
+            .returning(SeatInventory.schedule_id)
+            .execution_options(synchronize_session=False)
+        )
+        return claimed is not None
+
+    async def claim_seats(self, schedule_id: int, seat_numbers: list[int], journey_mask: int) -> bool:
+        """
+            Atomically sell the legs of a journey on several seats, all or none, with one UPDATE
+            that rebuilds the departure's mask array. Returns False when any leg of any seat is
+            already sold.
+        """
+        if len(seat_numbers) == 1:
+            return await self.claim_seat(schedule_id, seat_numbers[0], journey_mask)
+
+        seats = (
+            func.unnest(SeatInventory.segment_masks)
+            .table_valued("segment_mask", with_ordinality="seat_number")
+            .render_derived()
+        )
+        requested = seats.c.seat_number.in_(seat_numbers)
+        segment_masks = (
+            select(func.array_agg(aggregate_order_by(
+                case((requested, seats.c.segment_mask.bitwise_or(journey_mask)), else_=seats.c.segment_mask),
+                seats.c.seat_number
+            )))
+            .scalar_subquery()
+        )
+        seats_taken = (
+            select(seats.c.seat_number)
+            .where(requested, seats.c.segment_mask.bitwise_and(journey_mask) != 0)
+            .exists()
+        )
+
+        claimed = await self.db.scalar(
+            update(SeatInventory)
+            .where(
+                SeatInventory.schedule_id == schedule_id,
+                SeatInventory.total_seats >= max(seat_numbers),
+                ~seats_taken
+            )
+            .values({
+                SeatInventory.segment_masks: segment_masks,
+                SeatInventory.booked_count: SeatInventory.booked_count + len(seat_numbers),
+                SeatInventory.updated_at: func.now()
+            })
+            .returning(SeatInventory.schedule_id)
+            .execution_options(synchronize_session=False)
+        )
+        return claimed is not None
+
+    async def claim_seat_or_raise(self, schedule_id: int, seat_number: int, journey_mask: int):
+        await self.claim_seats_or_raise(schedule_id, [seat_number], journey_mask)
+
+    async def claim_seats_or_raise(self, schedule_id: int, seat_numbers: list[int], journey_mask: int):
+        """
+            Claim seats, rolling back the pending booking when any is taken. The request
+            session commits on exit, so releases done earlier in the request must not persist.
+        """
+        if not await self.claim_seats(schedule_id, seat_numbers, journey_mask):
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail=SEAT_ALREADY_BOOKED
+            )
+
+    async def release_seat(self, schedule_id: int, seat_number: int, journey_mask: int):
+        """
+            Atomically free the legs of a journey on a seat.
+        """
+        seat_mask = SeatInventory.segment_masks[seat_number]
+        await self.db.execute(
+            update(SeatInventory)
+            .where(
+                SeatInventory.schedule_id == schedule_id,
+                seat_mask.op("&")(journey_mask) == journey_mask
+            )
+            .values({
+                seat_mask: seat_mask.op("&")(~journey_mask),
+                SeatInventory.booked_count: SeatInventory.booked_count - 1,
+                SeatInventory.updated_at: func.now()
+            })
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_seat_bitmap(self, schedule_id: int, journey_mask: int) -> SeatBitmap | None:
+        """
+            Get the seats of a departure that are taken on any leg of a journey.
+        """
+        inventory = (await self.db.execute(
+            select(SeatInventory.total_seats, SeatInventory.segment_masks)
+            .where(SeatInventory.schedule_id == schedule_id)
+        )).first()
+
+        if inventory is None:
+            return None
+        return SeatBitmap.from_segment_masks(inventory.total_seats, inventory.segment_masks, journey_mask)
+
+    async def get_seat_availability(self, schedule_id: int, boarding_seq: int, alighting_seq: int) -> SeatAvailabilityResponse:
+        """
+            Get the booked and available seats of a departure for a journey.
+        """
+        bitmap = await self.get_seat_bitmap(schedule_id, segment_mask(boarding_seq, alighting_seq))
+
+        if not bitmap:
+            raise HTTPException(
+                status_code=404,
+                detail=SCHEDULE_NOT_FOUND
+            )
+
+        return SeatAvailabilityResponse(
+            schedule_id=schedule_id,
+            boarding_seq=boarding_seq,
+            alighting_seq=alighting_seq,
+            total_seats=bitmap.total_seats,
+            booked_seats=bitmap.booked_seats(),
+            available_seats=bitmap.available_seats()
+        )
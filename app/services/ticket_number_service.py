@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from fastapi import Depends
+from sqlalchemy import (
+    func,
+    select
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.connectors.database_connector import (
+    get_async_tenant_db,
+    get_connected_schema
+)
+from app.entities.company import Company
+from app.entities.ticket import TICKET_NUMBER_SEQUENCE
+from app.utils.constants import COMPANY_PREFIX_CACHE_SIZE
+
+# LRU map of (schema, company_id) -> ticket number prefix
+company_prefix_cache: OrderedDict[tuple[str, int], str] = OrderedDict()
+
+
+def cache_company_prefix(key: tuple[str, int], prefix: str):
+    company_prefix_cache[key] = prefix
+    company_prefix_cache.move_to_end(key)
+
+    while len(company_prefix_cache) > COMPANY_PREFIX_CACHE_SIZE:
+        company_prefix_cache.popitem(last=False)
+
+
+def invalidate_company_prefix(schema: str, company_id: int):
+    company_prefix_cache.pop((schema, company_id), None)
+
+
+@dataclass
+class TicketNumberService:
+    """
+        Generates ticket numbers from the tenant's ticket_number_seq.
+
+        nextval is constant time and never hands out the same value twice, so numbers
+        don't collide under concurrent bookings regardless of the size of the tickets table.
+    """
+    db: AsyncSession = Depends(get_async_tenant_db)
+
+    async def get_company_prefix(self, company_id: int) -> str:
+        """
+            Get the three letter company prefix of a ticket number, cached per tenant.
+        """
+        key = (get_connected_schema(self.db), company_id)
+        prefix = company_prefix_cache.get(key)
+
+        if prefix is None:
+            company_name = await self.db.scalar(select(Company.name).where(Company.id == company_id))
+            prefix = company_name[:3].upper()
+            cache_company_prefix(key, prefix)
+        else:
+            company_prefix_cache.move_to_end(key)
+
+        return prefix
+
+    async def allocate(self, company_id: int, count: int = 1) -> list[str]:
+        """
+            Allocate `count` ticket numbers in a single round trip.
+        """
+        prefix = await self.get_company_prefix(company_id)
+        year = datetime.now().year
+
+        if count == 1:
+            values = [await self.db.scalar(select(TICKET_NUMBER_SEQUENCE.next_value()))]
+        else:
+            values = (await self.db.scalars(
+                select(TICKET_NUMBER_SEQUENCE.next_value()).select_from(func.generate_series(1, count))
+            )).all()
+
+        return [f"{prefix}{year}{value:07d}" for value in values]
@@ -1,133 +1,382 @@
 from dataclasses import dataclass
-from datetime import datetime
 
-from automapper import mapper
 from fastapi import (
     Depends, 
     HTTPException
 )
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Select,
+    func,
+    insert,
+    select
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.connectors.database_connector import (
-    get_tenant_db
+    get_async_tenant_db
 )
 from app.entities.bus import Bus
-from app.entities.company import Company
+from app.entities.route_stop import RouteStop
+from app.entities.schedule import Schedule
 from app.entities.ticket import Ticket
-from app.models.bus_models import GetBusResponse
-from app.models.company_models import GetCompanyResponse
+from app.models.base_response_model import CursorPage
+from app.models.pagination_models import PageParams
 from app.models.ticket_models import (
+    BatchTicketRequest,
+    BatchTicketResponse,
+    DepartureRequest,
+    PassengerRequest,
+    SeatAvailabilityResponse,
+    SeatHoldRequest,
+    SeatHoldResponse,
+    SeatSuggestionResponse,
+    TicketFilter,
     TicketRequest,
     TicketResponse,
     GetTicketResponse
 )
+from app.services.schedule_template_service import ScheduleTemplateService
+from app.services.seat_hold_service import SeatHoldService
+from app.services.seat_inventory_service import SeatInventoryService
+from app.services.ticket_number_service import TicketNumberService
 from app.utils.constants import (
-    BUS_NOT_FOUND,
+    INVALID_JOURNEY_SEGMENT,
+    INVALID_SEAT_NUMBER,
+    NOT_ENOUGH_SEATS_AVAILABLE,
+    SEAT_ALLOCATION_ATTEMPTS,
+    SCHEDULE_NOT_FOUND,
+    SEAT_ALREADY_BOOKED,
+    SEAT_HOLD_RELEASED_SUCCESSFULLY,
+    STOP_NOT_ON_ROUTE,
     TICKET_CREATED_SUCCESSFULLY,
+    TICKETS_CREATED_SUCCESSFULLY,
     TICKET_UPDATED_SUCCESSFULLY,
     TICKET_DELETED_SUCCESSFULLY,
     TICKET_NOT_FOUND
 )
+from app.utils.enums import TicketStatusEnum
+from app.utils.pagination import (
+    paginate,
+    split_page
+)
+from app.utils.projections import TICKET_PROJECTION
+from app.utils.seat_allocator import (
+    SeatLayout,
+    allocate_seats,
+    free_seats_mask
+)
+from app.utils.seat_bitmap import (
+    MAX_ROUTE_SEGMENTS,
+    segment_mask
+)
+from app.utils.stop_index import normalize_stop
 
 
 
 @dataclass
 class TicketService:
-    db: Session = Depends(get_tenant_db)
+    db: AsyncSession = Depends(get_async_tenant_db)
+    seat_inventory_service: SeatInventoryService = Depends(SeatInventoryService)
+    ticket_number_service: TicketNumberService = Depends(TicketNumberService)
+    schedule_template_service: ScheduleTemplateService = Depends(ScheduleTemplateService)
+    seat_hold_service: SeatHoldService = Depends(SeatHoldService)
 
-    def validate_bus_exists_by_id(self, bus_id: int):
+    async def resolve_schedule_id(self, request: DepartureRequest) -> int:
         """
-            Validate if a bus exists by its ID.
+            Get the departure a ticket is for, materializing a template departure on its first booking.
         """
-        bus = self.db.query(Bus).filter(Bus.id == bus_id).first()
+        if request.schedule_id:
+            return request.schedule_id
 
-        if not bus:
+        return await self.schedule_template_service.materialize_departure(request.template_id, request.service_date)
+
+    async def get_schedule_with_bus(self, schedule_id: int) -> tuple[Schedule, Bus]:
+        """
+            Get a departure and its bus in one query, validating that the departure exists.
+        """
+        schedule = await self.db.scalar(
+            select(Schedule)
+            .options(joinedload(Schedule.bus, innerjoin=True))
+            .where(Schedule.id == schedule_id)
+        )
+
+        if not schedule:
             raise HTTPException(
                 status_code=404,
-                detail=BUS_NOT_FOUND
+                detail=SCHEDULE_NOT_FOUND
             )
+        return schedule, schedule.bus
+
+    def validate_seat_number(self, bus: Bus, seat_number: int):
+        """
+            Validate that the seat exists on the bus.
+        """
+        if not 1 <= seat_number <= bus.total_seats:
+            raise HTTPException(
+                status_code=400,
+                detail=INVALID_SEAT_NUMBER
+            )
+
+    async def resolve_journey(self, route_id: int, boarding_stop: str | None, alighting_stop: str | None) -> tuple[int, int]:
+        """
+            Resolve the boarding and alighting stops of a journey to their sequence numbers on the route.
+            Missing stops default to the route's first and last stop.
+        """
+        route_stops = (await self.db.execute(
+            select(RouteStop.seq, RouteStop.city)
+            .where(RouteStop.route_id == route_id)
+            .order_by(RouteStop.seq)
+        )).all()
+        seqs = {}
+
+        for seq, city in route_stops:
+            seqs.setdefault(normalize_stop(city), seq)
+
+        try:
+            boarding_seq = seqs[normalize_stop(boarding_stop)] if boarding_stop else route_stops[0].seq
+            alighting_seq = seqs[normalize_stop(alighting_stop)] if alighting_stop else route_stops[-1].seq
+        except (KeyError, IndexError):
+            raise HTTPException(
+                status_code=400,
+                detail=STOP_NOT_ON_ROUTE
+            )
+
+        if not boarding_seq < alighting_seq <= MAX_ROUTE_SEGMENTS + 1:
+            raise HTTPException(
+                status_code=400,
+                detail=INVALID_JOURNEY_SEGMENT
+            )
+        return boarding_seq, alighting_seq
+
+    async def commit_booking(self):
+        """
+            Commit a booking, reporting a lost race on the seat uniqueness index as a conflict.
+        """
+        try:
+            await self.db.commit()
+        except IntegrityError as e:
+            await self.db.rollback()
+
+            if "ex_tickets_schedule_seat_segment" in str(e.orig):
+                raise HTTPException(
+                    status_code=409,
+                    detail=SEAT_ALREADY_BOOKED
+                )
+            raise
         
-    def generate_ticket_number(self, bus_id: int) -> str:
+    async def allocate_seats(self, schedule_id: int, bus: Bus, seat_numbers: list[int | None], journey_mask: int) -> list[int]:
+        """
+            Fill in the seats left out of a booking with the best free seats for the journey,
+            keeping the group together where the seat map allows it.
+        """
+        bitmap = await self.seat_inventory_service.get_seat_bitmap(schedule_id, journey_mask)
+
+        if not bitmap:
+            raise HTTPException(
+                status_code=404,
+                detail=SCHEDULE_NOT_FOUND
+            )
+
+        for seat_number in seat_numbers:
+            if seat_number:
+                bitmap.book(seat_number)
+
+        layout = SeatLayout.for_bus(bus.bus_type, bus.total_seats)
+        allocated = allocate_seats(layout, free_seats_mask(bitmap, bus.total_seats), seat_numbers.count(None))
+
+        if allocated is None:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail=NOT_ENOUGH_SEATS_AVAILABLE
+            )
+
+        allocated = iter(allocated)
+        return [seat_number or next(allocated) for seat_number in seat_numbers]
+
+    async def allocate_and_claim_seats(self, schedule_id: int, bus: Bus, seat_numbers: list[int | None], journey_mask: int) -> list[int]:
+        """
+            Allocate and claim the seats left out of a booking. When a concurrent booking takes
+            an allocated seat first, the allocation is redone from the fresh seat map here
+            instead of failing the request back to the client.
+        """
+        for _ in range(SEAT_ALLOCATION_ATTEMPTS):
+            allocated = await self.allocate_seats(schedule_id, bus, seat_numbers, journey_mask)
+
+            if await self.seat_inventory_service.claim_seats(schedule_id, allocated, journey_mask):
+                return allocated
+
+        await self.db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=SEAT_ALREADY_BOOKED
+        )
+
+    async def suggest_seats(
+        self,
+        schedule_id: int,
+        party_size: int,
+        boarding_stop: str | None = None,
+        alighting_stop: str | None = None
+    ) -> SeatSuggestionResponse:
+        """
+            Suggest the best free seats of a departure for a party travelling together.
+        """
+        schedule, bus = await self.get_schedule_with_bus(schedule_id)
+        boarding_seq, alighting_seq = await self.resolve_journey(schedule.route_id, boarding_stop, alighting_stop)
+
+        return SeatSuggestionResponse(
+            schedule_id=schedule_id,
+            boarding_seq=boarding_seq,
+            alighting_seq=alighting_seq,
+            seat_numbers=await self.allocate_seats(
+                schedule_id, bus, [None] * party_size, segment_mask(boarding_seq, alighting_seq)
+            )
+        )
+
+    async def create_tickets(self, request: BatchTicketRequest) -> BatchTicketResponse:
         """
-            Generate a unique ticket number based on the company name, year, and ticket count.
+            Book seats of a departure for a group travelling the same journey, all or nothing.
+
+            The departure and journey are resolved once, every seat is claimed with one UPDATE
+            (or taken from a hold with one DELETE), the ticket numbers come from one sequence
+            query and the tickets are stored with one multi-row insert and a single commit.
         """
-        company_name = (
-            self.db.query(Company.name)
-            .join(Bus, Bus.company_id == Company.id)
-            .filter(Bus.id == bus_id)
-            .first()
+        schedule, bus = await self.get_schedule_with_bus(await self.resolve_schedule_id(request))
+        seat_numbers = [passenger.seat_number for passenger in request.passengers]
+
+        for seat_number in seat_numbers:
+            if seat_number:
+                self.validate_seat_number(bus, seat_number)
+
+        boarding_seq, alighting_seq = await self.resolve_journey(
+            schedule.route_id, request.boarding_stop, request.alighting_stop
         )
-        company_name = company_name[0][:3].upper()  
-        year = datetime.now().year
-        ticket_count = self.db.query(func.count(Ticket.id)).scalar() + 1
-        return f"{company_name}{year}{ticket_count:07d}"    
-
-    def create_ticket(self, request: TicketRequest) -> TicketResponse:
-        """
-            Create a new ticket in the database.
-        """
-        self.validate_bus_exists_by_id(request.bus_id)
-        ticket_number = self.generate_ticket_number(request.bus_id)
-
-        ticket = Ticket(
-            ticket_number=ticket_number,
-            bus_id=request.bus_id,
-            seat_number=request.seat_number,
-            passenger_name=request.passenger_name,
-            passenger_contact=request.passenger_contact,
-            passenger_email=request.passenger_email,
-            status=request.status
+        journey_mask = segment_mask(boarding_seq, alighting_seq)
+
+        if request.status != TicketStatusEnum.BOOKED:
+            if None in seat_numbers:
+                seat_numbers = await self.allocate_seats(schedule.id, bus, seat_numbers, journey_mask)
+        elif request.hold_id:
+            await self.seat_hold_service.consume_hold_or_raise(request.hold_id, schedule.id, seat_numbers, journey_mask)
+        elif None in seat_numbers:
+            seat_numbers = await self.allocate_and_claim_seats(schedule.id, bus, seat_numbers, journey_mask)
+        else:
+            await self.seat_inventory_service.claim_seats_or_raise(schedule.id, seat_numbers, journey_mask)
+
+        ticket_numbers = await self.ticket_number_service.allocate(bus.company_id, len(request.passengers))
+
+        await self.db.execute(
+            insert(Ticket).values([
+                {
+                    "ticket_number": ticket_number,
+                    "bus_id": bus.id,
+                    "schedule_id": schedule.id,
+                    "seat_number": seat_number,
+                    "boarding_seq": boarding_seq,
+                    "alighting_seq": alighting_seq,
+                    "passenger_name": passenger.passenger_name,
+                    "passenger_contact": passenger.passenger_contact,
+                    "passenger_email": passenger.passenger_email,
+                    "status": request.status
+                }
+                for ticket_number, passenger, seat_number in zip(ticket_numbers, request.passengers, seat_numbers)
+            ])
         )
+        await self.commit_booking()
 
-        self.db.add(ticket)
-        self.db.commit()
+        return BatchTicketResponse(
+            message=TICKETS_CREATED_SUCCESSFULLY,
+            ticket_numbers=ticket_numbers,
+            seat_numbers=seat_numbers
+        )
+
+    async def create_ticket(self, request: TicketRequest) -> TicketResponse:
+        """
+            Create a new ticket in the database, as a booking for a group of one.
+        """
+        await self.create_tickets(BatchTicketRequest(
+            schedule_id=request.schedule_id,
+            template_id=request.template_id,
+            service_date=request.service_date,
+            boarding_stop=request.boarding_stop,
+            alighting_stop=request.alighting_stop,
+            status=request.status,
+            hold_id=request.hold_id,
+            passengers=[
+                PassengerRequest(
+                    seat_number=request.seat_number,
+                    passenger_name=request.passenger_name,
+                    passenger_contact=request.passenger_contact,
+                    passenger_email=request.passenger_email
+                )
+            ]
+        ))
 
         return TicketResponse(
             message=TICKET_CREATED_SUCCESSFULLY
         )
 
-    def get_all_tickets(self) -> list[GetTicketResponse]:
+    async def hold_seats(self, request: SeatHoldRequest) -> SeatHoldResponse:
+        """
+            Hold seats of a departure for a journey until they are booked, released or expire.
+        """
+        schedule, bus = await self.get_schedule_with_bus(await self.resolve_schedule_id(request))
+
+        for seat_number in request.seat_numbers:
+            self.validate_seat_number(bus, seat_number)
+
+        boarding_seq, alighting_seq = await self.resolve_journey(
+            schedule.route_id, request.boarding_stop, request.alighting_stop
+        )
+        journey_mask = segment_mask(boarding_seq, alighting_seq)
+
+        await self.seat_inventory_service.claim_seats_or_raise(schedule.id, request.seat_numbers, journey_mask)
+
+        hold = await self.seat_hold_service.create_hold(
+            schedule.id, request.seat_numbers, journey_mask, request.hold_minutes
+        )
+        await self.db.commit()
+
+        return hold
+
+    async def release_hold(self, hold_id: str) -> TicketResponse:
         """
-            Get all tickets from the database with bus and company data.
+            Give back the seats of a hold that were not booked.
+        """
+        await self.seat_hold_service.release_hold(hold_id)
+
+        return TicketResponse(message=SEAT_HOLD_RELEASED_SUCCESSFULLY)
+
+    @staticmethod
+    def filter_tickets(statement: Select, filters: TicketFilter) -> Select:
+        if filters.schedule_id:
+            statement = statement.where(Ticket.schedule_id == filters.schedule_id)
+        if filters.bus_id:
+            statement = statement.where(Ticket.bus_id == filters.bus_id)
+        if filters.status:
+            statement = statement.where(Ticket.status == filters.status)
+        if filters.passenger_email:
+            statement = statement.where(func.lower(Ticket.passenger_email) == filters.passenger_email.lower())
+        return statement
+
+    async def get_all_tickets(self, page: PageParams, filters: TicketFilter) -> CursorPage[GetTicketResponse]:
+        """
+            Get one page of tickets from the database with bus and company data.
             Optimized to reduce the number of queries.
         """
-        tickets = self.db.query(Ticket).all()
-        bus_ids = {ticket.bus_id for ticket in tickets}
-        buses = self.db.query(Bus).filter(Bus.id.in_(bus_ids)).all()
-        bus_map = {bus.id: bus for bus in buses}
-
-        company_ids = {bus.company_id for bus in buses}
-        companies = self.db.query(Company).filter(Company.id.in_(company_ids)).all()
-        company_map = {company.id: company for company in companies}
-
-        responses = []
-        for ticket in tickets:
-            bus = bus_map.get(ticket.bus_id)
-            
-            ticket_response = GetTicketResponse(
-                id=ticket.id,
-                seat_number=ticket.seat_number,
-                passenger_name=ticket.passenger_name,
-                passenger_contact=ticket.passenger_contact,
-                passenger_email=ticket.passenger_email,
-                status=ticket.status,
-                created_at=ticket.created_at,
-                updated_at=ticket.updated_at,
-                bus_data=GetBusResponse(
-                    id=bus.id,
-                    company_id=bus.company_id,
-                    bus_number=bus.bus_number,
-                    bus_type=bus.bus_type,
-                    total_seats=bus.total_seats,
-                    created_at=bus.created_at,
-                    is_active=bus.is_active,
-                    company_data=mapper.to(GetCompanyResponse).map(company_map.get(bus.company_id))
-                )
-            )
-            responses.append(ticket_response)
+        statement = self.filter_tickets(select(TICKET_PROJECTION).join(Ticket.bus).join(Bus.company), filters)
 
-        return responses
+        tickets = (await self.db.scalars(paginate(statement, Ticket, page))).all()
+        tickets, next_cursor = split_page(tickets, page)
+
+        return CursorPage[GetTicketResponse](
+            items=tickets,
+            page_size=page.page_size,
+            next_cursor=next_cursor
+        )
     
     def validate_ticket_exists(self, ticket: Ticket):
         """
@@ -139,72 +388,98 @@ class TicketService:
                 detail=TICKET_NOT_FOUND
             )
 
-    def get_ticket_data_by_id(self, id: int) -> Ticket:
+    async def get_ticket_data_by_id(self, id: int) -> Ticket:
         """
             Get ticket data by ID.
         """
-        return self.db.query(Ticket).filter(Ticket.id == id).first()
+        return await self.db.scalar(select(Ticket).where(Ticket.id == id))
     
-    def get_ticket_by_id(self, id: int) -> GetTicketResponse:
+    async def get_ticket_by_id(self, id: int) -> GetTicketResponse:
         """
             Get a ticket by ID with bus and company data.
         """
-        ticket = self.get_ticket_data_by_id(id)
-        self.validate_ticket_exists(ticket)
-
-        bus = self.db.query(Bus).filter(Bus.id == ticket.bus_id).first()
-        company = self.db.query(Company).filter(Company.id == bus.company_id).first()
-
-        ticket_response = GetTicketResponse(
-            id=ticket.id, 
-            seat_number=ticket.seat_number,
-            passenger_name=ticket.passenger_name,
-            passenger_contact=ticket.passenger_contact, 
-            passenger_email=ticket.passenger_email, 
-            status=ticket.status, 
-            created_at=ticket.created_at,
-            updated_at=ticket.updated_at,  
-            bus_data=GetBusResponse(
-                id=bus.id,
-                company_id=bus.company_id,
-                bus_number=bus.bus_number,
-                bus_type=bus.bus_type,
-                total_seats=bus.total_seats,
-                created_at=bus.created_at,
-                is_active=bus.is_active,
-                company_data=mapper.to(GetCompanyResponse).map(company)
-            )
-
+        ticket = await self.db.scalar(
+            select(TICKET_PROJECTION)
+            .join(Ticket.bus)
+            .join(Bus.company)
+            .where(Ticket.id == id)
         )
+        self.validate_ticket_exists(ticket)
 
-        return ticket_response
+        return ticket
     
-    def update_ticket_by_id(self, id: int, request: TicketRequest) -> TicketResponse:
+    def get_journey_mask(self, ticket: Ticket) -> int:
+        return segment_mask(ticket.boarding_seq, ticket.alighting_seq)
+
+    async def update_ticket_by_id(self, id: int, request: TicketRequest) -> TicketResponse:
         """
-            Update ticket data by ID.
+            Update ticket data by ID, moving its seat claim when the seat, departure or status changes.
         """
-        ticket = self.get_ticket_data_by_id(id)
+        ticket = await self.get_ticket_data_by_id(id)
         self.validate_ticket_exists(ticket)
+        schedule, bus = await self.get_schedule_with_bus(await self.resolve_schedule_id(request))
+        self.validate_seat_number(bus, request.seat_number)
+        boarding_seq, alighting_seq = await self.resolve_journey(
+            schedule.route_id, request.boarding_stop, request.alighting_stop
+        )
+
+        old_claim = None
+        if ticket.status == TicketStatusEnum.BOOKED and ticket.schedule_id:
+            old_claim = (ticket.schedule_id, ticket.seat_number, self.get_journey_mask(ticket))
+
+        new_claim = None
+        if request.status == TicketStatusEnum.BOOKED:
+            new_claim = (schedule.id, request.seat_number, segment_mask(boarding_seq, alighting_seq))
+
+        # Release first, so a journey can be extended over legs it already holds
+        if new_claim != old_claim:
+            if old_claim:
+                await self.seat_inventory_service.release_seat(*old_claim)
+            if new_claim:
+                await self.seat_inventory_service.claim_seat_or_raise(*new_claim)
 
+        ticket.bus_id = bus.id
+        ticket.schedule_id = schedule.id
         ticket.seat_number = request.seat_number
+        ticket.boarding_seq = boarding_seq
+        ticket.alighting_seq = alighting_seq
         ticket.passenger_name = request.passenger_name
         ticket.passenger_contact = request.passenger_contact
         ticket.passenger_email = request.passenger_email
         ticket.status = request.status
         ticket.updated_at = func.now()
 
-        self.db.commit()
+        await self.commit_booking()
 
         return TicketResponse(message=TICKET_UPDATED_SUCCESSFULLY)
     
-    def delete_ticket_by_id(self, id: int) -> TicketResponse:
+    async def delete_ticket_by_id(self, id: int) -> TicketResponse:
         """
             Delete ticket by ID.
         """
-        ticket = self.get_ticket_data_by_id(id)
+        ticket = await self.get_ticket_data_by_id(id)
         self.validate_ticket_exists(ticket)
 
-        self.db.delete(ticket)
-        self.db.commit()
+        if ticket.status == TicketStatusEnum.BOOKED and ticket.schedule_id:
+            await self.seat_inventory_service.release_seat(
+                ticket.schedule_id, ticket.seat_number, self.get_journey_mask(ticket)
+            )
+
+        await self.db.delete(ticket)
+        await self.db.commit()
+
+        return TicketResponse(message=TICKET_DELETED_SUCCESSFULLY)
+    
+    async def get_seat_availability(
+        self, 
+        schedule_id: int, 
+        boarding_stop: str | None = None, 
+        alighting_stop: str | None = None
+    ) -> SeatAvailabilityResponse:
+        """
+            Get the booked and available seats of a departure, for the whole route or a part of it.
+        """
+        schedule, _ = await self.get_schedule_with_bus(schedule_id)
+        boarding_seq, alighting_seq = await self.resolve_journey(schedule.route_id, boarding_stop, alighting_stop)
 
-        return TicketResponse(message=TICKET_DELETED_SUCCESSFULLY)
\ No newline at end of file
+        return await self.seat_inventory_service.get_seat_availability(schedule_id, boarding_seq, alighting_seq)
@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta
+)
+
+from fastapi import (
+    Depends,
+    HTTPException
+)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.connectors.database_connector import (
+    get_async_tenant_db,
+    get_connected_schema
+)
+from app.entities.bus import Bus
+from app.entities.company import Company
+from app.entities.route_stop import RouteStop
+from app.entities.schedule import Schedule
+from app.entities.seat_inventory import SeatInventory
+from app.models.bus_models import TripSearchResponse
+from app.utils.constants import SOURCE_AND_DESTINATION_MUST_BE_DIFFERENT
+from app.utils.seat_bitmap import segment_mask
+from app.utils.stop_index import (
+    StopIndex,
+    normalize_stop,
+    stop_index_cache
+)
+
+
+@dataclass
+class TripSearchService:
+    """
+        Finds the departures serving a trip between two stops on a given day.
+
+        Matching routes come from the tenant's in-memory StopIndex over route_stops, so the database is only
+        asked for the departures of those routes on that day.
+    """
+    db: AsyncSession = Depends(get_async_tenant_db)
+
+    async def get_stop_index(self) -> StopIndex:
+        """
+            Get the stop index of the connected tenant, building it on first use.
+        """
+        schema = get_connected_schema(self.db)
+        index = stop_index_cache.get(schema)
+
+        if index is None:
+            route_stops = (await self.db.execute(
+                select(RouteStop.route_id, RouteStop.seq, RouteStop.city)
+            )).all()
+            index = StopIndex(route_stops)
+            stop_index_cache.put(schema, index)
+
+        return index
+
+    async def search_trips(self, from_stop: str, to_stop: str, travel_date: date) -> list[TripSearchResponse]:
+        """
+            Get the departures on `travel_date` whose route visits `from_stop` before `to_stop`,
+            with the seats that are free on every leg between the two.
+        """
+        if normalize_stop(from_stop) == normalize_stop(to_stop):
+            raise HTTPException(
+                status_code=400,
+                detail=SOURCE_AND_DESTINATION_MUST_BE_DIFFERENT
+            )
+
+        index = await self.get_stop_index()
+        matches = index.find_routes(from_stop, to_stop)
+
+        if not matches:
+            return []
+
+        day_start = datetime.combine(travel_date, time.min)
+        rows = (await self.db.execute(
+            select(
+                Schedule.id,
+                Schedule.route_id,
+                Schedule.bus_id,
+                Schedule.departure_time,
+                Schedule.arrival_time,
+                Bus.bus_number,
+                Bus.bus_type,
+                Company.name.label("company_name"),
+                SeatInventory.total_seats,
+                SeatInventory.segment_masks
+            )
+            .join(Bus, Bus.id == Schedule.bus_id)
+            .join(Company, Company.id == Bus.company_id)
+            .join(SeatInventory, SeatInventory.schedule_id == Schedule.id)
+            .where(
+                Schedule.route_id.in_(matches),
+                Schedule.departure_time >= day_start,
+                Schedule.departure_time < day_start + timedelta(days=1),
+                Bus.is_active.is_(True)
+            )
+            .order_by(Schedule.departure_time, Schedule.id)
+        )).all()
+
+        trips = []
+        for row in rows:
+            from_seq, to_seq = matches[row.route_id]
+            journey_mask = segment_mask(from_seq, to_seq)
+
+            trips.append(TripSearchResponse(
+                schedule_id=row.id,
+                route_id=row.route_id,
+                bus_id=row.bus_id,
+                bus_number=row.bus_number,
+                bus_type=row.bus_type,
+                company_name=row.company_name,
+                from_stop=index.stop_name(row.route_id, from_seq),
+                to_stop=index.stop_name(row.route_id, to_seq),
+                departure_time=row.departure_time,
+                arrival_time=row.arrival_time,
+                total_seats=row.total_seats,
+                available_seats=sum(1 for mask in row.segment_masks[:row.total_seats] if not mask & journey_mask)
+            ))
+
+        return trips
@@ -1,18 +1,22 @@
 from dataclasses import dataclass
-from typing import List
 
-from automapper import mapper
 from fastapi import (
     Depends, 
     HTTPException
 )
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    func,
+    select
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.connectors.database_connector import get_master_db
+from app.connectors.database_connector import get_async_master_db
 from app.entities.user import User
+from app.models.base_response_model import CursorPage
+from app.models.pagination_models import PageParams
 from app.models.user_models import (
     GetUserResponse,
+    UserFilter,
     UserCreationRequest, 
     UserCreationResponse
 )
@@ -21,29 +25,36 @@ from app.utils.constants import (
     USER_CREATED_SUCCESSFULLY, 
     USER_WITH_THIS_EMAIL_ALREADY_EXISTS
 )
+from app.utils.mappers import map_user
+from app.utils.pagination import (
+    paginate,
+    split_page
+)
 
 
 @dataclass
 class UserService:
-    db: Session = Depends(get_master_db)
+    db: AsyncSession = Depends(get_async_master_db)
 
-    def get_active_user_by_email(self, email: str) -> User | None:
+    async def get_active_user_by_email(self, email: str) -> User | None:
         """
             Retrieve a user by their email address.
         """
-        return (
-            self.db.query(User)
-            .filter(
+        return await self.db.scalar(
+            select(User)
+            .where(
                 User.email == email,
                 User.is_active == True
-            ).first()   
+            )
         )
     
-    def validate_email(self, email: str):
+    async def validate_email(self, email: str):
         """
             Validate if the email already exists in the database.
         """
-        existing_user_by_email = self.db.query(User).filter(func.lower(User.email) == email.lower()).first()
+        existing_user_by_email = await self.db.scalar(
+            select(User).where(func.lower(User.email) == email.lower()).limit(1)
+        )
 
         if existing_user_by_email:
             raise HTTPException(
@@ -51,11 +62,13 @@ class UserService:
                 detail=USER_WITH_THIS_EMAIL_ALREADY_EXISTS
             )
 
-    def validate_contact(self, contact: str):
+    async def validate_contact(self, contact: str):
         """
             Validate if the contact already exists in the database.
         """
-        existing_user_by_contact = self.db.query(User).filter(func.lower(User.contact) == contact.lower()).first()
+        existing_user_by_contact = await self.db.scalar(
+            select(User).where(func.lower(User.contact) == contact.lower()).limit(1)
+        )
 
         if existing_user_by_contact:
             raise HTTPException(
@@ -63,12 +76,12 @@ class UserService:
                 detail=A_USER_WITH_THIS_CONTACT_ALREADY_EXISTS
             )
 
-    def create_user(self, request: UserCreationRequest) -> UserCreationResponse:
+    async def create_user(self, request: UserCreationRequest) -> UserCreationResponse:
         """
             Create a new user in the database.
         """
-        self.validate_email(request.email)
-        self.validate_contact(request.contact)
+        await self.validate_email(request.email)
+        await self.validate_contact(request.contact)
 
         user = User(
             name=request.name,
@@ -80,10 +93,26 @@ class UserService:
         )
 
         self.db.add(user)
-        self.db.commit()
+        await self.db.commit()
 
         return UserCreationResponse(message=USER_CREATED_SUCCESSFULLY)
     
-    def get_all_users(self, branch_id: int) -> List[GetUserResponse]:
-         users = self.db.query(User).filter(User.branch_id == branch_id).all()
-         return [mapper.to(GetUserResponse).map(user) for user in users]
\ No newline at end of file
+    async def get_all_users(self, branch_id: int, page: PageParams, filters: UserFilter) -> CursorPage[GetUserResponse]:
+        """
+            Get one page of the users of a branch.
+        """
+        statement = select(User).where(User.branch_id == branch_id)
+
+        if filters.role:
+            statement = statement.where(User.role == filters.role)
+        if filters.is_active is not None:
+            statement = statement.where(User.is_active == filters.is_active)
+
+        users = (await self.db.scalars(paginate(statement, User, page))).all()
+        users, next_cursor = split_page(users, page)
+
+        return CursorPage[GetUserResponse](
+            items=[map_user(user) for user in users],
+            page_size=page.page_size,
+            next_cursor=next_cursor
+        )
\ No newline at end of file
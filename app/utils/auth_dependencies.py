@@ -1,24 +1,46 @@
 import os
+from typing import (
+    Awaitable,
+    Callable,
+    Iterable
+)
 from dotenv import load_dotenv
 
 from fastapi import (
     HTTPException, 
     Request
 )
-from jose import jwt
+from jose import (
+    JWTError,
+    jwt
+)
 
 from app.models.user_models import CurrentContextUser
-from app.utils.constants import AUTHORIZATION
+from app.utils.constants import (
+    ACCESS_DENIED,
+    AUTHORIZATION,
+    INVALID_TOKEN,
+    TOKEN_CACHE_SIZE
+)
+from app.utils.enums import Roles
+from app.utils.token_cache import VerifiedTokenCache
 
 load_dotenv()
 
 SECRET_KEY: str = os.getenv("JWT_SECRET")  
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 300  # 3 hours
+ACCESS_TOKEN_EXPIRE_MINUTES = 15  # Short-lived, clients renew through /auth/refresh
+
+token_cache = VerifiedTokenCache(max_size=TOKEN_CACHE_SIZE)
 
 
 def __verify_jwt(token: str):
     token = token.replace("Bearer ", "")
+    cur_user = token_cache.get(token)
+
+    if cur_user:
+        return cur_user
+
     payload = jwt.decode(
         token, 
         SECRET_KEY, 
@@ -28,33 +50,66 @@ def __verify_jwt(token: str):
     user = payload.get("sub")
     
     if user:
-        cur_user = CurrentContextUser()
-        cur_user.name = payload.get("name")
-        cur_user.email = str(user)
-        cur_user.role = payload.get("role")
-        cur_user.branch_id = payload.get("branch_id")
+        cur_user = CurrentContextUser(
+            name=payload.get("name"),
+            email=str(user),
+            role=payload.get("role"),
+            branch_id=payload.get("branch_id")
+        )
+        token_cache.put(token, cur_user, payload["exp"])
         return cur_user
 
 
+def revoke_auth_token(auth: str):
+    """
+        Reject a still valid access token from now on, e.g. on logout. Revocation is kept by
+        this worker process only; other workers accept the token until it expires.
+    """
+    token = auth.replace("Bearer ", "")
+
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return
+
+    token_cache.revoke(token, payload["exp"])
+
+
 async def verify_auth_token(request: Request):
     """
         Verify the authentication token in the request headers.
     """
-    non_authenticated_paths = {"login", "refresh"}
-    protected_paths = {
-        "admin", "companies", "buses", 
-        "tickets"
-    }
-    
-    if not any(path in request.url.path for path in non_authenticated_paths) and any(
-        path in request.url.path for path in protected_paths
-    ):
-        auth: str = request.headers.get(AUTHORIZATION) or ""
-        
-        try:
-            request.state.user = __verify_jwt(token=auth)
-        except Exception as e:
+    auth: str = request.headers.get(AUTHORIZATION) or ""
+
+    try:
+        request.state.user = __verify_jwt(token=auth)
+    except Exception as e:
+        raise HTTPException(
+            status_code=401,
+            detail=str(e)
+        )
+
+    if request.state.user is None:
+        raise HTTPException(
+            status_code=401,
+            detail=INVALID_TOKEN
+        )
+
+
+def require_roles(roles: Iterable[Roles]) -> Callable[[Request], Awaitable[None]]:
+    """
+        Build the auth dependency of a router whose routes are open to `roles`. It is built once
+        when the router is registered, so a request pays for token verification and one set lookup.
+    """
+    allowed_roles = frozenset(roles)
+
+    async def verify_role(request: Request):
+        await verify_auth_token(request)
+
+        if request.state.user.role not in allowed_roles:
             raise HTTPException(
-                status_code=401,
-                detail=str(e)
+                status_code=403,
+                detail=ACCESS_DENIED
             )
+
+    return verify_role
@@ -0,0 +1,51 @@
+import threading
+import traceback
+from typing import Callable
+
+import schedule
+
+
+class BackgroundScheduler:
+    """
+        Runs periodic jobs of the `schedule` package on a daemon thread.
+
+        A failing job is logged and retried on its next run instead of stopping the thread.
+    """
+
+    def __init__(self, tick_seconds: float = 1):
+        self.tick_seconds = tick_seconds
+        self.scheduler = schedule.Scheduler()
+        self.__stopped = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def every(self, seconds: int, job: Callable[[], None]):
+        def run_job():
+            try:
+                job()
+            except Exception:
+                traceback.print_exc()
+
+        self.scheduler.every(seconds).seconds.do(run_job)
+
+    def run(self):
+        while not self.__stopped.wait(self.tick_seconds):
+            self.scheduler.run_pending()
+
+    def start(self):
+        if self.__thread is not None:
+            return
+
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.run, name="background-scheduler", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """
+            Stop the thread, waiting for a running job to finish.
+        """
+        if self.__thread is None:
+            return
+
+        self.__stopped.set()
+        self.__thread.join()
+        self.__thread = None
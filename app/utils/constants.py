@@ -2,11 +2,45 @@ INVALID_SCHEMA = "INVALID_SCHEMA"
 MASTER_SCHEMA = "public"
 DB_NOT_UPTODATE = "DB_NOT_UPTODATE"
 HEAD = "HEAD"
+# Connections each worker may hold: request handlers use the async pool, background jobs,
+# migrations and the remaining sync routes the sync one. Size DB_POOL_SIZE + SYNC_DB_POOL_SIZE
+# times the number of workers below the server's max_connections.
+DEFAULT_DB_POOL_SIZE = 40
+DEFAULT_SYNC_DB_POOL_SIZE = 10
 AUTHORIZATION = "Authorization"
+REQUEST_ID = "X-Request-ID"
+INVALID_TOKEN = "INVALID_TOKEN"
+ACCESS_DENIED = "ACCESS_DENIED"
+TOKEN_CACHE_SIZE = 10000
+REFRESH_TOKEN_EXPIRE_DAYS = 30
+REFRESH_TOKEN_PURGE_INTERVAL_SECONDS = 3600
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+EXPORT_BATCH_SIZE = 1000
+IDEMPOTENCY_KEY = "Idempotency-Key"
+IDEMPOTENCY_KEY_TTL_HOURS = 24
+IDEMPOTENCY_KEY_PURGE_INTERVAL_SECONDS = 3600
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+INVALID_IDEMPOTENCY_KEY = "INVALID_IDEMPOTENCY_KEY"
+IDEMPOTENCY_KEY_REUSED = "IDEMPOTENCY_KEY_REUSED"
+IDEMPOTENT_REQUEST_IN_PROGRESS = "IDEMPOTENT_REQUEST_IN_PROGRESS"
+SEAT_HOLD_TTL_MINUTES = 10
+MAX_SEAT_HOLD_MINUTES = 30
+MAX_SEATS_PER_HOLD = 10
+MAX_TICKETS_PER_BATCH = 20
+SEAT_ALLOCATION_ATTEMPTS = 3
+COMPANY_PREFIX_CACHE_SIZE = 10000
+SEAT_HOLD_SWEEP_INTERVAL_SECONDS = 30
+INVALID_CURSOR = "INVALID_CURSOR"
 USER_NOT_FOUND = "USER_NOT_FOUND"
 
 # User related constants:
 INCORRECT_PASSWORD = "INCORRECT_PASSWORD"
+LOGIN_BUSY = "LOGIN_BUSY_RETRY_LATER"
+INVALID_REFRESH_TOKEN = "INVALID_REFRESH_TOKEN"
+LOGGED_OUT_SUCCESSFULLY = "LOGGED_OUT_SUCCESSFULLY"
+DEFAULT_PASSWORD_VERIFY_WORKERS = 4
+DEFAULT_PASSWORD_VERIFY_QUEUE = 32
 USER_CREATED_SUCCESSFULLY = "USER_CREATED_SUCCESSFULLY"
 USER_WITH_THIS_EMAIL_ALREADY_EXISTS = "A_USER_WITH_THIS_EMAIL_ALREADY_EXISTS"
 A_USER_WITH_THIS_CONTACT_ALREADY_EXISTS = "A_USER_WITH_THIS_CONTACT_ALREADY_EXISTS"
@@ -37,12 +71,43 @@ BUS_SCHEDULE_CREATED_SUCCESSFULLY = "BUS_SCHEDULE_CREATED_SUCCESSFULLY"
 BUS_SCHEDULE_UPDATED_SUCCESSFULLY = "BUS_SCHEDULE_UPDATED_SUCCESSFULLY"
 BUS_SCHEDULE_DELETED_SUCCESSFULLY = "BUS_SCHEDULE_DELETED_SUCCESSFULLY"
 SCHEDULE_NOT_FOUND = "SCHEDULE_NOT_FOUND"
+SCHEDULE_HAS_TICKETS = "CANNOT_DELETE_A_SCHEDULE_WITH_TICKETS"
+ROUTE_NOT_FOUND = "ROUTE_NOT_FOUND"
+ARRIVAL_MUST_BE_AFTER_DEPARTURE = "ARRIVAL_MUST_BE_AFTER_DEPARTURE"
+BUS_SCHEDULE_OVERLAPS = "BUS_SCHEDULE_OVERLAPS"
+SCHEDULE_ROUTE_HAS_BOOKINGS = "CANNOT_CHANGE_THE_ROUTE_OF_A_SCHEDULE_WITH_BOOKINGS"
+BUS_HAS_FEWER_SEATS_THAN_BOOKED = "BUS_HAS_FEWER_SEATS_THAN_BOOKED"
+BUS_SCHEDULES_IMPORTED_SUCCESSFULLY = "BUS_SCHEDULES_IMPORTED_SUCCESSFULLY"
+MAX_BULK_SCHEDULES = 5000
+SCHEDULE_TEMPLATE_CREATED_SUCCESSFULLY = "SCHEDULE_TEMPLATE_CREATED_SUCCESSFULLY"
+SCHEDULE_TEMPLATE_DELETED_SUCCESSFULLY = "SCHEDULE_TEMPLATE_DELETED_SUCCESSFULLY"
+SCHEDULE_TEMPLATE_NOT_FOUND = "SCHEDULE_TEMPLATE_NOT_FOUND"
+WEEKDAYS_REQUIRED_FOR_WEEKLY_TEMPLATES = "WEEKDAYS_REQUIRED_FOR_WEEKLY_TEMPLATES"
+TEMPLATE_DOES_NOT_RUN_ON_THIS_DATE = "TEMPLATE_DOES_NOT_RUN_ON_THIS_DATE"
+INVALID_DATE_RANGE = "INVALID_DATE_RANGE"
+MAX_TIMETABLE_DAYS = 31
+SOURCE_AND_DESTINATION_MUST_BE_DIFFERENT = "SOURCE_AND_DESTINATION_MUST_BE_DIFFERENT"
+DEFAULT_MIN_TRANSFER_MINUTES = 30
+DEFAULT_MAX_TRANSFERS = 2
+MAX_TRANSFERS = 4
 
 # Ticket related constants:
 TICKET_CREATED_SUCCESSFULLY = "TICKET_CREATED_SUCCESSFULLY"
+TICKETS_CREATED_SUCCESSFULLY = "TICKETS_CREATED_SUCCESSFULLY"
 TICKET_UPDATED_SUCCESSFULLY = "TICKET_UPDATED_SUCCESSFULLY"
 TICKET_DELETED_SUCCESSFULLY = "TICKET_DELETED_SUCCESSFULLY"
 TICKET_NOT_FOUND = "TICKET_NOT_FOUND"
+SEAT_ALREADY_BOOKED = "SEAT_ALREADY_BOOKED"
+INVALID_SEAT_NUMBER = "INVALID_SEAT_NUMBER"
+STOP_NOT_ON_ROUTE = "STOP_NOT_ON_ROUTE"
+INVALID_JOURNEY_SEGMENT = "INVALID_JOURNEY_SEGMENT"
+SEAT_HOLD_CREATED_SUCCESSFULLY = "SEAT_HOLD_CREATED_SUCCESSFULLY"
+SEAT_HOLD_RELEASED_SUCCESSFULLY = "SEAT_HOLD_RELEASED_SUCCESSFULLY"
+SEAT_HOLD_NOT_FOUND = "SEAT_HOLD_NOT_FOUND"
+DUPLICATE_SEAT_NUMBERS = "Seat numbers must be unique."
+SEAT_NUMBERS_REQUIRED_WITH_HOLD = "Seat numbers are required when booking a hold."
+NOT_ENOUGH_SEATS_AVAILABLE = "NOT_ENOUGH_SEATS_AVAILABLE"
+SCHEDULE_OR_TEMPLATE_REQUIRED = "Either schedule_id, or template_id with service_date, is required."
 
 #┌────────────────────────────── FIELD VALIDATION ERROR MESSAGES ────────────────────────────────────┐
 ATLEAST_ONE_UPPER_CASE = "must contain at least one uppercase letter."
@@ -12,4 +12,13 @@ class BusTypeEnum(StrEnum):
 
 class TicketStatusEnum(StrEnum):
     BOOKED = "Booked"
-    CANCELLED = "Cancelled"    
\ No newline at end of file
+    CANCELLED = "Cancelled"    
+
+class RecurrenceEnum(StrEnum):
+    DAILY = "Daily"
+    WEEKLY = "Weekly"
+
+
+class ExportFormatEnum(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
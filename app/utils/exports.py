@@ -0,0 +1,52 @@
+import csv
+import io
+import json
+from datetime import (
+    date,
+    datetime
+)
+from typing import (
+    Any,
+    AsyncIterator,
+    Sequence
+)
+
+from app.utils.enums import ExportFormatEnum
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv"
+}
+
+
+def json_default(value: Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def to_ndjson(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
+    encode = json.JSONEncoder(default=json_default, ensure_ascii=False, separators=(",", ":")).encode
+    return "".join(encode(dict(zip(columns, row))) + "\n" for row in rows)
+
+
+def to_csv(rows: Sequence[Sequence[Any]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+async def encode_export(
+    columns: Sequence[str],
+    batches: AsyncIterator[Sequence[Sequence[Any]]],
+    export_format: ExportFormatEnum
+) -> AsyncIterator[str]:
+    """
+        Encode batches of rows as they arrive, one chunk per batch, so memory stays bounded by
+        the batch size. A CSV export starts with its header row before the first batch is read.
+    """
+    if export_format == ExportFormatEnum.CSV:
+        yield to_csv([columns])
+
+    async for rows in batches:
+        yield to_csv(rows) if export_format == ExportFormatEnum.CSV else to_ndjson(columns, rows)
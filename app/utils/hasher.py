@@ -1,7 +1,28 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor
+)
+
+from dotenv import load_dotenv
 from passlib.context import CryptContext
 
+from app.models.metrics_models import PasswordVerifierMetrics
+from app.utils.constants import (
+    DEFAULT_PASSWORD_VERIFY_QUEUE,
+    DEFAULT_PASSWORD_VERIFY_WORKERS
+)
+
+load_dotenv()
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+PASSWORD_VERIFY_WORKERS = int(os.getenv("PASSWORD_VERIFY_WORKERS", DEFAULT_PASSWORD_VERIFY_WORKERS))
+PASSWORD_VERIFY_QUEUE = int(os.getenv("PASSWORD_VERIFY_QUEUE", DEFAULT_PASSWORD_VERIFY_QUEUE))
+
 
 class Hasher():
     @staticmethod
@@ -10,4 +31,86 @@ class Hasher():
 
     @staticmethod
     def get_password_hash(password):
-        return pwd_context.hash(password)
\ No newline at end of file
+        return pwd_context.hash(password)
+
+
+class PasswordVerifierSaturated(Exception):
+    pass
+
+
+class PasswordVerifier:
+    """
+        Runs password checks on a dedicated, bounded thread pool instead of the event loop.
+
+        bcrypt releases the GIL while hashing, so checks run in parallel with each other and
+        with request handling. At most `max_workers` checks run at once and `max_queue` more
+        wait for a thread; further checks are refused with PasswordVerifierSaturated, so a
+        burst of logins sheds load instead of queueing up behind itself.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.running = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.verify_seconds = 0.0
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-verifier")
+        self.__lock = threading.Lock()
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        with self.__lock:
+            if self.in_flight >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordVerifierSaturated()
+
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+        future = self.__executor.submit(self.__verify, plain_password, hashed_password, time.perf_counter())
+        # Released when the check finishes or is cancelled before it started, not when the
+        # caller stops waiting, so abandoned checks still count against the cap
+        future.add_done_callback(self.__release)
+
+        return await asyncio.wrap_future(future)
+
+    def __verify(self, plain_password: str, hashed_password: str, submitted_at: float) -> bool:
+        started_at = time.perf_counter()
+
+        with self.__lock:
+            self.running += 1
+            self.wait_seconds += started_at - submitted_at
+
+        try:
+            return Hasher.verify_password(plain_password, hashed_password)
+        finally:
+            with self.__lock:
+                self.running -= 1
+                self.verify_seconds += time.perf_counter() - started_at
+
+    def __release(self, future: Future):
+        with self.__lock:
+            self.in_flight -= 1
+
+            if not future.cancelled():
+                self.completed += 1
+
+    def metrics(self) -> PasswordVerifierMetrics:
+        with self.__lock:
+            return PasswordVerifierMetrics(
+                max_workers=self.max_workers,
+                max_queue=self.max_queue,
+                running=self.running,
+                queued=self.in_flight - self.running,
+                peak_in_flight=self.peak_in_flight,
+                completed=self.completed,
+                rejected=self.rejected,
+                mean_wait_ms=self.wait_seconds * 1e3 / self.completed if self.completed else 0,
+                mean_verify_ms=self.verify_seconds * 1e3 / self.completed if self.completed else 0
+            )
+
+
+password_verifier = PasswordVerifier(PASSWORD_VERIFY_WORKERS, PASSWORD_VERIFY_QUEUE)
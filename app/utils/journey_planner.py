@@ -0,0 +1,271 @@
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import (
+    date,
+    datetime,
+    timedelta
+)
+from typing import Iterable
+
+from app.utils.stop_index import normalize_stop
+
+
+@dataclass(frozen=True)
+class TripStop:
+    seq: int
+    city: str
+    time: datetime
+
+
+@dataclass(frozen=True)
+class Trip:
+    schedule_id: int
+    route_id: int
+    stops: list[TripStop]
+
+
+@dataclass(frozen=True)
+class JourneyLeg:
+    schedule_id: int
+    route_id: int
+    from_stop: str
+    to_stop: str
+    from_seq: int
+    to_seq: int
+    departure_time: datetime
+    arrival_time: datetime
+
+
+@dataclass(frozen=True)
+class Journey:
+    legs: list[JourneyLeg]
+
+    @property
+    def transfers(self) -> int:
+        return len(self.legs) - 1
+
+    @property
+    def departure_time(self) -> datetime:
+        return self.legs[0].departure_time
+
+    @property
+    def arrival_time(self) -> datetime:
+        return self.legs[-1].arrival_time
+
+
+def interpolate_stop_times(
+    departure_time: datetime,
+    arrival_time: datetime,
+    route_stops: list[tuple[int, str, int | None]]
+) -> list[TripStop]:
+    """
+        Time a departure at every stop of its route: from the stop's offset_minutes when it is known,
+        otherwise spread evenly between the departure and arrival times by stop position.
+    """
+    last = len(route_stops) - 1
+    duration = arrival_time - departure_time
+    stops = []
+
+    for position, (seq, city, offset_minutes) in enumerate(route_stops):
+        if offset_minutes is not None:
+            stop_time = departure_time + timedelta(minutes=offset_minutes)
+        elif position == last:
+            stop_time = arrival_time
+        else:
+            stop_time = departure_time + duration * position / max(last, 1)
+
+        stops.append(TripStop(seq=seq, city=city, time=stop_time))
+
+    return stops
+
+
+class Timetable:
+    """
+        Connection-scan timetable of one tenant for one service day.
+
+        Every leg of every departure becomes an elementary connection (stop -> next stop), sorted by
+        departure time once when the timetable is built. A query is then a handful of linear scans over
+        that array, one per allowed number of transfers, which gives the earliest arrival for each
+        transfer count (the Pareto set of arrival time vs. transfers) without any per-query sorting.
+    """
+
+    def __init__(self, trips: Iterable[Trip]):
+        self.trips: list[Trip] = []
+        self.stop_ids: dict[str, int] = {}
+        self.stop_names: list[str] = []
+        connections = []
+
+        for trip in trips:
+            trip_index = len(self.trips)
+            self.trips.append(trip)
+
+            for position in range(len(trip.stops) - 1):
+                departure, arrival = trip.stops[position], trip.stops[position + 1]
+                connections.append((
+                    departure.time.timestamp(),
+                    arrival.time.timestamp(),
+                    self.get_stop_id(departure.city),
+                    self.get_stop_id(arrival.city),
+                    trip_index,
+                    position
+                ))
+
+        connections.sort()
+        self.connections = connections
+        self.departures = [connection[0] for connection in connections]
+
+    def get_stop_id(self, city: str) -> int:
+        key = normalize_stop(city)
+        stop_id = self.stop_ids.get(key)
+
+        if stop_id is None:
+            stop_id = self.stop_ids[key] = len(self.stop_names)
+            self.stop_names.append(city)
+
+        return stop_id
+
+    def plan(
+        self,
+        from_stop: str,
+        to_stop: str,
+        earliest_departure: datetime,
+        latest_departure: datetime,
+        min_transfer: timedelta,
+        max_transfers: int
+    ) -> list[Journey]:
+        """
+            Get the Pareto-optimal journeys from `from_stop` to `to_stop` leaving the origin between
+            `earliest_departure` and `latest_departure`: the earliest arrival for each
+            number of transfers up to `max_transfers`, keeping a journey only if it arrives earlier than
+            every journey with fewer transfers. The first one has the fewest transfers, the last one
+            arrives earliest.
+        """
+        origin = self.stop_ids.get(normalize_stop(from_stop))
+        target = self.stop_ids.get(normalize_stop(to_stop))
+
+        if origin is None or target is None or origin == target:
+            return []
+
+        start = bisect.bisect_left(self.departures, earliest_departure.timestamp())
+        last_boarding = latest_departure.timestamp()
+        transfer_seconds = min_transfer.total_seconds()
+        infinity = float("inf")
+
+        best_arrival = infinity
+        previous_arrivals: dict[int, float] = {}
+        # per round: stop -> (boarding connection, alighting connection) of the leg that reached it
+        round_labels: list[dict[int, tuple[int, int]]] = []
+        journeys = []
+
+        for transfers in range(max_transfers + 1):
+            arrivals: dict[int, float] = {}
+            labels: dict[int, tuple[int, int]] = {}
+            boarded: dict[int, int] = {}
+
+            for index in range(start, len(self.connections)):
+                departure, arrival, departure_stop, arrival_stop, trip_index, _ = self.connections[index]
+
+                # Nothing departing after the best known arrival can improve on it
+                if departure >= best_arrival:
+                    break
+
+                if trip_index not in boarded:
+                    if (departure_stop == origin and departure < last_boarding) or (
+                        transfers and previous_arrivals.get(departure_stop, infinity) + transfer_seconds <= departure
+                    ):
+                        boarded[trip_index] = index
+                    else:
+                        continue
+
+                if arrival < arrivals.get(arrival_stop, infinity):
+                    arrivals[arrival_stop] = arrival
+                    labels[arrival_stop] = (boarded[trip_index], index)
+
+            round_labels.append(labels)
+
+            if arrivals.get(target, infinity) < best_arrival:
+                best_arrival = arrivals[target]
+                journeys.append(self.build_journey(origin, target, round_labels))
+
+            previous_arrivals = arrivals
+
+        return journeys
+
+    def build_journey(self, origin: int, target: int, round_labels: list[dict[int, tuple[int, int]]]) -> Journey:
+        """
+            Walk the legs back from the target, one round (transfer) at a time, until the origin.
+        """
+        legs = []
+        stop = target
+
+        for labels in reversed(round_labels):
+            boarding, alighting = labels[stop]
+            legs.append(self.build_leg(boarding, alighting))
+            stop = self.connections[boarding][2]
+
+            if stop == origin:
+                break
+
+        return Journey(legs=legs[::-1])
+
+    def build_leg(self, boarding: int, alighting: int) -> JourneyLeg:
+        trip = self.trips[self.connections[boarding][4]]
+        departure = trip.stops[self.connections[boarding][5]]
+        arrival = trip.stops[self.connections[alighting][5] + 1]
+
+        return JourneyLeg(
+            schedule_id=trip.schedule_id,
+            route_id=trip.route_id,
+            from_stop=departure.city,
+            to_stop=arrival.city,
+            from_seq=departure.seq,
+            to_seq=arrival.seq,
+            departure_time=departure.time,
+            arrival_time=arrival.time
+        )
+
+
+class TimetableCache:
+    """
+        LRU cache of built timetables keyed by (schema, service day). Entries expire after
+        `ttl_seconds` and a tenant's entries are dropped whenever its schedules change.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 300):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.__entries: OrderedDict[tuple[str, date], tuple[Timetable, float]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, schema: str, service_day: date) -> Timetable | None:
+        with self.__lock:
+            entry = self.__entries.get((schema, service_day))
+
+            if entry is None or entry[1] < time.monotonic():
+                self.__entries.pop((schema, service_day), None)
+                return None
+
+            self.__entries.move_to_end((schema, service_day))
+            return entry[0]
+
+    def put(self, schema: str, service_day: date, timetable: Timetable):
+        with self.__lock:
+            self.__entries[(schema, service_day)] = (timetable, time.monotonic() + self.ttl_seconds)
+            self.__entries.move_to_end((schema, service_day))
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, schema: str | None = None):
+        """
+            Drop every timetable of a tenant, or of every tenant when no schema is given.
+        """
+        with self.__lock:
+            for key in [key for key in self.__entries if schema is None or key[0] == schema]:
+                del self.__entries[key]
+
+
+timetable_cache = TimetableCache()
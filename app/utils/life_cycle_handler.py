@@ -1,14 +1,31 @@
 from fastapi import FastAPI
 
+from app.connectors.database_connector import warm_tenant_registry
 from app.services.branch_service import BranchService
+from app.services.idempotency_service import IdempotencyService
+from app.services.refresh_token_service import RefreshTokenService
+from app.services.seat_hold_service import SeatHoldService
+from app.utils.background_scheduler import BackgroundScheduler
+from app.utils.constants import (
+    IDEMPOTENCY_KEY_PURGE_INTERVAL_SECONDS,
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS,
+    SEAT_HOLD_SWEEP_INTERVAL_SECONDS
+)
+
+background_scheduler = BackgroundScheduler()
+background_scheduler.every(SEAT_HOLD_SWEEP_INTERVAL_SECONDS, SeatHoldService.sweep_all)
+background_scheduler.every(REFRESH_TOKEN_PURGE_INTERVAL_SECONDS, RefreshTokenService.purge_expired)
+background_scheduler.every(IDEMPOTENCY_KEY_PURGE_INTERVAL_SECONDS, IdempotencyService.purge_all_expired)
 
 
 def __on_app_started():
     BranchService.upgrade_all()
+    warm_tenant_registry()
+    background_scheduler.start()
    
    
 def __on_app_finished():
-    pass
+    background_scheduler.stop()
 
 
 def setup_event_handlers(app: FastAPI):
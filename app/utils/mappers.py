@@ -0,0 +1,83 @@
+import threading
+from typing import Callable
+
+from pydantic import BaseModel
+
+from app.entities.branch import Branch
+from app.entities.company import Company
+from app.entities.user import User
+from app.models.branch_models import GetBranchResponse
+from app.models.company_models import GetCompanyResponse
+from app.models.user_models import GetUserResponse
+
+#┌────────────────────────────── RESPONSE MAPPERS ───────────────────────────────────────────┐
+# A mapper is a function generated once per (entity, response model) pair that copies the
+# model's fields straight off an ORM row into a new model instance. Rows come from our own
+# database, so they are trusted and skip validation, and there is no per-call reflection over
+# the model's fields either.
+
+Mapper = Callable[..., BaseModel]
+
+_mappers: dict[tuple[type, type[BaseModel]], Mapper] = {}
+_lock = threading.Lock()
+
+
+def compile_constructor(model: type[BaseModel]) -> Callable[[dict], BaseModel]:
+    """
+        Build instances of `model` from complete, trusted field values without validating them.
+
+        This is what model_construct does minus its per-call default and alias handling, which on
+        pydantic 2 costs more than validating. Models with private attributes or extra fields
+        still go through model_construct.
+    """
+    if model.__private_attributes__ or model.model_config.get("extra") == "allow":
+        return lambda values: model.model_construct(**values)
+
+    new = model.__new__
+    set_attribute = object.__setattr__
+    fields = frozenset(model.model_fields)
+
+    def construct(values: dict) -> BaseModel:
+        instance = new(model)
+        set_attribute(instance, "__dict__", values)
+        set_attribute(instance, "__pydantic_fields_set__", set(fields))
+        set_attribute(instance, "__pydantic_extra__", None)
+        set_attribute(instance, "__pydantic_private__", None)
+        return instance
+
+    return construct
+
+
+def compile_mapper(entity: type, model: type[BaseModel]) -> Mapper:
+    """
+        Generate the mapper of `entity` rows to `model`. Fields the entity has no attribute for,
+        such as nested response models, become keyword-only arguments of the mapper.
+    """
+    fields = list(model.model_fields)
+    parameters = [field for field in fields if not hasattr(entity, field)]
+    values = ", ".join(f"{field!r}: {field}" if field in parameters else f"{field!r}: source.{field}" for field in fields)
+    signature = ", ".join(["source", "*", *parameters]) if parameters else "source"
+    name = f"map_{entity.__name__.lower()}_to_{model.__name__.lower()}"
+
+    namespace = {"construct": compile_constructor(model)}
+    exec(f"def {name}({signature}):\n    return construct({{{values}}})", namespace)
+
+    return namespace[name]
+
+
+def get_mapper(entity: type, model: type[BaseModel]) -> Mapper:
+    """
+        Get the cached mapper of `entity` rows to `model`, compiling it on first use.
+    """
+    mapper = _mappers.get((entity, model))
+
+    if mapper is None:
+        with _lock:
+            mapper = _mappers.setdefault((entity, model), compile_mapper(entity, model))
+
+    return mapper
+
+
+map_branch = get_mapper(Branch, GetBranchResponse)
+map_company = get_mapper(Company, GetCompanyResponse)
+map_user = get_mapper(User, GetUserResponse)
@@ -1,89 +1,113 @@
 import traceback
+import uuid
+
 from fastapi import (
-    FastAPI, 
-    Request,
-    status,
-    HTTPException
+    FastAPI,
+    HTTPException,
+    status
 )
 from fastapi.responses import (
-    JSONResponse, 
+    JSONResponse,
     Response
 )
 from jose import JOSEError
 from pydantic import ValidationError
-from starlette.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-
-
-class CORSMiddlewareLocal(BaseHTTPMiddleware):
-    def allow_cors(self, response: Response):
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Credentials"] = "true"
-        response.headers["Access-Control-Allow-Methods"] = "*"
-        response.headers["Access-Control-Allow-Headers"] = "*"
-        return response
-
-    async def dispatch(self, request, call_next):
-        if request.method == "OPTIONS":
-            response = Response()
-            self.allow_cors(response)
-            return response
-        response = await call_next(request)
-        return self.allow_cors(response)
-
-
-class GlobalErrorHandlerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        response = ""
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send
+)
+
+from app.utils.constants import REQUEST_ID
+
+# CORS middleware we are allowing api end points from any portal. because this api can be used with any portal as well as servers
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Credentials": "true",
+    "Access-Control-Allow-Methods": "*",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Expose-Headers": "*",
+}
+
+
+class GlobalMiddleware:
+    """
+        The one middleware of the app, written against plain ASGI so a request doesn't pay for
+        the extra task and response stream of a BaseHTTPMiddleware.
+
+        It gives every request an ID, kept in request.state.request_id and sent back in the
+        X-Request-ID header, answers CORS preflights and adds the CORS headers to every response,
+        and turns exceptions that escape the routes into JSON error responses.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        request_id = request.headers.get(REQUEST_ID) or uuid.uuid4().hex
+        request.state.request_id = request_id
+        response_started = False
+
+        async def send_with_headers(message: Message):
+            nonlocal response_started
+
+            if message["type"] == "http.response.start":
+                response_started = True
+                headers = MutableHeaders(scope=message)
+                headers.update(CORS_HEADERS)
+                headers[REQUEST_ID] = request_id
+
+            await send(message)
+
+        if scope["method"] == "OPTIONS":
+            await Response()(scope, receive, send_with_headers)
+            return
+
         try:
-            response = await call_next(request)
-        except HTTPException as e:
-            response = self.__build_error_response(
-                request, e.detail, status_code=e.status_code
-            )
-        except JOSEError as e:
-            response = self.__build_error_response(
-                request,
-                content="\n".join([str(arg) for arg in e.args]),
-                status_code=status.HTTP_401_UNAUTHORIZED,
-            )
-        except ValidationError as e:
-            response = self.__build_error_response(
-                request,
-                e.__str__(),
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
+            await self.app(scope, receive, send_with_headers)
         except Exception as e:
-            response = self.__build_error_response(
-                request,
-                "\n".join([str(arg) for arg in e.args]),
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-        return response
-
-    def __build_error_response(self, request: Request, content: str, status_code):
+            # Once a response has started, e.g. a streamed export, an error can only abort it
+            if response_started:
+                raise
+
+            response = self.__build_error_response(request, e)
+            await response(scope, receive, send_with_headers)
+
+    def __build_error_response(self, request: Request, error: Exception) -> JSONResponse:
         traceback.print_exc()
+        headers = None
+
+        if isinstance(error, HTTPException):
+            content, status_code, headers = str(error.detail), error.status_code, error.headers
+        elif isinstance(error, JOSEError):
+            content, status_code = "\n".join([str(arg) for arg in error.args]), status.HTTP_401_UNAUTHORIZED
+        elif isinstance(error, ValidationError):
+            content, status_code = error.__str__(), status.HTTP_400_BAD_REQUEST
+        else:
+            content, status_code = "\n".join([str(arg) for arg in error.args]), status.HTTP_500_INTERNAL_SERVER_ERROR
+
         if hasattr(request.state, "db"):
             request.state.db.rollback()
         return JSONResponse(
             content={
                 "message": content.replace("\n", ": ").strip(),
                 "url": str(request.url),
+                "request_id": request.state.request_id,
             },
             status_code=status_code,
+            headers=headers,
             media_type="application/json",
         )
 
 
 def setup_middlewares(app: FastAPI):
-    # CORS middleware we are allowing api end points from any portal. because this api can be used with any portal as well as servers
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],  # ["GET", "POST", "PUT", "DELETE"],
-        allow_headers=["*"],  # ["Origin", "Content-Type","Authorization"],
-        expose_headers=["*"],
-    )
-    app.add_middleware(GlobalErrorHandlerMiddleware)
-    app.add_middleware(CORSMiddlewareLocal)
+    app.add_middleware(GlobalMiddleware)
@@ -0,0 +1,53 @@
+import base64
+import json
+from datetime import datetime
+from typing import Sequence
+
+import sqlalchemy as sa
+from fastapi import HTTPException
+
+from app.models.pagination_models import PageParams
+from app.utils.constants import INVALID_CURSOR
+
+#┌────────────────────────────── KEYSET PAGINATION ──────────────────────────────────────────┐
+# Pages are ordered by (created_at, id) and continue strictly after the last row of the
+# previous page, so every page is an index range scan no matter how deep the client goes.
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    payload = json.dumps([created_at.isoformat(), id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=400,
+            detail=INVALID_CURSOR
+        )
+
+
+def paginate(statement: sa.Select, entity, page: PageParams) -> sa.Select:
+    """
+        Restrict a select over `entity` to one keyset page, fetching one extra row to detect a next page.
+    """
+    if page.cursor:
+        created_at, id = decode_cursor(page.cursor)
+        statement = statement.where(sa.tuple_(entity.created_at, entity.id) > sa.tuple_(created_at, id))
+
+    return statement.order_by(entity.created_at, entity.id).limit(page.page_size + 1)
+
+
+def split_page(rows: Sequence, page: PageParams) -> tuple[Sequence, str | None]:
+    """
+        Trim the extra row fetched by paginate and build the cursor of the next page.
+    """
+    if len(rows) <= page.page_size:
+        return rows, None
+
+    rows = rows[:page.page_size]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
@@ -0,0 +1,59 @@
+from pydantic import BaseModel
+from sqlalchemy.orm import Bundle
+
+from app.entities.bus import Bus
+from app.entities.company import Company
+from app.entities.route import Route
+from app.entities.schedule import Schedule
+from app.entities.ticket import Ticket
+from app.models.bus_models import (
+    GetBusResponse,
+    GetBusScheduleResponse,
+    GetRouteResponse
+)
+from app.models.company_models import GetCompanyResponse
+from app.models.ticket_models import GetTicketResponse
+from app.utils.mappers import compile_constructor
+
+#┌────────────────────────────── RESPONSE PROJECTIONS ───────────────────────────────────────┐
+# Selecting a projection fetches only the columns of its response model and builds the model
+# straight from each row, nested models included, so a joined read is one round trip with no
+# ORM entities, identity map entries or per-row mapping in between.
+
+
+class ResponseBundle(Bundle):
+    """
+        Bundle whose rows load into a pydantic response model instead of a keyed tuple.
+        Rows come from our own database, so the model is constructed without validation.
+    """
+
+    def __init__(self, name: str, model: type[BaseModel], *exprs, **kwargs):
+        super().__init__(name, *exprs, **kwargs)
+        self.model = model
+        self.construct = compile_constructor(model)
+
+    def create_row_processor(self, query, procs, labels):
+        construct = self.construct
+
+        def proc(row):
+            return construct({label: process(row) for process, label in zip(procs, labels)})
+
+        return proc
+
+
+def project(model: type[BaseModel], entity, *nested: ResponseBundle, name: str | None = None) -> ResponseBundle:
+    """
+        Build the projection of `model` over `entity`: one column per field, with the
+        fields named after a nested projection loaded through it.
+    """
+    nested_by_name = {bundle.name: bundle for bundle in nested}
+    exprs = [nested_by_name.get(field) or getattr(entity, field) for field in model.model_fields]
+
+    return ResponseBundle(name or entity.__tablename__, model, *exprs)
+
+
+COMPANY_PROJECTION = project(GetCompanyResponse, Company, name="company_data")
+BUS_PROJECTION = project(GetBusResponse, Bus, COMPANY_PROJECTION, name="bus_data")
+ROUTE_PROJECTION = project(GetRouteResponse, Route, name="route_data")
+SCHEDULE_PROJECTION = project(GetBusScheduleResponse, Schedule, BUS_PROJECTION, ROUTE_PROJECTION)
+TICKET_PROJECTION = project(GetTicketResponse, Ticket, BUS_PROJECTION)
@@ -0,0 +1,70 @@
+import asyncio
+import functools
+from typing import (
+    Any,
+    Callable
+)
+
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.responses import (
+    JSONResponse,
+    Response
+)
+
+
+class ModelJSONResponse(JSONResponse):
+    """
+        JSON response that renders a pydantic model with pydantic-core's serializer in one pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+
+        return super().render(content)
+
+
+class ModelResponseRoute(APIRoute):
+    """
+        Route class that lets a route opt out of FastAPI's response processing with
+        response_class=ModelJSONResponse.
+
+        FastAPI dumps the returned model to a dict, validates that against response_model and then
+        encodes it again. For opted-in routes the returned model is rendered as is instead, so an
+        endpoint must return an instance of its response model, built from data we trust.
+        response_model is still used for the OpenAPI schema.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        response_class = kwargs.get("response_class")
+
+        if isinstance(response_class, type) and issubclass(response_class, ModelJSONResponse):
+            endpoint = self.render_returned_model(endpoint, response_class, kwargs.get("status_code"))
+
+        super().__init__(path, endpoint, **kwargs)
+
+    @staticmethod
+    def render_returned_model(
+        endpoint: Callable[..., Any],
+        response_class: type[ModelJSONResponse],
+        status_code: int | None
+    ) -> Callable[..., Any]:
+        status_code = status_code or 200
+
+        def render(content: Any) -> Response:
+            if isinstance(content, Response):
+                return content
+            return response_class(content, status_code=status_code)
+
+        # functools.wraps keeps the endpoint's signature, which FastAPI reads its dependencies from
+        if asyncio.iscoroutinefunction(endpoint):
+            @functools.wraps(endpoint)
+            async def model_endpoint(*args, **kwargs):
+                return render(await endpoint(*args, **kwargs))
+        else:
+            @functools.wraps(endpoint)
+            def model_endpoint(*args, **kwargs):
+                return render(endpoint(*args, **kwargs))
+
+        return model_endpoint
@@ -0,0 +1,108 @@
+from datetime import (
+    date,
+    datetime,
+    timedelta
+)
+from typing import Iterator
+
+from app.entities.schedule_template import ScheduleTemplate
+from app.utils.enums import RecurrenceEnum
+
+
+def weekdays_to_mask(weekdays: list[int]) -> int:
+    mask = 0
+
+    for weekday in weekdays:
+        mask |= 1 << weekday
+    return mask
+
+
+def mask_to_weekdays(mask: int) -> list[int]:
+    return [weekday for weekday in range(7) if mask & (1 << weekday)]
+
+
+def runs_on(template: ScheduleTemplate, service_date: date) -> bool:
+    """
+        Check whether a template has a departure on a given day.
+    """
+    if service_date < template.valid_from:
+        return False
+    if template.valid_until and service_date > template.valid_until:
+        return False
+    if template.recurrence == RecurrenceEnum.WEEKLY and not template.weekdays & (1 << service_date.weekday()):
+        return False
+
+    return service_date.isoformat() not in template.excluded_dates
+
+
+def departure_window(template: ScheduleTemplate, service_date: date) -> tuple[datetime, datetime]:
+    departure_time = datetime.combine(service_date, template.departure_time)
+    return departure_time, departure_time + timedelta(minutes=template.duration_minutes)
+
+
+def expand_template(template: ScheduleTemplate, start_date: date, end_date: date) -> Iterator[date]:
+    """
+        Yield the service dates of a template between two days, both included.
+    """
+    service_date = max(start_date, template.valid_from)
+    last_date = min(end_date, template.valid_until) if template.valid_until else end_date
+
+    while service_date <= last_date:
+        if runs_on(template, service_date):
+            yield service_date
+        service_date += timedelta(days=1)
+
+
+def overlapping_departures(
+    template: ScheduleTemplate,
+    departure_time: datetime,
+    arrival_time: datetime,
+    skipped_date: date | None = None
+) -> Iterator[date]:
+    """
+        Yield the service dates of a template, other than `skipped_date`, whose departure is on
+        the road between two times.
+    """
+    service_date = (departure_time - timedelta(minutes=template.duration_minutes)).date()
+
+    while service_date <= arrival_time.date():
+        if service_date != skipped_date and runs_on(template, service_date):
+            start, end = departure_window(template, service_date)
+
+            if start < arrival_time and departure_time < end:
+                yield service_date
+        service_date += timedelta(days=1)
+
+
+def find_overlapping_departure(
+    template: ScheduleTemplate,
+    departure_time: datetime,
+    arrival_time: datetime,
+    skipped_date: date | None = None
+) -> date | None:
+    return next(overlapping_departures(template, departure_time, arrival_time, skipped_date), None)
+
+
+def templates_overlap(template: ScheduleTemplate, other: ScheduleTemplate) -> bool:
+    """
+        Check whether two templates, or two departures of one template, are ever on the road at once.
+
+        Past their last excluded date both repeat every week, so checking their common validity
+        up to a week after that date, or after it starts, covers every departure.
+    """
+    first_date = max(template.valid_from, other.valid_from)
+    excluded_dates = [date.fromisoformat(excluded) for excluded in template.excluded_dates + other.excluded_dates]
+    last_date = max([first_date] + excluded_dates) + timedelta(days=7)
+
+    for valid_until in (template.valid_until, other.valid_until):
+        if valid_until:
+            last_date = min(last_date, valid_until)
+
+    for service_date in expand_template(template, first_date, last_date):
+        departure_time, arrival_time = departure_window(template, service_date)
+        skipped_date = service_date if other is template else None
+
+        if find_overlapping_departure(other, departure_time, arrival_time, skipped_date) is not None:
+            return True
+
+    return False
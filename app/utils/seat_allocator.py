@@ -0,0 +1,128 @@
+from functools import lru_cache
+
+from app.utils.enums import BusTypeEnum
+from app.utils.seat_bitmap import SeatBitmap
+
+# Seats either side of the aisle in a row: AC coaches are laid out 2+1, the others 2+2
+SEAT_LAYOUTS: dict[str, tuple[int, ...]] = {
+    BusTypeEnum.AC: (2, 1),
+    BusTypeEnum.NON_AC: (2, 2),
+}
+
+
+class SeatLayout:
+    """
+        Rows of a bus, numbered from the front with seats numbered left to right, so seat N
+        sits in row (N-1) // columns. Seat N is bit N-1 of a seat mask, as in SeatBitmap.
+    """
+
+    def __init__(self, total_seats: int, sides: tuple[int, ...]):
+        self.total_seats = total_seats
+        self.sides = sides
+        self.columns = sum(sides)
+        self.rows = -(-total_seats // self.columns)
+        self.all_seats = (1 << total_seats) - 1
+        self.__windows: dict[int, tuple[int, ...]] = {}
+
+    @classmethod
+    def for_bus(cls, bus_type: str, total_seats: int) -> "SeatLayout":
+        return get_layout(bus_type, total_seats)
+
+    def row_mask(self, first_row: int, rows: int = 1) -> int:
+        return (((1 << (rows * self.columns)) - 1) << (first_row * self.columns)) & self.all_seats
+
+    def windows(self, party_size: int) -> tuple[int, ...]:
+        """
+            Masks of the blocks of `party_size` seats next to each other in a row, best first:
+            blocks on one side of the aisle, then blocks across it, front rows first.
+        """
+        windows = self.__windows.get(party_size)
+
+        if windows is None:
+            windows = self.__windows[party_size] = self.build_windows(party_size)
+        return windows
+
+    def build_windows(self, party_size: int) -> tuple[int, ...]:
+        same_side, across_aisle = [], []
+
+        for row in range(self.rows):
+            first_seat = row * self.columns
+            side_start = 0
+
+            for width in self.sides:
+                for offset in range(width - party_size + 1):
+                    same_side.append(((1 << party_size) - 1) << (first_seat + side_start + offset))
+                side_start += width
+
+            if party_size <= self.columns:
+                for offset in range(self.columns - party_size + 1):
+                    across_aisle.append(((1 << party_size) - 1) << (first_seat + offset))
+
+        same_side_windows = set(same_side)
+        windows = same_side + [window for window in across_aisle if window not in same_side_windows]
+
+        return tuple(window for window in windows if window & self.all_seats == window)
+
+
+@lru_cache(maxsize=256)
+def get_layout(bus_type: str, total_seats: int) -> SeatLayout:
+    return SeatLayout(total_seats, SEAT_LAYOUTS.get(bus_type, SEAT_LAYOUTS[BusTypeEnum.NON_AC]))
+
+
+def free_seats_mask(bitmap: SeatBitmap, total_seats: int) -> int:
+    """
+        Mask of the seats of a bus that are free in a seat bitmap.
+    """
+    return ~int.from_bytes(bitmap.data, "little") & ((1 << total_seats) - 1)
+
+
+def lowest_seats(mask: int, count: int) -> int:
+    """
+        The `count` lowest numbered seats of a mask.
+    """
+    chosen = 0
+
+    for _ in range(count):
+        seat = mask & -mask
+        chosen |= seat
+        mask ^= seat
+
+    return chosen
+
+
+def seat_numbers(mask: int) -> list[int]:
+    numbers = []
+
+    while mask:
+        seat = mask & -mask
+        numbers.append(seat.bit_length())
+        mask ^= seat
+
+    return numbers
+
+
+def allocate_seats(layout: SeatLayout, free: int, party_size: int) -> list[int] | None:
+    """
+        Pick the best free seats for a party travelling together, or None when too few are free.
+
+        A party that fits in a row gets adjacent seats, on one side of the aisle when possible.
+        Otherwise, or when no such block is free, it gets the front-most of the smallest runs of
+        consecutive rows with enough free seats, filled from the front.
+    """
+    free &= layout.all_seats
+
+    if free.bit_count() < party_size:
+        return None
+
+    for window in layout.windows(party_size):
+        if free & window == window:
+            return seat_numbers(window)
+
+    for rows in range(-(-party_size // layout.columns), layout.rows + 1):
+        for first_row in range(layout.rows - rows + 1):
+            block = free & layout.row_mask(first_row, rows)
+
+            if block.bit_count() >= party_size:
+                return seat_numbers(lowest_seats(block, party_size))
+
+    return None
@@ -0,0 +1,78 @@
+# Legs of a route are bits of a Postgres bigint, the sign bit is left alone
+MAX_ROUTE_SEGMENTS = 63
+
+
+def segment_mask(boarding_seq: int, alighting_seq: int) -> int:
+    """
+        Bitset of the legs travelled between two stops of a route.
+
+        Leg N runs from stop N to stop N+1 and is bit N-1, so a journey from stop 2 to
+        stop 5 covers legs 2-4 (0b1110). Two journeys share a seat when their masks AND to 0.
+    """
+    if not 1 <= boarding_seq < alighting_seq <= MAX_ROUTE_SEGMENTS + 1:
+        raise ValueError(f"invalid journey segment {boarding_seq} -> {alighting_seq}")
+
+    return ((1 << (alighting_seq - boarding_seq)) - 1) << (boarding_seq - 1)
+
+
+class SeatBitmap:
+    """
+        Seats of a departure taken for one journey, one bit per seat, built in memory from the
+        segment_masks bigint[] of its seat inventory; it is never stored.
+
+        Seat N (1-based) is bit N-1, numbered from the least significant bit of the first byte.
+    """
+
+    def __init__(self, total_seats: int, data: bytes | None = None):
+        self.total_seats = total_seats
+        self.data = bytearray(data or b"")
+        size = self.size_for(total_seats)
+
+        if len(self.data) < size:
+            self.data.extend(bytes(size - len(self.data)))
+
+    @classmethod
+    def from_segment_masks(cls, total_seats: int, masks: list[int], journey_mask: int) -> "SeatBitmap":
+        """
+            Bitmap of the seats that are taken on any leg of a journey. Inventories only grow,
+            so masks past `total_seats` belong to seats the bus no longer has and are left out.
+        """
+        bitmap = cls(total_seats)
+
+        for seat_number, mask in enumerate(masks[:total_seats], start=1):
+            if mask & journey_mask:
+                bitmap.book(seat_number)
+
+        return bitmap
+
+    @staticmethod
+    def size_for(total_seats: int) -> int:
+        return (total_seats + 7) // 8
+
+    @staticmethod
+    def bit_for(seat_number: int) -> int:
+        return seat_number - 1
+
+    def is_valid_seat(self, seat_number: int) -> bool:
+        return 1 <= seat_number <= self.total_seats
+
+    def is_booked(self, seat_number: int) -> bool:
+        bit = self.bit_for(seat_number)
+        return bool(self.data[bit >> 3] & (1 << (bit & 7)))
+
+    def book(self, seat_number: int):
+        bit = self.bit_for(seat_number)
+        self.data[bit >> 3] |= 1 << (bit & 7)
+
+    def release(self, seat_number: int):
+        bit = self.bit_for(seat_number)
+        self.data[bit >> 3] &= ~(1 << (bit & 7))
+
+    def booked_seats(self) -> list[int]:
+        return [seat for seat in range(1, self.total_seats + 1) if self.is_booked(seat)]
+
+    def available_seats(self) -> list[int]:
+        return [seat for seat in range(1, self.total_seats + 1) if not self.is_booked(seat)]
+
+    def booked_count(self) -> int:
+        return len(self.booked_seats())
@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Iterable
+
+
+def normalize_stop(stop: str) -> str:
+    return " ".join(stop.split()).casefold()
+
+
+class StopIndex:
+    """
+        Inverted index of stop -> [(route_id, seq)] built from the route_stops of a tenant.
+
+        A route serves a trip when it visits the origin before the destination, so searching is
+        one dictionary lookup per stop plus a walk over the routes that touch the origin.
+    """
+
+    def __init__(self, route_stops: Iterable[tuple[int, int, str]]):
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        self.routes: dict[int, dict[int, str]] = {}
+
+        for route_id, seq, city in route_stops:
+            self.routes.setdefault(route_id, {})[seq] = city
+            self.postings.setdefault(normalize_stop(city), []).append((route_id, seq))
+
+    def find_routes(self, from_stop: str, to_stop: str) -> dict[int, tuple[int, int]]:
+        """
+            Map every route visiting `from_stop` before `to_stop` to the (from, to) stop sequence numbers.
+        """
+        origins: dict[int, int] = {}
+
+        for route_id, seq in self.postings.get(normalize_stop(from_stop), []):
+            origins[route_id] = min(seq, origins.get(route_id, seq))
+
+        matches: dict[int, tuple[int, int]] = {}
+
+        for route_id, seq in self.postings.get(normalize_stop(to_stop), []):
+            origin = origins.get(route_id)
+
+            if origin is not None and origin < seq and seq < matches.get(route_id, (origin, seq + 1))[1]:
+                matches[route_id] = (origin, seq)
+
+        return matches
+
+    def stop_name(self, route_id: int, seq: int) -> str:
+        return self.routes[route_id][seq]
+
+
+class StopIndexCache:
+    """
+        Per-tenant StopIndex cache. Routes and route_stops are only written by migrations: a
+        tenant's entry is dropped when this process migrates it, and otherwise, e.g. after
+        migrations run from the command line, expires after `ttl_seconds`.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl_seconds = ttl_seconds
+        self.__entries: dict[str, tuple[StopIndex, float]] = {}
+        self.__lock = threading.Lock()
+
+    def get(self, schema: str) -> StopIndex | None:
+        with self.__lock:
+            entry = self.__entries.get(schema)
+
+            if entry is None or entry[1] < time.monotonic():
+                self.__entries.pop(schema, None)
+                return None
+
+            return entry[0]
+
+    def put(self, schema: str, index: StopIndex):
+        with self.__lock:
+            self.__entries[schema] = (index, time.monotonic() + self.ttl_seconds)
+
+    def invalidate(self, schema: str | None = None):
+        """
+            Drop the index of a single tenant, or of every tenant when no schema is given.
+        """
+        with self.__lock:
+            if schema is None:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(schema, None)
+
+
+stop_index_cache = StopIndexCache()
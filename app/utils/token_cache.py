@@ -0,0 +1,107 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from app.models.metrics_models import TokenCacheMetrics
+from app.models.user_models import CurrentContextUser
+
+
+class RevokedTokenError(Exception):
+    def __init__(self):
+        self.message = "Token has been revoked"
+        super().__init__(self.message)
+
+
+class VerifiedTokenCache:
+    """
+        In-process LRU of bearer tokens whose signature has been verified, keyed by the token's
+        SHA-256 digest, so repeat requests skip decoding and HMAC verification.
+
+        Entries live until the token's own `exp`. Revocation is per worker process: a revoked
+        token is remembered until it would have expired anyway.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict[bytes, tuple[CurrentContextUser, float]] = OrderedDict()
+        # digest -> exp of revoked tokens
+        self.__revoked_tokens: dict[bytes, float] = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> CurrentContextUser | None:
+        """
+            Return the user of a verified, unexpired token, or None when it has to be verified.
+            Raises RevokedTokenError for a revoked token.
+        """
+        key = self.digest(token)
+
+        with self.__lock:
+            if key in self.__revoked_tokens:
+                raise RevokedTokenError()
+
+            entry = self.__entries.get(key)
+
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    del self.__entries[key]
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, token: str, user: CurrentContextUser, expires_at: float):
+        """
+            Cache the user of a freshly verified token, evicting the least recently used entry
+            when full. Raises RevokedTokenError for a revoked token.
+        """
+        key = self.digest(token)
+
+        with self.__lock:
+            if key in self.__revoked_tokens:
+                raise RevokedTokenError()
+
+            self.__entries[key] = (user, expires_at)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def revoke(self, token: str, expires_at: float):
+        """
+            Reject a token from now on, e.g. after logout.
+        """
+        key = self.digest(token)
+        now = time.time()
+
+        with self.__lock:
+            self.__entries.pop(key, None)
+            self.__revoked_tokens = {
+                revoked: exp for revoked, exp in self.__revoked_tokens.items() if exp > now
+            }
+            self.__revoked_tokens[key] = expires_at
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def metrics(self) -> TokenCacheMetrics:
+        with self.__lock:
+            lookups = self.hits + self.misses
+
+            return TokenCacheMetrics(
+                size=len(self.__entries),
+                max_size=self.max_size,
+                hits=self.hits,
+                misses=self.misses,
+                hit_rate=self.hits / lookups if lookups else 0,
+                revoked_tokens=len(self.__revoked_tokens)
+            )
@@ -0,0 +1,65 @@
+"""
+    Requests/sec benchmark for tenant read endpoints.
+
+    Run it against a worker started from the previous commit (sync services) and
+    against one started from this commit (async services), with the same database:
+
+        uvicorn app.main:app --workers 1
+        python benchmarks/bench_async_db.py --token "<jwt>" --path /buses --concurrency 64
+
+    A single slow query used to stall the whole worker, so the sync build tops out
+    near 1 / query latency; the async build should scale with --concurrency until
+    the connection pool or Postgres saturates.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def worker(client: httpx.AsyncClient, path: str, count: int, latencies: list[float], failures: list[int]):
+    for _ in range(count):
+        started = time.perf_counter()
+        response = await client.get(path)
+        latencies.append(time.perf_counter() - started)
+
+        if response.status_code != 200:
+            failures.append(response.status_code)
+
+
+async def run(args: argparse.Namespace):
+    headers = {"Authorization": f"Bearer {args.token}"}
+    latencies: list[float] = []
+    failures: list[int] = []
+    per_worker = max(1, args.requests // args.concurrency)
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.url, headers=headers, limits=limits, timeout=60) as client:
+        await client.get(args.path)  # warm up the tenant registry and connection pool
+
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            worker(client, args.path, per_worker, latencies, failures)
+            for _ in range(args.concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"path:        {args.path}")
+    print(f"requests:    {len(latencies)} ({len(failures)} failed)")
+    print(f"concurrency: {args.concurrency}")
+    print(f"req/sec:     {len(latencies) / elapsed:.1f}")
+    print(f"p50 (ms):    {statistics.median(latencies) * 1000:.2f}")
+    print(f"p99 (ms):    {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", default="/buses")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,88 @@
+"""
+    Query latency of the connection-scan journey planner on a synthetic tenant day.
+
+        python benchmarks/bench_journey_planner.py --departures 5000 --queries 500
+
+    Departures run on random routes over a pool of cities, spread over the day, so most
+    queries need one or two transfers. Build time is paid once per tenant and day, queries
+    only scan the prebuilt connection array.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import (
+    datetime,
+    timedelta
+)
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.journey_planner import (  # noqa: E402
+    Timetable,
+    Trip,
+    interpolate_stop_times
+)
+
+
+def build_trips(departures: int, cities: int, stops_per_route: int, day: datetime) -> list[Trip]:
+    names = [f"City {index}" for index in range(cities)]
+    trips = []
+
+    for schedule_id in range(1, departures + 1):
+        route = random.sample(names, stops_per_route)
+        departure = day + timedelta(minutes=random.randrange(0, 20 * 60))
+        arrival = departure + timedelta(minutes=45 * (stops_per_route - 1))
+        trips.append(Trip(
+            schedule_id=schedule_id,
+            route_id=schedule_id,
+            stops=interpolate_stop_times(departure, arrival, [(seq, city, None) for seq, city in enumerate(route, start=1)])
+        ))
+
+    return trips
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--departures", type=int, default=5000)
+    parser.add_argument("--cities", type=int, default=200)
+    parser.add_argument("--stops-per-route", type=int, default=6)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--max-transfers", type=int, default=2)
+    args = parser.parse_args()
+
+    random.seed(7)
+    day = datetime(2025, 6, 1)
+    trips = build_trips(args.departures, args.cities, args.stops_per_route, day)
+
+    started = time.perf_counter()
+    timetable = Timetable(trips)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    latencies = []
+    found = 0
+    for _ in range(args.queries):
+        origin, destination = random.sample(timetable.stop_names, 2)
+        started = time.perf_counter()
+        journeys = timetable.plan(
+            origin,
+            destination,
+            earliest_departure=day + timedelta(hours=random.randrange(0, 12)),
+            latest_departure=day + timedelta(days=1),
+            min_transfer=timedelta(minutes=30),
+            max_transfers=args.max_transfers
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+        found += bool(journeys)
+
+    latencies.sort()
+    print(f"connections: {len(timetable.connections)}  build: {build_ms:.1f} ms")
+    print(f"queries: {args.queries}  with a journey: {found}")
+    print(f"latency ms  mean: {statistics.mean(latencies):.2f}  "
+          f"p50: {latencies[len(latencies) // 2]:.2f}  p95: {latencies[int(len(latencies) * 0.95)]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+    Per-request latency the middleware stack adds to a trivial endpoint.
+
+        python benchmarks/bench_middleware.py --requests 5000
+
+    "base" is the stack the app used to register: two BaseHTTPMiddleware subclasses, for CORS
+    and error handling, around Starlette's CORSMiddleware. "asgi" is GlobalMiddleware, which
+    does the same in one pure ASGI middleware. "none" is the bare app, for reference. Requests
+    are driven straight through the ASGI interface, so no HTTP client or server is timed.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi import (  # noqa: E402
+    FastAPI,
+    HTTPException
+)
+from fastapi.responses import (  # noqa: E402
+    JSONResponse,
+    Response
+)
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.middleware.cors import CORSMiddleware  # noqa: E402
+
+from app.utils.middlewares import setup_middlewares  # noqa: E402
+
+
+class CORSMiddlewareLocal(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = Response() if request.method == "OPTIONS" else await call_next(request)
+        response.headers["Access-Control-Allow-Origin"] = "*"
+        response.headers["Access-Control-Allow-Credentials"] = "true"
+        response.headers["Access-Control-Allow-Methods"] = "*"
+        response.headers["Access-Control-Allow-Headers"] = "*"
+        return response
+
+
+class GlobalErrorHandlerMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        try:
+            return await call_next(request)
+        except HTTPException as e:
+            return JSONResponse({"message": e.detail, "url": str(request.url)}, status_code=e.status_code)
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    if stack == "base":
+        app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"], expose_headers=["*"])
+        app.add_middleware(GlobalErrorHandlerMiddleware)
+        app.add_middleware(CORSMiddlewareLocal)
+    elif stack == "asgi":
+        setup_middlewares(app)
+    return app
+
+
+async def call(app: FastAPI) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/ping", "raw_path": b"/ping", "root_path": "", "query_string": b"", "server": ("test", 80),
+        "client": ("test", 1234), "headers": [(b"host", b"test"), (b"origin", b"http://portal.test")],
+    }
+    status_code = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+
+    await app(scope, receive, send)
+    return status_code
+
+
+async def measure(name: str, app: FastAPI, requests: int) -> float:
+    timings = []
+
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(requests):
+            await call(app)
+        timings.append((time.perf_counter() - started) / requests)
+
+    mean = statistics.mean(timings)
+    print(f"{name:<8} mean {mean * 1e6:8.2f} us/request   best {min(timings) * 1e6:8.2f} us/request")
+    return mean
+
+
+async def run(args: argparse.Namespace):
+    apps = {stack: build_app(stack) for stack in ("none", "base", "asgi")}
+
+    for app in apps.values():
+        # Builds the middleware stack outside the timings
+        assert await call(app) == 200
+
+    bare = await measure("none", apps["none"], args.requests)
+    before = await measure("base", apps["base"], args.requests)
+    after = await measure("asgi", apps["asgi"], args.requests)
+    print(f"overhead base {(before - bare) * 1e6:.2f} us, asgi {(after - bare) * 1e6:.2f} us, speedup {before / after:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
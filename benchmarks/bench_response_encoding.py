@@ -0,0 +1,98 @@
+"""
+    CPU cost of encoding a large ApiResponse[CursorPage[GetTicketResponse]] page.
+
+        python benchmarks/bench_response_encoding.py --items 1000 --repeat 20
+
+    "fastapi" is FastAPI's default response path: dump the returned model, validate it
+    against response_model, serialize it again and json.dumps the result. "model" is what
+    routes opted in with response_class=ModelJSONResponse do: one pydantic-core pass over
+    the returned model.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+
+from app.models.base_response_model import (  # noqa: E402
+    ApiResponse,
+    CursorPage
+)
+from app.models.bus_models import GetBusResponse  # noqa: E402
+from app.models.company_models import GetCompanyResponse  # noqa: E402
+from app.models.ticket_models import GetTicketResponse  # noqa: E402
+from app.utils.responses import ModelJSONResponse  # noqa: E402
+
+
+def build_page(items: int) -> ApiResponse:
+    now = datetime.now()
+    company = GetCompanyResponse(
+        id=1, name="Orange Travels", contact_person_name="Ravi", email="ops@orange.in",
+        address="Kadapa", phone_number="9999999999", created_at=now, updated_at=now, is_active=True
+    )
+    bus = GetBusResponse(
+        id=1, company_id=1, bus_number="AP04T1234", bus_type="AC", total_seats=40,
+        created_at=now, is_active=True, company_data=company
+    )
+    tickets = [
+        GetTicketResponse(
+            id=index, schedule_id=index // 40, seat_number=index % 40 + 1, boarding_seq=1, alighting_seq=4,
+            passenger_name="Passenger Name", passenger_contact="9999999999", passenger_email="p@x.com",
+            status="Booked", created_at=now, updated_at=now, bus_data=bus
+        )
+        for index in range(items)
+    ]
+    return ApiResponse(data=CursorPage[GetTicketResponse](items=tickets, page_size=items))
+
+
+async def encode_fastapi(field, content: ApiResponse) -> bytes:
+    return JSONResponse(await serialize_response(field=field, response_content=content, is_coroutine=True)).body
+
+
+async def encode_model(field, content: ApiResponse) -> bytes:
+    return ModelJSONResponse(content).body
+
+
+async def measure(name: str, encode, field, content: ApiResponse, repeat: int) -> float:
+    timings = []
+    size = 0
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(await encode(field, content))
+        timings.append(time.perf_counter() - started)
+
+    mean = statistics.mean(timings)
+    print(f"{name:<8} mean {mean * 1e3:8.2f} ms   {mean * 1e9 / size:7.2f} ns/byte   ({size} bytes)")
+    return mean
+
+
+async def run(args: argparse.Namespace):
+    content = build_page(args.items)
+    field = create_model_field(name="Response", type_=ApiResponse[CursorPage[GetTicketResponse]], mode="serialization")
+    assert await encode_fastapi(field, content) == await encode_model(field, content)
+
+    before = await measure("fastapi", encode_fastapi, field, content, args.repeat)
+    after = await measure("model", encode_model, field, content, args.repeat)
+    print(f"speedup  {before / after:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+    Per-row cost of turning ticket rows (with their bus and company) into GetTicketResponse.
+
+        python benchmarks/bench_response_mappers.py --tickets 10000 --repeat 5
+
+    "before" is the old path: validated model construction with py-automapper for the
+    embedded company, which reflects over the model on every call. "after" uses mappers
+    compiled once by app/utils/mappers.py. The before run is skipped when py-automapper is
+    no longer installed.
+"""
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.entities.bus import Bus  # noqa: E402
+from app.entities.company import Company  # noqa: E402
+from app.entities.ticket import Ticket  # noqa: E402
+from app.models.bus_models import GetBusResponse  # noqa: E402
+from app.models.company_models import GetCompanyResponse  # noqa: E402
+from app.models.ticket_models import GetTicketResponse  # noqa: E402
+from app.utils.mappers import (  # noqa: E402
+    get_mapper,
+    map_company
+)
+
+try:
+    from automapper import mapper
+except ImportError:
+    mapper = None
+
+
+def build_rows(tickets: int, buses: int) -> list[tuple[Ticket, Bus, Company]]:
+    now = datetime.now()
+    companies = [
+        Company(
+            id=index, name=f"Company {index}", contact_person_name="Ravi", email=f"c{index}@x.com",
+            address="Kadapa", phone_number="9999999999", created_at=now, updated_at=now, is_active=True
+        )
+        for index in range(buses)
+    ]
+    fleet = [
+        Bus(
+            id=index, company_id=index, bus_number=f"AP{index:04d}", bus_type="AC",
+            total_seats=40, created_at=now, updated_at=now, is_active=True
+        )
+        for index in range(buses)
+    ]
+    rows = []
+
+    for index in range(tickets):
+        bus = fleet[index % buses]
+        ticket = Ticket(
+            id=index, ticket_number=f"T{index}", bus_id=bus.id, schedule_id=index // 40, seat_number=index % 40 + 1,
+            boarding_seq=1, alighting_seq=4, passenger_name="Passenger", passenger_contact="9999999999",
+            passenger_email="p@x.com", status="Booked", created_at=now, updated_at=now
+        )
+        rows.append((ticket, bus, companies[bus.company_id]))
+
+    return rows
+
+
+def map_before(ticket: Ticket, bus: Bus, company: Company) -> GetTicketResponse:
+    return GetTicketResponse(
+        id=ticket.id,
+        schedule_id=ticket.schedule_id,
+        seat_number=ticket.seat_number,
+        boarding_seq=ticket.boarding_seq,
+        alighting_seq=ticket.alighting_seq,
+        passenger_name=ticket.passenger_name,
+        passenger_contact=ticket.passenger_contact,
+        passenger_email=ticket.passenger_email,
+        status=ticket.status,
+        created_at=ticket.created_at,
+        updated_at=ticket.updated_at,
+        bus_data=GetBusResponse(
+            id=bus.id,
+            company_id=bus.company_id,
+            bus_number=bus.bus_number,
+            bus_type=bus.bus_type,
+            total_seats=bus.total_seats,
+            created_at=bus.created_at,
+            is_active=bus.is_active,
+            company_data=mapper.to(GetCompanyResponse).map(company)
+        )
+    )
+
+
+map_bus = get_mapper(Bus, GetBusResponse)
+map_ticket = get_mapper(Ticket, GetTicketResponse)
+
+
+def map_after(ticket: Ticket, bus: Bus, company: Company) -> GetTicketResponse:
+    return map_ticket(ticket, bus_data=map_bus(bus, company_data=map_company(company)))
+
+
+def measure(name: str, convert, rows: list, repeat: int):
+    timings = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            convert(*row)
+        timings.append((time.perf_counter() - started) / len(rows))
+
+    print(f"{name:<8} mean {statistics.mean(timings) * 1e6:8.2f} us/row   best {min(timings) * 1e6:8.2f} us/row")
+    return statistics.mean(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickets", type=int, default=10_000)
+    parser.add_argument("--buses", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = build_rows(args.tickets, args.buses)
+    response = map_after(*rows[0])
+    assert response == GetTicketResponse.model_validate(response.model_dump())
+    print(f"{args.tickets} tickets over {args.buses} buses, {args.repeat} runs")
+
+    after = measure("after", map_after, rows, args.repeat)
+
+    if mapper is None:
+        print("before   skipped, py-automapper is not installed")
+        return
+
+    before = measure("before", map_before, rows, args.repeat)
+    print(f"speedup  {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
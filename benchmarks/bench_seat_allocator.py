@@ -0,0 +1,70 @@
+"""
+    Latency of picking seats for a party from a departure's seat map.
+
+        python benchmarks/bench_seat_allocator.py --seats 40 --occupancy 0.7 --calls 20000
+
+    Each call allocates for a random party size on one of a set of random seat maps at the
+    given occupancy, the way a booking does once it has read the departure's seat bitmap.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.enums import BusTypeEnum  # noqa: E402
+from app.utils.seat_allocator import (  # noqa: E402
+    SeatLayout,
+    allocate_seats
+)
+
+
+def build_maps(seats: int, occupancy: float, count: int) -> list[int]:
+    maps = []
+
+    for _ in range(count):
+        free = 0
+        for seat in random.sample(range(seats), seats - int(seats * occupancy)):
+            free |= 1 << seat
+        maps.append(free)
+
+    return maps
+
+
+def measure(layout: SeatLayout, maps: list[int], calls: int, max_party: int):
+    parties = [(random.choice(maps), random.randint(1, max_party)) for _ in range(calls)]
+    timings = []
+    allocated = 0
+
+    for free, party_size in parties:
+        started = time.perf_counter()
+        seats = allocate_seats(layout, free, party_size)
+        timings.append(time.perf_counter() - started)
+        allocated += seats is not None
+
+    timings.sort()
+    print(
+        f"{layout.sides} x {layout.rows} rows   mean {statistics.mean(timings) * 1e6:6.2f} us   "
+        f"p99 {timings[int(len(timings) * 0.99)] * 1e6:6.2f} us   allocated {allocated}/{calls}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seats", type=int, default=40)
+    parser.add_argument("--occupancy", type=float, default=0.7)
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--max-party", type=int, default=6)
+    args = parser.parse_args()
+
+    maps = build_maps(args.seats, args.occupancy, 100)
+
+    for bus_type in BusTypeEnum:
+        measure(SeatLayout.for_bus(bus_type, args.seats), maps, args.calls, args.max_party)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+    Per-request cost of authenticating a bearer token.
+
+        python benchmarks/bench_token_verification.py --requests 20000
+
+    "decode" verifies and decodes the token with python-jose on every request, as
+    verify_auth_token did before. "cached" is a hit in the verified-token cache, which is
+    what every request after the first one with a token costs.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import (
+    datetime,
+    timedelta
+)
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+
+from jose import jwt  # noqa: E402
+
+from app.models.user_models import CurrentContextUser  # noqa: E402
+from app.utils.auth_dependencies import (  # noqa: E402
+    ALGORITHM,
+    SECRET_KEY
+)
+from app.utils.token_cache import VerifiedTokenCache  # noqa: E402
+
+
+def build_token() -> str:
+    now = datetime.utcnow()
+    return jwt.encode(
+        {
+            "id": 1, "name": "Siva Teja", "contact": "1234567890", "role": "Admin", "branch_id": 1,
+            "sub": "siva.teja@example.com", "iat": now, "exp": now + timedelta(hours=3)
+        },
+        key=SECRET_KEY,
+        algorithm=ALGORITHM
+    )
+
+
+def decode(token: str) -> CurrentContextUser:
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_sub": True})
+    return CurrentContextUser(
+        name=payload.get("name"),
+        email=payload["sub"],
+        role=payload.get("role"),
+        branch_id=payload.get("branch_id")
+    )
+
+
+def measure(name: str, authenticate, token: str, requests: int) -> float:
+    timings = []
+
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(requests):
+            authenticate(token)
+        timings.append((time.perf_counter() - started) / requests)
+
+    mean = statistics.mean(timings)
+    print(f"{name:<8} mean {mean * 1e6:8.2f} us/request   best {min(timings) * 1e6:8.2f} us/request")
+    return mean
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    token = build_token()
+    cache = VerifiedTokenCache()
+    user = decode(token)
+    cache.put(token, user, time.time() + 3600)
+    assert cache.get(token) == user
+
+    before = measure("decode", decode, token, args.requests)
+    after = measure("cached", cache.get, token, args.requests)
+    print(f"speedup  {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""adding keyset pagination indexes
+
+Revision ID: 02c0c8d4f864
+Revises: 1bee7e8b161a
+Create Date: 2025-05-09 16:03:55.870412
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.constants import MASTER_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = '02c0c8d4f864'
+down_revision = '1bee7e8b161a'
+branch_labels = None
+depends_on = None
+
+MASTER_TABLES = ['branches', 'users']
+TENANT_TABLES = ['companies', 'buses', 'schedules', 'tickets']
+
+
+def get_tables() -> list[str]:
+    if op.get_context().dialect.default_schema_name == MASTER_SCHEMA:
+        return MASTER_TABLES
+    return TENANT_TABLES
+
+
+def upgrade() -> None:
+    for table in get_tables():
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    for table in get_tables():
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
@@ -0,0 +1,42 @@
+"""adding ticket number sequence
+
+Revision ID: 1bee7e8b161a
+Revises: d81d7e378b70
+Create Date: 2025-05-06 09:42:17.504113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.constants import MASTER_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = '1bee7e8b161a'
+down_revision = 'd81d7e378b70'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.execute(sa.schema.CreateSequence(sa.Sequence('ticket_number_seq')))
+
+        # Continue after the numbers already handed out by the old count-based generator
+        op.execute(
+            r"""
+            SELECT setval(
+                'ticket_number_seq',
+                GREATEST(
+                    (SELECT count(*) FROM tickets),
+                    (SELECT coalesce(max(substring(ticket_number from '(\d{7})$')::bigint), 0) FROM tickets)
+                ) + 1,
+                false
+            )
+            """
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.execute(sa.schema.DropSequence(sa.Sequence('ticket_number_seq')))
@@ -0,0 +1,104 @@
+"""adding segment seat inventory
+
+Revision ID: 4f9b2d6c8a17
+Revises: 7c4e1f0a9b32
+Create Date: 2025-05-14 15:22:08.671340
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utils.constants import MASTER_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = '4f9b2d6c8a17'
+down_revision = '7c4e1f0a9b32'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.add_column('seat_inventories', sa.Column('segment_masks', postgresql.ARRAY(sa.BigInteger()), nullable=True))
+        op.add_column('tickets', sa.Column('boarding_seq', sa.Integer(), nullable=True))
+        op.add_column('tickets', sa.Column('alighting_seq', sa.Integer(), nullable=True))
+
+        # Seats booked so far were sold for the whole route, i.e. every leg of it
+        op.execute(
+            """
+            UPDATE seat_inventories
+            SET segment_masks = ARRAY(
+                SELECT CASE
+                    WHEN seat <= length(seat_inventories.seat_map) * 8 AND get_bit(seat_inventories.seat_map, seat - 1) = 1
+                    THEN (1::bigint << (route_length.stops - 1)) - 1
+                    ELSE 0
+                END
+                FROM generate_series(1, seat_inventories.total_seats) AS seat
+                ORDER BY seat
+            )
+            FROM schedules, LATERAL (
+                SELECT greatest(count(*), 2)::int AS stops FROM route_stops WHERE route_stops.route_id = schedules.route_id
+            ) AS route_length
+            WHERE schedules.id = seat_inventories.schedule_id
+            """
+        )
+        op.execute(
+            """
+            UPDATE tickets
+            SET boarding_seq = 1, alighting_seq = route_length.stops
+            FROM schedules, LATERAL (
+                SELECT greatest(count(*), 2)::int AS stops FROM route_stops WHERE route_stops.route_id = schedules.route_id
+            ) AS route_length
+            WHERE schedules.id = tickets.schedule_id
+            """
+        )
+        op.alter_column('seat_inventories', 'segment_masks', nullable=False)
+        op.drop_column('seat_inventories', 'seat_map')
+
+        op.drop_index('uq_tickets_schedule_seat_booked', table_name='tickets')
+        op.execute(
+            """
+            ALTER TABLE tickets ADD CONSTRAINT ex_tickets_schedule_seat_segment EXCLUDE USING gist (
+                int4range(schedule_id, schedule_id, '[]') WITH &&,
+                int4range(seat_number, seat_number, '[]') WITH &&,
+                int4range(boarding_seq, alighting_seq) WITH &&
+            ) WHERE (status = 'Booked' AND schedule_id IS NOT NULL)
+            """
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        # Fails while a seat is still shared by booked partial journeys, those have to be resolved first
+        op.drop_constraint('ex_tickets_schedule_seat_segment', 'tickets')
+        op.create_index(
+            'uq_tickets_schedule_seat_booked',
+            'tickets',
+            ['schedule_id', 'seat_number'],
+            unique=True,
+            postgresql_where=sa.text("status = 'Booked'")
+        )
+
+        # A seat sold for any leg is reported as booked for the whole departure
+        op.add_column('seat_inventories', sa.Column('seat_map', sa.LargeBinary(), nullable=True))
+        op.execute(
+            """
+            UPDATE seat_inventories
+            SET seat_map = (
+                SELECT decode(string_agg(lpad(to_hex(byte_value), 2, '0'), '' ORDER BY byte_index), 'hex')
+                FROM (
+                    SELECT byte_index, sum(
+                        CASE WHEN coalesce(seat_inventories.segment_masks[byte_index * 8 + bit + 1], 0) <> 0 THEN 1 << bit ELSE 0 END
+                    ) AS byte_value
+                    FROM generate_series(0, (seat_inventories.total_seats + 7) / 8 - 1) AS byte_index, generate_series(0, 7) AS bit
+                    GROUP BY byte_index
+                ) AS bytes
+            )
+            """
+        )
+        op.alter_column('seat_inventories', 'seat_map', nullable=False)
+        op.drop_column('seat_inventories', 'segment_masks')
+        op.drop_column('tickets', 'alighting_seq')
+        op.drop_column('tickets', 'boarding_seq')
@@ -0,0 +1,42 @@
+"""adding idempotency keys table
+
+Revision ID: 5d1c8e3b7a40
+Revises: b6e8f2a4d915
+Create Date: 2025-05-23 11:02:41.730914
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utils.constants import MASTER_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = '5d1c8e3b7a40'
+down_revision = 'b6e8f2a4d915'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.create_table('idempotency_keys',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('owner', sa.String(length=255), nullable=False),
+        sa.Column('request_hash', sa.String(length=64), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=True),
+        sa.Column('response', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('owner', 'key', name='uq_idempotency_keys_owner_key')
+        )
+        op.create_index('ix_idempotency_keys_expires_at', 'idempotency_keys', ['expires_at'])
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.drop_index('ix_idempotency_keys_expires_at', table_name='idempotency_keys')
+        op.drop_table('idempotency_keys')
@@ -0,0 +1,47 @@
+"""adding route stops table
+
+Revision ID: 7c4e1f0a9b32
+Revises: 02c0c8d4f864
+Create Date: 2025-05-12 10:41:27.503918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.constants import MASTER_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = '7c4e1f0a9b32'
+down_revision = '02c0c8d4f864'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.create_table('route_stops',
+        sa.Column('route_id', sa.Integer(), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.Column('city', sa.String(length=50), nullable=False),
+        sa.Column('offset_minutes', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['route_id'], ['routes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('route_id', 'seq')
+        )
+        op.create_index('ix_route_stops_city_route_seq', 'route_stops', [sa.text('lower(city)'), 'route_id', 'seq'])
+
+        # One row per stop, numbered from 1 in the order of the JSON array
+        op.execute(
+            """
+            INSERT INTO route_stops (route_id, seq, city)
+            SELECT routes.id, stop.seq, stop.city
+            FROM routes
+            CROSS JOIN LATERAL json_array_elements_text(routes.stops) WITH ORDINALITY AS stop(city, seq)
+            """
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.drop_index('ix_route_stops_city_route_seq', table_name='route_stops')
+        op.drop_table('route_stops')
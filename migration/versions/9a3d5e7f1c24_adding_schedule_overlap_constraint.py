@@ -0,0 +1,38 @@
+"""adding schedule overlap constraint
+
+Revision ID: 9a3d5e7f1c24
+Revises: 4f9b2d6c8a17
+Create Date: 2025-05-16 12:09:51.204736
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.constants import MASTER_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = '9a3d5e7f1c24'
+down_revision = '4f9b2d6c8a17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        # Existing invalid or overlapping trips make this fail and have to be fixed by hand first
+        op.create_check_constraint('ck_schedules_arrival_after_departure', 'schedules', 'arrival_time > departure_time')
+        op.execute(
+            """
+            ALTER TABLE schedules ADD CONSTRAINT ex_schedules_bus_trip_overlap EXCLUDE USING gist (
+                int4range(bus_id, bus_id, '[]') WITH &&,
+                tsrange(departure_time, arrival_time) WITH &&
+            )
+            """
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.drop_constraint('ex_schedules_bus_trip_overlap', 'schedules')
+        op.drop_constraint('ck_schedules_arrival_after_departure', 'schedules')
@@ -0,0 +1,59 @@
+"""adding schedule templates table
+
+Revision ID: b6e8f2a4d915
+Revises: 9a3d5e7f1c24
+Create Date: 2025-05-20 09:47:13.588021
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utils.constants import MASTER_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e8f2a4d915'
+down_revision = '9a3d5e7f1c24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.create_table('schedule_templates',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('bus_id', sa.Integer(), nullable=False),
+        sa.Column('route_id', sa.Integer(), nullable=False),
+        sa.Column('departure_time', sa.Time(), nullable=False),
+        sa.Column('duration_minutes', sa.Integer(), nullable=False),
+        sa.Column('recurrence', sa.String(length=20), nullable=False),
+        sa.Column('weekdays', sa.SmallInteger(), nullable=False),
+        sa.Column('valid_from', sa.Date(), nullable=False),
+        sa.Column('valid_until', sa.Date(), nullable=True),
+        sa.Column('excluded_dates', postgresql.JSON(astext_type=sa.Text()), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['bus_id'], ['buses.id']),
+        sa.ForeignKeyConstraint(['route_id'], ['routes.id']),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_schedule_templates_created_at_id', 'schedule_templates', ['created_at', 'id'])
+
+        op.add_column('schedules', sa.Column('template_id', sa.Integer(), nullable=True))
+        op.add_column('schedules', sa.Column('service_date', sa.Date(), nullable=True))
+        op.create_foreign_key(
+            'schedules_template_id_fkey', 'schedules', 'schedule_templates', ['template_id'], ['id'], ondelete='SET NULL'
+        )
+        op.create_unique_constraint('uq_schedules_template_service_date', 'schedules', ['template_id', 'service_date'])
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.drop_constraint('uq_schedules_template_service_date', 'schedules', type_='unique')
+        op.drop_constraint('schedules_template_id_fkey', 'schedules', type_='foreignkey')
+        op.drop_column('schedules', 'service_date')
+        op.drop_column('schedules', 'template_id')
+        op.drop_index('ix_schedule_templates_created_at_id', table_name='schedule_templates')
+        op.drop_table('schedule_templates')
@@ -0,0 +1,58 @@
+"""adding seat inventories table and ticket schedules
+
+Revision ID: d81d7e378b70
+Revises: 5adc49f489db
+Create Date: 2025-05-02 11:20:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.constants import MASTER_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = 'd81d7e378b70'
+down_revision = '5adc49f489db'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.create_table('seat_inventories',
+        sa.Column('schedule_id', sa.Integer(), nullable=False),
+        sa.Column('total_seats', sa.Integer(), nullable=False),
+        sa.Column('seat_map', sa.LargeBinary(), nullable=False),
+        sa.Column('booked_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['schedule_id'], ['schedules.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('schedule_id')
+        )
+        op.add_column('tickets', sa.Column('schedule_id', sa.Integer(), nullable=True))
+        op.create_foreign_key('tickets_schedule_id_fkey', 'tickets', 'schedules', ['schedule_id'], ['id'])
+        op.create_index(
+            'uq_tickets_schedule_seat_booked',
+            'tickets',
+            ['schedule_id', 'seat_number'],
+            unique=True,
+            postgresql_where=sa.text("status = 'Booked'")
+        )
+
+        # Every existing departure starts with an empty bitmap sized for its bus
+        op.execute(
+            """
+            INSERT INTO seat_inventories (schedule_id, total_seats, seat_map, booked_count, updated_at)
+            SELECT schedules.id, buses.total_seats, decode(repeat('00', (buses.total_seats + 7) / 8), 'hex'), 0, now()
+            FROM schedules
+            JOIN buses ON buses.id = schedules.bus_id
+            """
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.drop_index('uq_tickets_schedule_seat_booked', table_name='tickets')
+        op.drop_constraint('tickets_schedule_id_fkey', 'tickets', type_='foreignkey')
+        op.drop_column('tickets', 'schedule_id')
+        op.drop_table('seat_inventories')
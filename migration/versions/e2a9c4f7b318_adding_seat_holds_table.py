@@ -0,0 +1,42 @@
+"""adding seat holds table
+
+Revision ID: e2a9c4f7b318
+Revises: 5d1c8e3b7a40
+Create Date: 2025-05-26 10:14:52.318406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.constants import MASTER_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a9c4f7b318'
+down_revision = '5d1c8e3b7a40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.create_table('seat_holds',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('hold_id', sa.String(length=36), nullable=False),
+        sa.Column('schedule_id', sa.Integer(), nullable=False),
+        sa.Column('seat_number', sa.Integer(), nullable=False),
+        sa.Column('journey_mask', sa.BigInteger(), nullable=False),
+        sa.Column('owner', sa.String(length=255), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['schedule_id'], ['schedules.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('hold_id', 'seat_number', name='uq_seat_holds_hold_seat')
+        )
+        op.create_index('ix_seat_holds_expires_at', 'seat_holds', ['expires_at'])
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.default_schema_name != MASTER_SCHEMA:
+        op.drop_index('ix_seat_holds_expires_at', table_name='seat_holds')
+        op.drop_table('seat_holds')
@@ -0,0 +1,44 @@
+"""adding refresh tokens table
+
+Revision ID: f3b7d1e9c025
+Revises: e2a9c4f7b318
+Create Date: 2025-05-29 09:41:16.502734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.constants import MASTER_SCHEMA
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b7d1e9c025'
+down_revision = 'e2a9c4f7b318'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.default_schema_name == MASTER_SCHEMA:
+        op.create_table('refresh_tokens',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('token_hash', sa.String(length=64), nullable=False),
+        sa.Column('family_id', sa.String(length=36), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('used_at', sa.DateTime(), nullable=True),
+        sa.Column('revoked_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('token_hash')
+        )
+        op.create_index('ix_refresh_tokens_family_id', 'refresh_tokens', ['family_id'])
+        op.create_index('ix_refresh_tokens_expires_at', 'refresh_tokens', ['expires_at'])
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.default_schema_name == MASTER_SCHEMA:
+        op.drop_index('ix_refresh_tokens_expires_at', table_name='refresh_tokens')
+        op.drop_index('ix_refresh_tokens_family_id', table_name='refresh_tokens')
+        op.drop_table('refresh_tokens')
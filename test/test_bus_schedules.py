@@ -0,0 +1,204 @@
+import asyncio
+from datetime import (
+    datetime,
+    timedelta
+)
+
+import pytest
+import sqlalchemy as sa
+from fastapi import HTTPException
+
+from app.connectors.database_connector import (
+    async_engine,
+    tenant_router
+)
+from app.entities.bus import Bus
+from app.entities.company import Company
+from app.entities.schedule import Schedule
+from app.entities.schedule_template import ScheduleTemplate
+from app.entities.seat_inventory import SeatInventory
+from app.entities.ticket import Ticket
+from app.models.bus_models import (
+    BulkBusScheduleRequest,
+    BusScheduleRequest
+)
+from app.services.bus_service import BusService
+from app.services.seat_inventory_service import SeatInventoryService
+from app.utils.enums import TicketStatusEnum
+
+from .test_seat_inventory import get_tenant_schema
+
+
+START = datetime(2030, 1, 1, 6)
+
+
+def trip(bus_id: int, start_hours: float, end_hours: float, route_id: int = 1) -> BusScheduleRequest:
+    return BusScheduleRequest(
+        bus_id=bus_id,
+        route_id=route_id,
+        departure_time=START + timedelta(hours=start_hours),
+        arrival_time=START + timedelta(hours=end_hours)
+    )
+
+
+class TestScheduleValidation:
+    service = BusService(db=None, seat_inventory_service=None)
+
+    def test_arrival_must_be_after_departure(self):
+        self.service.validate_schedule_times(START, START + timedelta(minutes=1))
+
+        for arrival_time in (START, START - timedelta(hours=1)):
+            with pytest.raises(HTTPException) as error:
+                self.service.validate_schedule_times(START, arrival_time)
+            assert error.value.status_code == 400
+
+    def test_back_to_back_trips_of_a_bus_are_allowed(self):
+        self.service.validate_no_overlapping_trips_in_batch([trip(1, 4, 8), trip(1, 0, 4), trip(1, 8, 9)])
+
+    def test_overlapping_trips_of_a_bus_are_rejected_in_any_order(self):
+        with pytest.raises(HTTPException) as error:
+            self.service.validate_no_overlapping_trips_in_batch([trip(1, 10, 12), trip(2, 0, 20), trip(1, 0, 11)])
+
+        assert error.value.status_code == 409
+
+    def test_overlapping_trips_of_different_buses_are_allowed(self):
+        self.service.validate_no_overlapping_trips_in_batch([trip(1, 0, 5), trip(2, 1, 4), trip(3, 2, 3)])
+
+
+class TestBusSchedules:
+    def setup_method(self):
+        self.schema = get_tenant_schema()
+        db = tenant_router.session(self.schema)
+        suffix = datetime.now().strftime("%H%M%S%f")
+
+        company = Company(
+            name=f"Schedules {suffix}",
+            contact_person_name="schedules",
+            email=f"schedules{suffix}@unittest.com",
+            address="schedules",
+            phone_number="0000000000"
+        )
+        db.add(company)
+        db.flush()
+
+        buses = [
+            Bus(bus_number=f"{prefix}{suffix[-9:]}", bus_type="AC", total_seats=total_seats, company_id=company.id)
+            for prefix, total_seats in (("L", 40), ("M", 40), ("S", 10))
+        ]
+        db.add_all(buses)
+        db.flush()
+
+        self.departure = datetime(2031, 1, 1) + timedelta(minutes=int(suffix[-6:]) % 100_000)
+        schedule = Schedule(
+            bus_id=buses[0].id, route_id=1, departure_time=self.departure, arrival_time=self.departure + timedelta(hours=4)
+        )
+        db.add(schedule)
+        db.flush()
+
+        db.add(SeatInventory(
+            schedule_id=schedule.id, total_seats=40, segment_masks=[0] * 19 + [1] + [0] * 20, booked_count=1
+        ))
+        db.add(Ticket(
+            ticket_number=f"T{suffix}", bus_id=buses[0].id, schedule_id=schedule.id, seat_number=20,
+            boarding_seq=1, alighting_seq=2, passenger_name="schedules", passenger_contact="0000000000",
+            passenger_email="schedules@unittest.com", status=TicketStatusEnum.BOOKED
+        ))
+        db.commit()
+
+        self.company_id, self.schedule_id = company.id, schedule.id
+        self.bus_ids = [bus.id for bus in buses]
+        db.close()
+
+    def teardown_method(self):
+        db = tenant_router.session(self.schema)
+        db.execute(sa.delete(Ticket).where(Ticket.schedule_id == self.schedule_id))
+        db.execute(sa.delete(Schedule).where(Schedule.bus_id.in_(self.bus_ids)))
+        db.execute(sa.delete(ScheduleTemplate).where(ScheduleTemplate.bus_id.in_(self.bus_ids)))
+        db.execute(sa.delete(Bus).where(Bus.id.in_(self.bus_ids)))
+        db.execute(sa.delete(Company).where(Company.id == self.company_id))
+        db.commit()
+        db.close()
+
+    def count_schedules(self) -> int:
+        db = tenant_router.session(self.schema)
+        count = db.scalar(sa.select(sa.func.count()).where(Schedule.bus_id.in_(self.bus_ids)))
+        db.close()
+        return count
+
+    async def call(self, method: str, *args) -> str:
+        db = tenant_router.async_session(self.schema)
+        service = BusService(db=db, seat_inventory_service=SeatInventoryService(db=db))
+
+        try:
+            await getattr(service, method)(*args)
+            return "ok"
+        except HTTPException as e:
+            return e.detail
+        finally:
+            await db.rollback()
+            await db.close()
+            await async_engine.dispose()
+
+    def request(self, bus_index: int, start_hours: float, end_hours: float, route_id: int = 1) -> BusScheduleRequest:
+        return BusScheduleRequest(
+            bus_id=self.bus_ids[bus_index],
+            route_id=route_id,
+            departure_time=self.departure + timedelta(hours=start_hours),
+            arrival_time=self.departure + timedelta(hours=end_hours)
+        )
+
+    def test_bulk_import_is_all_or_nothing(self):
+        # The second trip clashes with the stored one, which only the exclusion constraint sees
+        batch = BulkBusScheduleRequest(schedules=[self.request(1, 0, 4), self.request(0, 3, 5)])
+
+        assert asyncio.run(self.call("import_bus_schedules", batch)) == "BUS_SCHEDULE_OVERLAPS"
+        assert self.count_schedules() == 1
+
+        batch = BulkBusScheduleRequest(schedules=[self.request(1, 0, 4), self.request(0, 4, 6)])
+
+        assert asyncio.run(self.call("import_bus_schedules", batch)) == "ok"
+        assert self.count_schedules() == 3
+
+    def test_overlapping_trip_is_a_conflict(self):
+        assert asyncio.run(self.call("create_bus_schedule", self.request(0, 1, 2))) == "BUS_SCHEDULE_OVERLAPS"
+
+    def test_route_of_a_booked_departure_is_fixed(self):
+        changed_route = self.request(0, 0, 4, route_id=2)
+
+        assert asyncio.run(self.call("update_bus_schedule_by_id", self.schedule_id, changed_route)) == (
+            "CANNOT_CHANGE_THE_ROUTE_OF_A_SCHEDULE_WITH_BOOKINGS"
+        )
+
+    def test_bus_swap_keeps_booked_seats(self):
+        smaller_bus = self.request(2, 0, 4)
+        assert asyncio.run(self.call("update_bus_schedule_by_id", self.schedule_id, smaller_bus)) == (
+            "BUS_HAS_FEWER_SEATS_THAN_BOOKED"
+        )
+
+        assert asyncio.run(self.call("update_bus_schedule_by_id", self.schedule_id, self.request(1, 0, 4))) == "ok"
+
+        db = tenant_router.session(self.schema)
+        assert db.scalar(sa.select(Ticket.bus_id).where(Ticket.schedule_id == self.schedule_id)) == self.bus_ids[1]
+        db.close()
+
+    def test_departure_with_tickets_cannot_be_deleted(self):
+        assert asyncio.run(self.call("delete_bus_schedule_by_id", self.schedule_id)) == "CANNOT_DELETE_A_SCHEDULE_WITH_TICKETS"
+        assert self.count_schedules() == 1
+
+    def test_trips_cannot_take_a_template_departure_slot(self):
+        db = tenant_router.session(self.schema)
+        db.add(ScheduleTemplate(
+            bus_id=self.bus_ids[1], route_id=1, departure_time=self.departure.time(), duration_minutes=120,
+            recurrence="Daily", weekdays=0, valid_from=self.departure.date(), excluded_dates=[]
+        ))
+        db.commit()
+        db.close()
+
+        assert asyncio.run(self.call("create_bus_schedule", self.request(1, 1, 3))) == "BUS_SCHEDULE_OVERLAPS"
+        assert asyncio.run(self.call("create_bus_schedule", self.request(1, 24 * 7 + 1, 24 * 7 + 2))) == "BUS_SCHEDULE_OVERLAPS"
+
+        batch = BulkBusScheduleRequest(schedules=[self.request(1, 2, 4), self.request(1, 48 + 1, 48 + 3)])
+        assert asyncio.run(self.call("import_bus_schedules", batch)) == "BUS_SCHEDULE_OVERLAPS"
+        assert self.count_schedules() == 1
+
+        assert asyncio.run(self.call("create_bus_schedule", self.request(1, 2, 4))) == "ok"
@@ -0,0 +1,49 @@
+import asyncio
+import json
+from datetime import (
+    date,
+    datetime
+)
+
+from app.utils.enums import ExportFormatEnum
+from app.utils.exports import (
+    encode_export,
+    to_csv,
+    to_ndjson
+)
+
+
+COLUMNS = ["id", "passenger_name", "service_date", "created_at"]
+ROWS = [
+    (1, "Ravi", date(2026, 12, 1), datetime(2026, 11, 2, 9, 30)),
+    (2, "Priya, K", None, datetime(2026, 11, 2, 10, 0)),
+]
+
+
+async def batches():
+    yield ROWS[:1]
+    yield ROWS[1:]
+
+
+async def collect(export_format: ExportFormatEnum) -> list[str]:
+    return [chunk async for chunk in encode_export(COLUMNS, batches(), export_format)]
+
+
+class TestExports:
+    def test_ndjson_has_one_object_per_line(self):
+        lines = to_ndjson(COLUMNS, ROWS).splitlines()
+
+        assert [json.loads(line) for line in lines] == [
+            {"id": 1, "passenger_name": "Ravi", "service_date": "2026-12-01", "created_at": "2026-11-02T09:30:00"},
+            {"id": 2, "passenger_name": "Priya, K", "service_date": None, "created_at": "2026-11-02T10:00:00"},
+        ]
+
+    def test_csv_quotes_values_containing_separators(self):
+        assert to_csv(ROWS[1:]) == '2,"Priya, K",,2026-11-02 10:00:00\r\n'
+
+    def test_streams_one_chunk_per_batch_with_csv_header_first(self):
+        assert len(asyncio.run(collect(ExportFormatEnum.NDJSON))) == 2
+
+        chunks = asyncio.run(collect(ExportFormatEnum.CSV))
+        assert chunks[0] == "id,passenger_name,service_date,created_at\r\n"
+        assert len(chunks) == 3
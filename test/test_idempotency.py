@@ -0,0 +1,79 @@
+import uuid
+from datetime import (
+    datetime,
+    timedelta
+)
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import (
+    delete,
+    select
+)
+from starlette.requests import Request
+
+from app.connectors.database_connector import build_db_session
+from app.entities.idempotency_key import IdempotencyKey
+from app.models.ticket_models import TicketRequest
+from app.services.idempotency_service import IdempotencyService
+
+from .test_seat_inventory import get_tenant_schema
+
+
+def build_service(path: str = "/tickets", headers: dict[str, str] | None = None) -> IdempotencyService:
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "query_string": b"",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()],
+    }
+    return IdempotencyService(request=Request(scope), db=None)
+
+
+TICKET = TicketRequest(
+    schedule_id=1, seat_number=4, passenger_name="Ravi", passenger_contact="9999999999", passenger_email="r@x.com"
+)
+
+
+class TestIdempotency:
+    def test_key_is_read_from_the_header(self):
+        assert build_service(headers={"Idempotency-Key": "abc"}).get_key() == "abc"
+        assert build_service().get_key() is None
+
+    def test_overlong_key_is_rejected(self):
+        with pytest.raises(HTTPException) as error:
+            build_service(headers={"Idempotency-Key": "x" * 256}).get_key()
+
+        assert error.value.status_code == 400
+
+    def test_fingerprint_depends_on_path_and_body(self):
+        service = build_service()
+
+        assert service.fingerprint(TICKET) == build_service().fingerprint(TICKET.model_copy())
+        assert service.fingerprint(TICKET) != service.fingerprint(TICKET.model_copy(update={"seat_number": 5}))
+        assert service.fingerprint(TICKET) != build_service("/buses").fingerprint(TICKET)
+
+
+class TestIdempotencyKeyPurge:
+    def test_only_expired_keys_are_purged(self):
+        schema = get_tenant_schema()
+        owner = uuid.uuid4().hex
+        db = build_db_session(schema)
+
+        try:
+            now = datetime.now()
+            db.add_all([
+                IdempotencyKey(key="expired", owner=owner, request_hash="x", expires_at=now - timedelta(hours=1)),
+                IdempotencyKey(key="live", owner=owner, request_hash="x", expires_at=now + timedelta(hours=1)),
+            ])
+            db.commit()
+
+            IdempotencyService.purge_expired(schema)
+
+            keys = db.execute(select(IdempotencyKey.key).where(IdempotencyKey.owner == owner)).scalars().all()
+            assert keys == ["live"]
+        finally:
+            db.execute(delete(IdempotencyKey).where(IdempotencyKey.owner == owner))
+            db.commit()
+            db.close()
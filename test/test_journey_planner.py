@@ -0,0 +1,77 @@
+from datetime import (
+    datetime,
+    timedelta
+)
+
+from app.utils.journey_planner import (
+    Timetable,
+    Trip,
+    TripStop,
+    interpolate_stop_times
+)
+
+
+DAY = datetime(2025, 6, 1)
+
+
+def trip(schedule_id: int, *stops: tuple[str, int]) -> Trip:
+    return Trip(
+        schedule_id=schedule_id,
+        route_id=schedule_id,
+        stops=[TripStop(seq=seq, city=city, time=DAY + timedelta(hours=hour)) for seq, (city, hour) in enumerate(stops, start=1)]
+    )
+
+
+TRIPS = [
+    trip(1, ("Tirupati", 5), ("Kadapa", 10), ("Hyderabad", 20)),
+    trip(2, ("Tirupati", 6), ("Kadapa", 9), ("Kurnool", 12)),
+    trip(3, ("Kurnool", 12.25), ("Hyderabad", 16)),
+    trip(4, ("Kurnool", 13), ("Hyderabad", 17)),
+]
+
+
+def plan(timetable: Timetable, min_transfer_minutes: int, max_transfers: int = 2, from_stop: str = "Tirupati"):
+    return timetable.plan(
+        from_stop,
+        "hyderabad",
+        earliest_departure=DAY,
+        latest_departure=DAY + timedelta(days=1),
+        min_transfer=timedelta(minutes=min_transfer_minutes),
+        max_transfers=max_transfers
+    )
+
+
+class TestTimetable:
+    def test_returns_fewest_transfers_and_earliest_arrival(self):
+        journeys = plan(Timetable(TRIPS), min_transfer_minutes=30)
+
+        assert [journey.transfers for journey in journeys] == [0, 1]
+        assert [leg.schedule_id for leg in journeys[0].legs] == [1]
+        assert [(leg.schedule_id, leg.from_stop, leg.to_stop) for leg in journeys[1].legs] == [
+            (2, "Tirupati", "Kurnool"),
+            (4, "Kurnool", "Hyderabad"),
+        ]
+        assert journeys[1].arrival_time == DAY + timedelta(hours=17)
+
+    def test_minimum_transfer_time_gates_connections(self):
+        journeys = plan(Timetable(TRIPS), min_transfer_minutes=10)
+
+        assert journeys[-1].arrival_time == DAY + timedelta(hours=16)
+        assert plan(Timetable(TRIPS), min_transfer_minutes=30, max_transfers=0)[-1].transfers == 0
+
+    def test_boards_at_intermediate_stops(self):
+        journeys = plan(Timetable(TRIPS), min_transfer_minutes=30, from_stop="Kadapa")
+
+        assert journeys[0].legs[0].from_seq == 2
+        assert journeys[-1].departure_time == DAY + timedelta(hours=9)
+
+
+class TestInterpolateStopTimes:
+    def test_prefers_offsets_and_spreads_the_rest(self):
+        stops = interpolate_stop_times(
+            DAY,
+            DAY + timedelta(hours=6),
+            [(1, "Tirupati", None), (2, "Rajampet", 60), (3, "Kadapa", None), (4, "Rayachoti", None)]
+        )
+
+        assert [stop.time.hour for stop in stops] == [0, 1, 4, 6]
@@ -0,0 +1,41 @@
+import inspect
+from datetime import datetime
+
+from app.entities.bus import Bus
+from app.entities.company import Company
+from app.models.bus_models import GetBusResponse
+from app.models.company_models import GetCompanyResponse
+from app.utils.mappers import (
+    get_mapper,
+    map_company
+)
+
+
+NOW = datetime(2026, 12, 1, 9, 0)
+
+
+def build_company() -> Company:
+    return Company(
+        id=3, name="Orange", contact_person_name="Ravi", email="o@x.com", address="Kadapa",
+        phone_number="123", created_at=NOW, updated_at=NOW, is_active=True
+    )
+
+
+class TestMappers:
+    def test_maps_rows_like_validated_construction(self):
+        company = build_company()
+        bus = Bus(id=7, company_id=3, bus_number="AP01", bus_type="AC", total_seats=40, created_at=NOW, is_active=True)
+
+        response = get_mapper(Bus, GetBusResponse)(bus, company_data=map_company(company))
+
+        assert response == GetBusResponse.model_validate(response.model_dump())
+        assert response.company_data == GetCompanyResponse(**response.company_data.model_dump())
+        assert response.model_dump_json()
+        assert response.model_fields_set == set(GetBusResponse.model_fields)
+
+    def test_nested_fields_become_keyword_arguments(self):
+        assert list(inspect.signature(get_mapper(Bus, GetBusResponse)).parameters) == ["source", "company_data"]
+        assert list(inspect.signature(map_company).parameters) == ["source"]
+
+    def test_mappers_are_compiled_once_per_pair(self):
+        assert get_mapper(Company, GetCompanyResponse) is map_company
@@ -0,0 +1,68 @@
+from fastapi import (
+    FastAPI,
+    Request
+)
+from fastapi.testclient import TestClient
+from jose import JWTError
+from pydantic import BaseModel
+
+from app.utils.middlewares import setup_middlewares
+
+
+class Item(BaseModel):
+    count: int
+
+
+def build_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/ok")
+    def ok(request: Request):
+        return {"request_id": request.state.request_id}
+
+    @app.get("/crash")
+    def crash():
+        raise RuntimeError("boom")
+
+    @app.get("/jwt")
+    def bad_jwt():
+        raise JWTError("Signature has expired")
+
+    @app.get("/invalid")
+    def invalid():
+        Item(count="many")
+
+    setup_middlewares(app)
+    return TestClient(app)
+
+
+class TestGlobalMiddleware:
+    def test_responses_get_cors_headers_and_a_request_id(self):
+        response = build_client().get("/ok")
+
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["x-request-id"] == response.json()["request_id"]
+
+    def test_request_id_of_the_caller_is_kept(self):
+        response = build_client().get("/ok", headers={"X-Request-ID": "trace-1"})
+
+        assert response.json()["request_id"] == "trace-1"
+        assert response.headers["x-request-id"] == "trace-1"
+
+    def test_preflight_is_answered_without_the_app(self):
+        response = build_client().options("/crash", headers={"Origin": "http://x.com"})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-methods"] == "*"
+
+    def test_unhandled_errors_become_json(self):
+        client = build_client()
+
+        crash = client.get("/crash")
+        assert crash.status_code == 500
+        assert crash.json()["message"] == "boom"
+        assert crash.headers["access-control-allow-origin"] == "*"
+
+        assert client.get("/jwt").status_code == 401
+        assert client.get("/invalid").status_code == 400
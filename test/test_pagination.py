@@ -0,0 +1,65 @@
+from datetime import (
+    datetime,
+    timedelta
+)
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.entities.company import Company
+from app.models.pagination_models import PageParams
+from app.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    split_page
+)
+
+
+CREATED_AT = datetime(2026, 11, 3, 9, 15, 30, 125000)
+
+
+def build_rows(count: int) -> list[SimpleNamespace]:
+    return [SimpleNamespace(id=id, created_at=CREATED_AT + timedelta(seconds=id)) for id in range(1, count + 1)]
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_cursor(CREATED_AT, 42)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (CREATED_AT, 42)
+
+    @pytest.mark.parametrize("cursor", ["", "not a cursor", "WzFd", "eyJhIjogMX0", "WyJ5ZXN0ZXJkYXkiLCAxXQ", "WzEsIDJd"])
+    def test_malformed_cursor_is_a_bad_request(self, cursor: str):
+        with pytest.raises(HTTPException) as error:
+            decode_cursor(cursor)
+
+        assert error.value.status_code == 400
+        assert error.value.detail == "INVALID_CURSOR"
+
+
+class TestPages:
+    def test_extra_row_is_trimmed_into_a_next_cursor(self):
+        rows, next_cursor = split_page(build_rows(4), PageParams(page_size=3))
+
+        assert [row.id for row in rows] == [1, 2, 3]
+        assert decode_cursor(next_cursor) == (rows[-1].created_at, 3)
+
+    def test_last_page_has_no_next_cursor(self):
+        for count in (0, 2, 3):
+            rows, next_cursor = split_page(build_rows(count), PageParams(page_size=3))
+
+            assert len(rows) == count
+            assert next_cursor is None
+
+    def test_page_continues_after_the_cursor(self):
+        page = PageParams(page_size=10, cursor=encode_cursor(CREATED_AT, 7))
+        statement = paginate(select(Company), Company, page)
+        sql = str(statement.compile())
+
+        assert "(companies.created_at, companies.id) > (:param_1, :param_2)" in sql
+        assert "ORDER BY companies.created_at, companies.id" in sql
+        assert statement._limit == 11
@@ -0,0 +1,49 @@
+import asyncio
+import threading
+
+import pytest
+from passlib.hash import bcrypt
+
+from app.utils import hasher
+from app.utils.hasher import (
+    PasswordVerifier,
+    PasswordVerifierSaturated
+)
+
+
+HASHED_PASSWORD = bcrypt.using(rounds=4).hash("String@123")
+
+
+class TestPasswordVerifier:
+    def test_verifies_off_the_event_loop(self):
+        verifier = PasswordVerifier(max_workers=2, max_queue=2)
+
+        async def verify():
+            return await asyncio.gather(
+                verifier.verify("String@123", HASHED_PASSWORD),
+                verifier.verify("wrong", HASHED_PASSWORD)
+            )
+
+        assert asyncio.run(verify()) == [True, False]
+        metrics = verifier.metrics()
+        assert (metrics.completed, metrics.rejected, metrics.running, metrics.queued) == (2, 0, 0, 0)
+
+    def test_refuses_checks_beyond_workers_and_queue(self, monkeypatch):
+        release = threading.Event()
+        monkeypatch.setattr(hasher.Hasher, "verify_password", staticmethod(lambda *_: release.wait(5)))
+        verifier = PasswordVerifier(max_workers=1, max_queue=1)
+
+        async def verify():
+            admitted = [asyncio.ensure_future(verifier.verify("x", HASHED_PASSWORD)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(PasswordVerifierSaturated):
+                await verifier.verify("x", HASHED_PASSWORD)
+
+            assert (verifier.metrics().running, verifier.metrics().queued) == (1, 1)
+            release.set()
+            return await asyncio.gather(*admitted)
+
+        assert asyncio.run(verify()) == [True, True]
+        assert verifier.metrics().rejected == 1
+        assert verifier.metrics().peak_in_flight == 2
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.models.bus_models import GetRouteResponse
+from app.utils.projections import (
+    ROUTE_PROJECTION,
+    TICKET_PROJECTION
+)
+
+
+class TestProjections:
+    def test_selects_only_response_columns_in_one_joined_statement(self):
+        columns = select(TICKET_PROJECTION).selected_columns
+
+        assert {column.table.name for column in columns} == {"tickets", "buses", "companies"}
+        assert "ticket_number" not in {column.name for column in columns}
+
+    def test_builds_the_response_model_from_a_row(self):
+        created_at = datetime(2026, 12, 1, 9, 0)
+        row = (5, ["Kadapa", "Tirupati"], "Kadapa", "Tirupati", created_at)
+        procs = [lambda row, index=index: row[index] for index in range(len(row))]
+
+        process = ROUTE_PROJECTION.create_row_processor(None, procs, list(GetRouteResponse.model_fields))
+        response = process(row)
+
+        assert response == GetRouteResponse(
+            id=5, stops=["Kadapa", "Tirupati"], source="Kadapa", destination="Tirupati", created_at=created_at
+        )
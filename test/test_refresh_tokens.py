@@ -0,0 +1,26 @@
+from app.entities.user import User
+from app.services.auth_service import AuthService
+from app.services.refresh_token_service import hash_token
+from app.utils.auth_dependencies import revoke_auth_token
+
+
+USER = User(id=1, name="Ravi", email="ravi@x.com", contact="9999999999", role="Admin", branch_id=1)
+
+
+class TestRefreshTokens:
+    def test_tokens_are_stored_hashed(self):
+        assert hash_token("token") == hash_token("token")
+        assert hash_token("token") != hash_token("other")
+        assert len(hash_token("token")) == 64
+
+    def test_claims_of_one_user_are_unique(self):
+        service = AuthService(user_service=None, refresh_token_service=None)
+
+        first = service.create_claims(USER, USER.role)
+        second = service.create_claims(USER, USER.role)
+
+        assert first["jti"] != second["jti"]
+        assert first["sub"] == "ravi@x.com"
+
+    def test_revoking_an_invalid_access_token_is_a_no_op(self):
+        revoke_auth_token("Bearer not-a-token")
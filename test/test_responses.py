@@ -0,0 +1,63 @@
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+    status
+)
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.models.base_response_model import ApiResponse
+from app.utils.responses import (
+    ModelJSONResponse,
+    ModelResponseRoute
+)
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def get_prefix() -> str:
+    return "item"
+
+
+router = APIRouter(route_class=ModelResponseRoute)
+
+
+@router.get("/items/{id}", response_model=ApiResponse[Item], response_class=ModelJSONResponse, status_code=status.HTTP_201_CREATED)
+async def get_item(id: int, prefix: str = Depends(get_prefix)) -> ApiResponse[Item]:
+    return ApiResponse(data=Item(id=id, name=f"{prefix}-{id}"))
+
+
+@router.get("/sync-items/{id}", response_model=ApiResponse[Item], response_class=ModelJSONResponse)
+def get_sync_item(id: int) -> ApiResponse[Item]:
+    return ApiResponse(data=Item.model_construct(id=id, name="unvalidated"))
+
+
+@router.get("/plain", response_model=ApiResponse[Item])
+async def get_plain() -> ApiResponse[Item]:
+    return ApiResponse(data=Item(id=1, name="plain"))
+
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+class TestModelResponseRoute:
+    def test_renders_the_returned_model_with_the_route_status_code(self):
+        response = client.get("/items/7")
+
+        assert response.status_code == 201
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"status_message": "SUCCESS", "data": {"id": 7, "name": "item-7"}}
+
+    def test_wraps_sync_endpoints_keeping_their_parameters(self):
+        assert client.get("/sync-items/3").json()["data"] == {"id": 3, "name": "unvalidated"}
+        assert client.get("/sync-items/abc").status_code == 422
+
+    def test_routes_that_do_not_opt_in_are_unchanged(self):
+        assert client.get("/plain").json()["data"] == {"id": 1, "name": "plain"}
+        assert app.openapi()["paths"]["/items/{id}"]["get"]["responses"]["201"]
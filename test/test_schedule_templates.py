@@ -0,0 +1,100 @@
+from datetime import (
+    date,
+    datetime,
+    time
+)
+
+from app.entities.schedule_template import ScheduleTemplate
+from app.utils.enums import RecurrenceEnum
+from app.utils.schedule_templates import (
+    departure_window,
+    expand_template,
+    find_overlapping_departure,
+    mask_to_weekdays,
+    runs_on,
+    templates_overlap,
+    weekdays_to_mask
+)
+
+
+def build_template(**kwargs) -> ScheduleTemplate:
+    values = dict(
+        bus_id=1,
+        route_id=1,
+        departure_time=time(22, 30),
+        duration_minutes=120,
+        recurrence=RecurrenceEnum.DAILY,
+        weekdays=0,
+        valid_from=date(2026, 12, 1),
+        valid_until=None,
+        excluded_dates=[]
+    )
+    values.update(kwargs)
+    return ScheduleTemplate(**values)
+
+
+class TestScheduleTemplates:
+    def test_weekday_mask_round_trips(self):
+        assert weekdays_to_mask([0, 2, 6]) == 0b1000101
+        assert mask_to_weekdays(0b1000101) == [0, 2, 6]
+
+    def test_daily_template_respects_validity_and_exclusions(self):
+        template = build_template(valid_until=date(2026, 12, 5), excluded_dates=["2026-12-03"])
+
+        assert list(expand_template(template, date(2026, 11, 28), date(2026, 12, 31))) == [
+            date(2026, 12, 1), date(2026, 12, 2), date(2026, 12, 4), date(2026, 12, 5)
+        ]
+        assert not runs_on(template, date(2026, 12, 3))
+
+    def test_weekly_template_only_runs_on_its_weekdays(self):
+        # 2026-12-07 is a Monday
+        template = build_template(recurrence=RecurrenceEnum.WEEKLY, weekdays=weekdays_to_mask([0, 3]))
+
+        assert list(expand_template(template, date(2026, 12, 7), date(2026, 12, 14))) == [
+            date(2026, 12, 7), date(2026, 12, 10), date(2026, 12, 14)
+        ]
+
+    def test_departure_window_crosses_midnight(self):
+        template = build_template()
+
+        assert departure_window(template, date(2026, 12, 1)) == (
+            datetime(2026, 12, 1, 22, 30), datetime(2026, 12, 2, 0, 30)
+        )
+
+
+class TestTemplateOverlaps:
+    def test_departures_clashing_across_midnight_overlap(self):
+        late = build_template()
+
+        assert templates_overlap(late, build_template(departure_time=time(0, 15)))
+        assert not templates_overlap(late, build_template(departure_time=time(0, 30)))
+        assert not templates_overlap(late, build_template(departure_time=time(8, 0)))
+
+    def test_weekly_templates_only_overlap_on_shared_days(self):
+        monday = build_template(recurrence=RecurrenceEnum.WEEKLY, weekdays=weekdays_to_mask([0]))
+
+        assert templates_overlap(monday, build_template(recurrence=RecurrenceEnum.WEEKLY, weekdays=weekdays_to_mask([0, 4])))
+        assert not templates_overlap(monday, build_template(recurrence=RecurrenceEnum.WEEKLY, weekdays=weekdays_to_mask([2])))
+
+    def test_validity_and_exclusions_can_keep_templates_apart(self):
+        december = build_template(valid_until=date(2026, 12, 10))
+
+        assert not templates_overlap(december, build_template(valid_from=date(2026, 12, 11)))
+        assert not templates_overlap(december, build_template(
+            valid_from=date(2026, 12, 10), excluded_dates=["2026-12-10"], valid_until=date(2026, 12, 10)
+        ))
+        assert templates_overlap(december, build_template(valid_from=date(2026, 12, 10)))
+
+    def test_trips_longer_than_a_day_overlap_their_next_departure(self):
+        overnight = build_template(duration_minutes=1441)
+        day_long = build_template(duration_minutes=1440)
+
+        assert templates_overlap(overnight, overnight)
+        assert not templates_overlap(day_long, day_long)
+
+    def test_finds_the_departure_a_stored_trip_clashes_with(self):
+        template = build_template(excluded_dates=["2026-12-02"])
+
+        assert find_overlapping_departure(template, datetime(2026, 12, 2, 0, 0), datetime(2026, 12, 2, 1, 0)) == date(2026, 12, 1)
+        assert find_overlapping_departure(template, datetime(2026, 12, 2, 23, 0), datetime(2026, 12, 3, 1, 0)) is None
+        assert find_overlapping_departure(template, datetime(2026, 12, 3, 0, 30), datetime(2026, 12, 3, 22, 30)) is None
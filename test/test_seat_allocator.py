@@ -0,0 +1,54 @@
+from app.utils.seat_allocator import (
+    SeatLayout,
+    allocate_seats,
+    free_seats_mask
+)
+from app.utils.seat_bitmap import SeatBitmap
+
+
+def free_except(layout: SeatLayout, *taken: int) -> int:
+    free = layout.all_seats
+    for seat_number in taken:
+        free &= ~(1 << (seat_number - 1))
+    return free
+
+
+class TestSeatAllocator:
+    def test_layout_follows_bus_type(self):
+        assert SeatLayout.for_bus("AC", 40).columns == 3
+        assert SeatLayout.for_bus("NON_AC", 40).columns == 4
+        assert SeatLayout.for_bus("AC", 40).rows == 14
+
+    def test_pair_prefers_one_side_of_the_aisle(self):
+        layout = SeatLayout.for_bus("NON_AC", 12)
+
+        # Seats 1 and 3 are taken, which leaves no pair free on either side of row one
+        assert allocate_seats(layout, free_except(layout, 1, 3), 2) == [5, 6]
+
+    def test_party_spills_over_the_aisle_before_splitting(self):
+        layout = SeatLayout.for_bus("NON_AC", 12)
+
+        assert allocate_seats(layout, free_except(layout, 1, 5, 9), 3) == [2, 3, 4]
+
+    def test_large_party_fills_consecutive_rows(self):
+        layout = SeatLayout.for_bus("AC", 12)
+
+        assert allocate_seats(layout, free_except(layout, 1, 2), 5) == [4, 5, 6, 7, 8]
+
+    def test_scattered_seats_when_nothing_is_adjacent(self):
+        layout = SeatLayout.for_bus("AC", 6)
+
+        assert allocate_seats(layout, free_except(layout, 2, 4, 6), 2) == [1, 3]
+
+    def test_not_enough_free_seats(self):
+        layout = SeatLayout.for_bus("AC", 6)
+
+        assert allocate_seats(layout, free_except(layout, 1, 2, 3, 4), 3) is None
+
+    def test_free_seats_of_a_bitmap(self):
+        bitmap = SeatBitmap(10)
+        bitmap.book(2)
+        bitmap.book(10)
+
+        # Seats past the bus's own seat count are never free
+        assert free_seats_mask(bitmap, 9) == 0b111111101
@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql
+
+from app.entities.seat_hold import SeatHold
+from app.models.ticket_models import SeatHoldRequest
+from app.services.seat_hold_service import release_holds
+from app.utils.background_scheduler import BackgroundScheduler
+from app.utils.constants import (
+    MAX_SEATS_PER_HOLD,
+    SEAT_HOLD_TTL_MINUTES
+)
+
+
+class TestSeatHolds:
+    def test_hold_defaults_to_the_standard_ttl(self):
+        request = SeatHoldRequest(schedule_id=1, seat_numbers=[3, 4])
+
+        assert request.hold_minutes == SEAT_HOLD_TTL_MINUTES
+
+    @pytest.mark.parametrize("seat_numbers", [[], [5, 5], list(range(1, MAX_SEATS_PER_HOLD + 2))])
+    def test_invalid_seat_numbers_are_rejected(self, seat_numbers):
+        with pytest.raises(ValidationError):
+            SeatHoldRequest(schedule_id=1, seat_numbers=seat_numbers)
+
+    def test_release_is_one_statement(self):
+        sql = str(release_holds(SeatHold.expires_at <= func.now()).compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("WITH released_holds AS \n(DELETE FROM seat_holds")
+        assert sql.count("UPDATE seat_inventories") == 1
+
+    def test_scheduler_survives_a_failing_job(self):
+        calls = []
+
+        def job():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("first run fails")
+
+        scheduler = BackgroundScheduler()
+        scheduler.every(60, job)
+        scheduler.scheduler.run_all()
+        scheduler.scheduler.run_all()
+
+        assert len(calls) == 2
+
+    def test_scheduler_thread_stops(self):
+        scheduler = BackgroundScheduler(tick_seconds=0.01)
+        scheduler.start()
+        scheduler.stop()
+
+        assert not any(thread.name == "background-scheduler" for thread in threading.enumerate())
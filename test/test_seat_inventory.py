@@ -0,0 +1,272 @@
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+import sqlalchemy as sa
+from fastapi import HTTPException
+
+from app.connectors.database_connector import (
+    async_engine,
+    get_master_database,
+    tenant_router
+)
+from app.entities.bus import Bus
+from app.entities.company import Company
+from app.entities.schedule import Schedule
+from app.entities.seat_inventory import SeatInventory
+from app.entities.ticket import Ticket
+from app.models.ticket_models import (
+    BatchTicketRequest,
+    PassengerRequest,
+    TicketRequest
+)
+from app.services.seat_inventory_service import SeatInventoryService
+from app.services.ticket_number_service import TicketNumberService
+from app.services.ticket_service import TicketService
+from app.utils.enums import TicketStatusEnum
+from app.utils.seat_bitmap import (
+    SeatBitmap,
+    segment_mask
+)
+
+
+class TestSeatBitmap:
+    def test_book_and_release(self):
+        bitmap = SeatBitmap(10)
+        assert len(bitmap.data) == 2
+
+        bitmap.book(1)
+        bitmap.book(9)
+        assert bitmap.booked_seats() == [1, 9]
+        assert bitmap.data == bytearray([0b00000001, 0b00000001])
+
+        bitmap.release(1)
+        assert bitmap.booked_seats() == [9]
+        assert 1 in bitmap.available_seats()
+
+    def test_pads_short_maps_after_resize(self):
+        bitmap = SeatBitmap(20, b"\x01")
+        assert len(bitmap.data) == 3
+        assert bitmap.booked_seats() == [1]
+        assert not bitmap.is_valid_seat(21)
+
+
+class TestSegmentMask:
+    def test_covers_legs_between_stops(self):
+        assert segment_mask(1, 2) == 0b1
+        assert segment_mask(2, 5) == 0b1110
+        assert segment_mask(1, 6) == 0b11111
+
+    def test_rejects_empty_or_reversed_journeys(self):
+        for boarding_seq, alighting_seq in [(3, 3), (4, 2), (0, 2), (1, 66)]:
+            with pytest.raises(ValueError):
+                segment_mask(boarding_seq, alighting_seq)
+
+    def test_non_overlapping_journeys_share_a_seat(self):
+        masks = [segment_mask(1, 3), segment_mask(3, 6) | segment_mask(1, 3), 0]
+
+        assert SeatBitmap.from_segment_masks(3, masks, segment_mask(3, 4)).booked_seats() == [2]
+        assert SeatBitmap.from_segment_masks(3, masks, segment_mask(2, 4)).booked_seats() == [1, 2]
+
+    def test_seats_past_a_shrunk_bus_are_left_out(self):
+        masks = [0, 0, segment_mask(1, 2), 0, segment_mask(1, 2)]
+        bitmap = SeatBitmap.from_segment_masks(4, masks, segment_mask(1, 3))
+
+        assert bitmap.total_seats == 4
+        assert bitmap.booked_seats() == [3]
+        assert bitmap.available_seats() == [1, 2, 4]
+
+
+def get_tenant_schema() -> str:
+    try:
+        db = get_master_database()
+        schema = db.execute(sa.text("SELECT schema FROM branches ORDER BY id LIMIT 1")).scalar()
+        db.close()
+    except Exception:
+        pytest.skip("Postgres is not reachable")
+
+    if not schema:
+        pytest.skip("No tenant branch is provisioned")
+    return schema
+
+
+class TestSeatInventoryConcurrency:
+    seats = 40
+    attempts_per_seat = 10
+    parallelism = 100
+
+    def setup_method(self):
+        self.schema = get_tenant_schema()
+        db = tenant_router.session(self.schema)
+        suffix = datetime.now().strftime("%H%M%S%f")
+
+        company = Company(
+            name=f"Stress {suffix}",
+            contact_person_name="stress",
+            email=f"stress{suffix}@unittest.com",
+            address="stress",
+            phone_number="0000000000"
+        )
+        db.add(company)
+        db.flush()
+
+        bus = Bus(bus_number=suffix[-10:], bus_type="AC", total_seats=self.seats, company_id=company.id)
+        db.add(bus)
+        db.flush()
+
+        departure = datetime.now() + timedelta(days=30)
+        schedule = Schedule(bus_id=bus.id, route_id=1, departure_time=departure, arrival_time=departure + timedelta(hours=4))
+        db.add(schedule)
+        db.flush()
+
+        db.add(SeatInventory(
+            schedule_id=schedule.id,
+            total_seats=self.seats,
+            segment_masks=[0] * self.seats,
+            booked_count=0
+        ))
+        db.commit()
+
+        self.company_id, self.bus_id, self.schedule_id = company.id, bus.id, schedule.id
+        db.close()
+
+    def teardown_method(self):
+        db = tenant_router.session(self.schema)
+        db.execute(sa.delete(Ticket).where(Ticket.schedule_id == self.schedule_id))
+        db.execute(sa.delete(Schedule).where(Schedule.id == self.schedule_id))
+        db.execute(sa.delete(Bus).where(Bus.id == self.bus_id))
+        db.execute(sa.delete(Company).where(Company.id == self.company_id))
+        db.commit()
+        db.close()
+
+    async def book(self, semaphore: asyncio.Semaphore, seat_number: int) -> str:
+        async with semaphore:
+            db = tenant_router.async_session(self.schema)
+            service = TicketService(
+                db=db,
+                seat_inventory_service=SeatInventoryService(db=db),
+                ticket_number_service=TicketNumberService(db=db)
+            )
+
+            try:
+                await service.create_ticket(TicketRequest(
+                    schedule_id=self.schedule_id,
+                    seat_number=seat_number,
+                    passenger_name="stress",
+                    passenger_contact="0000000000",
+                    passenger_email="stress@unittest.com"
+                ))
+                return "booked"
+            except HTTPException as e:
+                return e.detail
+            except Exception:
+                return "error"
+            finally:
+                await db.rollback()
+                await db.close()
+
+    async def book_group(self, semaphore: asyncio.Semaphore, seat_numbers: list[int]) -> str:
+        async with semaphore:
+            db = tenant_router.async_session(self.schema)
+            service = TicketService(
+                db=db,
+                seat_inventory_service=SeatInventoryService(db=db),
+                ticket_number_service=TicketNumberService(db=db)
+            )
+
+            try:
+                await service.create_tickets(BatchTicketRequest(
+                    schedule_id=self.schedule_id,
+                    passengers=[
+                        PassengerRequest(
+                            seat_number=seat_number,
+                            passenger_name="stress",
+                            passenger_contact="0000000000",
+                            passenger_email="stress@unittest.com"
+                        )
+                        for seat_number in seat_numbers
+                    ]
+                ))
+                return "booked"
+            except HTTPException as e:
+                return e.detail
+            except Exception:
+                return "error"
+            finally:
+                await db.rollback()
+                await db.close()
+
+    async def run_bookings(self) -> Counter:
+        semaphore = asyncio.Semaphore(self.parallelism)
+        seats = [seat for seat in range(1, self.seats + 1) for _ in range(self.attempts_per_seat)]
+
+        try:
+            return Counter(await asyncio.gather(*[self.book(semaphore, seat) for seat in seats]))
+        finally:
+            await async_engine.dispose()
+
+    async def run_group_bookings(self, group_size: int) -> Counter:
+        semaphore = asyncio.Semaphore(self.parallelism)
+        groups = [
+            list(range(first, first + group_size))
+            for first in range(1, self.seats - group_size + 2)
+            for _ in range(self.attempts_per_seat)
+        ]
+
+        try:
+            return Counter(await asyncio.gather(*[self.book_group(semaphore, group) for group in groups]))
+        finally:
+            await async_engine.dispose()
+
+    def get_booked_seats(self) -> tuple[list[int], SeatInventory]:
+        db = tenant_router.session(self.schema)
+        booked = db.execute(
+            sa.select(Ticket.seat_number)
+            .where(Ticket.schedule_id == self.schedule_id, Ticket.status == TicketStatusEnum.BOOKED)
+        ).scalars().all()
+        inventory = db.get(SeatInventory, self.schedule_id)
+        db.close()
+
+        return booked, inventory
+
+    def test_no_double_bookings_under_parallel_load(self):
+        outcomes = asyncio.run(self.run_bookings())
+        booked, inventory = self.get_booked_seats()
+
+        per_seat = Counter(booked)
+        assert all(count == 1 for count in per_seat.values()), per_seat
+        assert outcomes["booked"] == len(booked) == self.seats
+        assert outcomes["error"] == 0
+        assert [seat for seat, mask in enumerate(inventory.segment_masks, start=1) if mask] == sorted(per_seat)
+        assert inventory.booked_count == len(booked)
+
+    def test_group_bookings_are_all_or_nothing(self):
+        group_size = 3
+        outcomes = asyncio.run(self.run_group_bookings(group_size))
+        booked, inventory = self.get_booked_seats()
+
+        per_seat = Counter(booked)
+        assert all(count == 1 for count in per_seat.values()), per_seat
+        assert outcomes["booked"] * group_size == len(booked)
+        assert outcomes["error"] == 0
+        assert [seat for seat, mask in enumerate(inventory.segment_masks, start=1) if mask] == sorted(per_seat)
+        assert inventory.booked_count == len(booked)
+
+    async def shrink_and_get_availability(self, total_seats: int):
+        db = tenant_router.async_session(self.schema)
+        service = SeatInventoryService(db=db)
+
+        try:
+            await service.resize_inventories(total_seats, schedule_id=self.schedule_id)
+            await db.commit()
+            return await service.get_seat_availability(self.schedule_id, 1, 2)
+        finally:
+            await db.close()
+            await async_engine.dispose()
+
+    def test_availability_follows_a_shrunk_bus(self):
+        availability = asyncio.run(self.shrink_and_get_availability(30))
+
+        assert availability.total_seats == 30
+        assert availability.available_seats == list(range(1, 31))
@@ -0,0 +1,42 @@
+from app.utils.stop_index import (
+    StopIndex,
+    StopIndexCache
+)
+
+
+ROUTES = [
+    (1, ["Hyderabad", "Shadnagar", "Mahbubnagar", "Kurnool"]),
+    (2, ["Kurnool", "Mahbubnagar", "Shadnagar", "Hyderabad"]),
+    (3, ["Tirupati", "Rajampet", "Kadapa", "Rayachoti"]),
+]
+ROUTE_STOPS = [
+    (route_id, seq, city)
+    for route_id, stops in ROUTES
+    for seq, city in enumerate(stops, start=1)
+]
+
+
+class TestStopIndex:
+    def test_matches_intermediate_stops_in_order(self):
+        index = StopIndex(ROUTE_STOPS)
+
+        assert index.find_routes("Shadnagar", "Kurnool") == {1: (2, 4)}
+        assert index.find_routes("mahbubnagar ", "SHADNAGAR") == {2: (2, 3)}
+        assert index.find_routes("Rajampet", "Kadapa") == {3: (2, 3)}
+
+    def test_ignores_reverse_direction_and_unknown_stops(self):
+        index = StopIndex(ROUTE_STOPS)
+
+        assert index.find_routes("Kadapa", "Tirupati") == {}
+        assert index.find_routes("Chennai", "Kurnool") == {}
+
+
+class TestStopIndexCache:
+    def test_invalidate_drops_tenant_index(self):
+        cache = StopIndexCache()
+        cache.put("kdp", StopIndex(ROUTE_STOPS))
+        cache.put("hyd", StopIndex([]))
+        cache.invalidate("kdp")
+
+        assert cache.get("kdp") is None
+        assert cache.get("hyd") is not None
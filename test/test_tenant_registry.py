@@ -0,0 +1,41 @@
+import time
+
+from app.connectors.tenant_registry import TenantRegistry
+
+
+class TestTenantRegistry:
+    def test_counts_hits_and_misses(self):
+        registry = TenantRegistry()
+        assert registry.get(1) is None
+
+        registry.put(1, "kdp")
+        assert registry.get(1) == "kdp"
+        assert registry.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    def test_expired_entries_are_dropped(self):
+        registry = TenantRegistry(ttl_seconds=0.01)
+        registry.put(1, "kdp")
+        time.sleep(0.02)
+
+        assert registry.get(1) is None
+        assert registry.stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self):
+        registry = TenantRegistry(max_size=2)
+        registry.warm([(1, "a"), (2, "b")])
+        registry.get(1)
+        registry.put(3, "c")
+
+        assert registry.get(2) is None
+        assert registry.get(1) == "a"
+        assert registry.get(3) == "c"
+
+    def test_invalidate(self):
+        registry = TenantRegistry()
+        registry.warm([(1, "a"), (2, "b")])
+        registry.invalidate(1)
+        assert registry.get(1) is None
+        assert registry.get(2) == "b"
+
+        registry.invalidate()
+        assert registry.stats()["size"] == 0
@@ -0,0 +1,29 @@
+from app.services.ticket_number_service import (
+    cache_company_prefix,
+    company_prefix_cache,
+    invalidate_company_prefix
+)
+from app.utils.constants import COMPANY_PREFIX_CACHE_SIZE
+
+
+class TestCompanyPrefixCache:
+    def teardown_method(self):
+        company_prefix_cache.clear()
+
+    def test_least_recently_used_prefix_is_evicted_when_full(self):
+        for company_id in range(COMPANY_PREFIX_CACHE_SIZE):
+            cache_company_prefix(("tenant", company_id), "ABC")
+
+        cache_company_prefix(("tenant", COMPANY_PREFIX_CACHE_SIZE), "XYZ")
+
+        assert len(company_prefix_cache) == COMPANY_PREFIX_CACHE_SIZE
+        assert ("tenant", 0) not in company_prefix_cache
+        assert company_prefix_cache[("tenant", COMPANY_PREFIX_CACHE_SIZE)] == "XYZ"
+
+    def test_invalidate_drops_a_single_company(self):
+        cache_company_prefix(("tenant", 1), "ABC")
+        cache_company_prefix(("tenant", 2), "XYZ")
+
+        invalidate_company_prefix("tenant", 1)
+
+        assert list(company_prefix_cache) == [("tenant", 2)]
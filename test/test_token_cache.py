@@ -0,0 +1,55 @@
+import dataclasses
+import time
+
+import pytest
+
+from app.models.user_models import CurrentContextUser
+from app.utils.token_cache import (
+    RevokedTokenError,
+    VerifiedTokenCache
+)
+
+
+USER = CurrentContextUser(name="Ravi", email="ravi@x.com", role="Admin", branch_id=1)
+
+
+class TestVerifiedTokenCache:
+    def test_hit_after_put(self):
+        cache = VerifiedTokenCache()
+        assert cache.get("token") is None
+
+        cache.put("token", USER, time.time() + 60)
+
+        assert cache.get("token") is USER
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_expired_tokens_miss(self):
+        cache = VerifiedTokenCache()
+        cache.put("token", USER, time.time() - 1)
+
+        assert cache.get("token") is None
+        assert cache.metrics().size == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("a", USER, time.time() + 60)
+        cache.put("b", USER, time.time() + 60)
+        cache.get("a")
+        cache.put("c", USER, time.time() + 60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is USER
+
+    def test_revoked_token_is_rejected(self):
+        cache = VerifiedTokenCache()
+        cache.put("token", USER, time.time() + 60)
+        cache.revoke("token", time.time() + 60)
+
+        with pytest.raises(RevokedTokenError):
+            cache.get("token")
+        with pytest.raises(RevokedTokenError):
+            cache.put("token", USER, time.time() + 60)
+
+    def test_context_user_is_immutable(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            USER.role = "Super Admin"